@@ -68,6 +68,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
+    CONF_EXECUTION_POOL,
     CONF_MAX,
     CONF_MAX_EXCEEDED,
     Script,
@@ -705,11 +706,13 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             trace_element = TraceElement(variables, trigger_path)
             trace_append_element(trace_element)
 
-            if (
-                not skip_condition
-                and self._cond_func is not None
-                and not self._cond_func(variables)
-            ):
+            if not skip_condition and self._cond_func is not None:
+                # Automations triggered by the same event share condition results
+                with condition.async_condition_cache(self.hass, context):
+                    conditions_met = self._cond_func(variables)
+            else:
+                conditions_met = True
+            if not conditions_met:
                 self._logger.debug(
                     "Conditions not met, aborting automation. Condition summary: %s",
                     trace_get(clear=False),
@@ -777,6 +780,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self._async_disable()
+        self.action_script.async_release()
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
@@ -963,6 +967,7 @@ async def _create_automation_entities(
             script_mode=config_block[CONF_MODE],
             max_runs=config_block[CONF_MAX],
             max_exceeded=config_block[CONF_MAX_EXCEEDED],
+            execution_pool=config_block.get(CONF_EXECUTION_POOL),
             logger=LOGGER,
             # We don't pass variables here
             # Automation will already render them to use them in the condition
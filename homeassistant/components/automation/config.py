@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from contextlib import suppress
 from enum import StrEnum
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -25,6 +26,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, script
 from homeassistant.helpers.condition import async_validate_conditions_config
+from homeassistant.helpers.config_item_cache import async_get_config_item_cache
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.yaml.input import UndefinedSubstitution
@@ -322,6 +324,18 @@ class AutomationConfig(dict):
     validation_error: str | None = None
 
 
+def _is_reusable(automation_config: AutomationConfig) -> bool:
+    """Return if a validated automation can be reused while its config is unchanged.
+
+    Automations using a blueprint also depend on the blueprint, and the
+    validation of failed automations is repeated to log the errors again.
+    """
+    return (
+        automation_config.validation_status == ValidationStatus.OK
+        and automation_config.raw_blueprint_inputs is None
+    )
+
+
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     config: dict[str, Any],
@@ -344,17 +358,24 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
     """Validate config."""
+    cache = async_get_config_item_cache(hass, DOMAIN, _is_reusable)
     # No gather here since _try_async_validate_config_item is unlikely to suspend
     # and the cost of creating many tasks is not worth the benefit.
-    automations = list(
-        filter(
-            lambda x: x is not None,
-            [
-                await _try_async_validate_config_item(hass, p_config)
-                for _, p_config in config_per_platform(config, DOMAIN)
-            ],
+    try:
+        automations = list(
+            filter(
+                lambda x: x is not None,
+                [
+                    await cache.async_validate(
+                        p_config,
+                        partial(_try_async_validate_config_item, hass, p_config),
+                    )
+                    for _, p_config in config_per_platform(config, DOMAIN)
+                ],
+            )
         )
-    )
+    finally:
+        cache.async_finish()
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
@@ -12,6 +12,7 @@ from homeassistant.components.trace import (
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_disabled
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -61,7 +62,8 @@ def trace_automation(
     async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
-        yield trace
+        with trace_disabled(not trace_config[CONF_STORED_TRACES]):
+            yield trace
     except Exception as ex:
         if automation_id:
             trace.set_error(ex)
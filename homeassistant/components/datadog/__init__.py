@@ -10,12 +10,11 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_PREFIX,
     EVENT_LOGBOOK_ENTRY,
-    EVENT_STATE_CHANGED,
     STATE_UNKNOWN,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.state_exporter import StateRecord, register_state_exporter
 from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -71,9 +70,14 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
         _LOGGER.debug("Sent event %s", event.data.get("entity_id"))
 
-    def state_changed_listener(event):
-        """Listen for new messages on the bus and sends them to Datadog."""
-        state = event.data.get("new_state")
+    def state_exporter(records: list[StateRecord]) -> None:
+        """Send a batch of state changes to Datadog."""
+        for record in records:
+            send_state(record)
+
+    def send_state(record: StateRecord) -> None:
+        """Send a state change to Datadog."""
+        state = record.new_state
 
         if state is None or state.state == STATE_UNKNOWN:
             return
@@ -90,9 +94,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
                 _LOGGER.debug("Sent metric %s: %s (tags: %s)", attribute, value, tags)
 
-        try:
-            value = state_helper.state_as_number(state)
-        except ValueError:
+        if (value := record.number) is None:
             _LOGGER.debug("Error sending %s: %s (tags: %s)", metric, state.state, tags)
             return
 
@@ -101,6 +103,6 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.debug("Sent metric %s: %s (tags: %s)", metric, value, tags)
 
     hass.bus.listen(EVENT_LOGBOOK_ENTRY, logbook_entry_listener)
-    hass.bus.listen(EVENT_STATE_CHANGED, state_changed_listener)
+    register_state_exporter(hass, DOMAIN, state_exporter)
 
     return True
@@ -74,10 +74,6 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Diagnostics from a config entry."""
     hass.data[DOMAIN] = DiagnosticsData()
 
-    await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_diagnostics_platform
-    )
-
     websocket_api.async_register_command(hass, handle_info)
     websocket_api.async_register_command(hass, handle_get)
     hass.http.register_view(DownloadDiagnosticsView)
@@ -99,6 +95,14 @@ class DiagnosticsProtocol(Protocol):
         """Return diagnostics for a device."""
 
 
+async def _async_get_diagnostics_data(hass: HomeAssistant) -> DiagnosticsData:
+    """Return the diagnostics data, importing diagnostics platforms on first use."""
+    await integration_platform.async_process_integration_platforms_on_demand(
+        hass, DOMAIN, _register_diagnostics_platform
+    )
+    return hass.data[DOMAIN]
+
+
 @callback
 def _register_diagnostics_platform(
     hass: HomeAssistant, integration_domain: str, platform: DiagnosticsProtocol
@@ -113,12 +117,12 @@ def _register_diagnostics_platform(
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    diagnostics_data = await _async_get_diagnostics_data(hass)
     result = [
         {
             "domain": domain,
@@ -139,13 +143,13 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
-    diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+    diagnostics_data = await _async_get_diagnostics_data(hass)
 
     if (info := diagnostics_data.platforms.get(domain)) is None:
         connection.send_error(
@@ -267,7 +271,7 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
+        diagnostics_data = await _async_get_diagnostics_data(hass)
         if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
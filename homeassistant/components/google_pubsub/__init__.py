@@ -51,7 +51,7 @@ def setup(hass: HomeAssistant, yaml_config: ConfigType) -> bool:
         _LOGGER.error("Path to credentials file cannot be found")
         return False
 
-    entities_filter = config[CONF_FILTER]
+    entities_filter = config[CONF_FILTER].get_filter()
 
     publisher = PublisherClient.from_service_account_json(service_principal_path)
 
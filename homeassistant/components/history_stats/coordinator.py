@@ -73,6 +73,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._at_start_listener:
             self._at_start_listener()
             self._at_start_listener = None
+        self._history_stats.async_release()
 
     @callback
     def _async_add_listener(self) -> None:
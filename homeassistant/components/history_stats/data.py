@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from .const import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_ENTITY_HISTORIES: HassKey[dict[str, EntityHistory]] = HassKey(DOMAIN)
+
+_last_changed = attrgetter("last_changed")
+
 
 @dataclass
 class HistoryStatsState:
@@ -32,6 +49,123 @@ class HistoryState:
     last_changed: float
 
 
+class EntityHistory:
+    """The state changes of an entity, shared by its history stats.
+
+    The state changes are fetched from the database once, from the earliest
+    start of the periods of the history stats, and then followed by listening
+    to state changes. State changes are dropped once all periods moved past
+    them.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Init the entity history."""
+        self.hass = hass
+        self.entity_id = entity_id
+        # Timestamp from which the state changes are complete
+        self.start: float | None = None
+        self.states: list[HistoryState] = []
+        self._period_starts: dict[HistoryStats, float] = {}
+        self._load_lock = asyncio.Lock()
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_user(self, history_stats: HistoryStats) -> None:
+        """Follow the state changes for a history stats."""
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = async_track_state_change_event(
+                self.hass, [self.entity_id], self.async_add_state_change
+            )
+        self._period_starts.setdefault(history_stats, float("inf"))
+
+    @callback
+    def async_remove_user(self, history_stats: HistoryStats) -> None:
+        """Stop following the state changes for a history stats."""
+        self._period_starts.pop(history_stats, None)
+        if self._period_starts or self._unsub_state_changed is None:
+            return
+        self._unsub_state_changed()
+        self._unsub_state_changed = None
+        self.hass.data[DATA_ENTITY_HISTORIES].pop(self.entity_id, None)
+
+    @callback
+    def async_add_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change, unless it was added already."""
+        if (new_state := event.data["new_state"]) is None:
+            return
+        history_state = HistoryState(new_state.state, new_state.last_changed_timestamp)
+        if not self.states or self.states[-1] != history_state:
+            self.states.append(history_state)
+
+    async def async_get_states(
+        self,
+        history_stats: HistoryStats,
+        start_timestamp: float,
+        end_timestamp: float,
+        now_timestamp: float,
+    ) -> list[HistoryState]:
+        """Return the state changes of a period, starting with the state at its start."""
+        if self.start is None or start_timestamp < self.start:
+            async with self._load_lock:
+                if self.start is None or start_timestamp < self.start:
+                    await self._async_load(start_timestamp)
+
+        self._period_starts[history_stats] = start_timestamp
+        if (earliest_start := min(self._period_starts.values())) > self.start:
+            self._async_drop_before(earliest_start)
+
+        states = self.states
+        first = max(bisect_right(states, start_timestamp, key=_last_changed) - 1, 0)
+        if end_timestamp < now_timestamp:
+            return states[
+                first : bisect_right(states, end_timestamp, key=_last_changed)
+            ]
+        return states[first:]
+
+    async def _async_load(self, start_timestamp: float) -> None:
+        """Fetch the state changes since a timestamp from the database."""
+        instance = get_instance(self.hass)
+        states = await instance.async_add_executor_job(
+            self._state_changes_since, start_timestamp
+        )
+        loaded = [
+            HistoryState(state.state, state.last_changed.timestamp())
+            for state in states
+        ]
+        # Keep the state changes which happened while fetching and may not
+        # have been committed to the database yet
+        if loaded:
+            last_loaded = loaded[-1].last_changed
+            loaded.extend(
+                state for state in self.states if state.last_changed > last_loaded
+            )
+        else:
+            loaded = self.states
+        self.states = loaded
+        self.start = start_timestamp
+
+    def _state_changes_since(self, start_ts: float) -> list[State]:
+        """Return state changes since a timestamp."""
+        start = dt_util.utc_from_timestamp(start_ts)
+        return history.state_changes_during_period(
+            self.hass,
+            start,
+            None,
+            self.entity_id,
+            include_start_time_state=True,
+            no_attributes=True,
+        ).get(self.entity_id, [])
+
+    @callback
+    def _async_drop_before(self, start_timestamp: float) -> None:
+        """Drop the state changes before the state at a timestamp."""
+        if (
+            first := bisect_right(self.states, start_timestamp, key=_last_changed) - 1
+        ) > 0:
+            del self.states[:first]
+        self.start = start_timestamp
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -50,6 +184,7 @@ class HistoryStats:
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
         self._history_current_period: list[HistoryState] = []
+        self._entity_history: EntityHistory | None = None
         self._previous_run_before_start = False
         self._entity_states = set(entity_states)
         self._duration = duration
@@ -88,7 +223,7 @@ class HistoryStats:
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
         #
-        # We avoid querying the database if the below did NOT happen:
+        # We avoid computing the stats if the below did NOT happen:
         #
         # - The previous run happened before the start time
         # - The start time changed
@@ -108,26 +243,25 @@ class HistoryStats:
         ):
             new_data = False
             if event and (new_state := event.data["new_state"]) is not None:
+                if self._entity_history is not None:
+                    self._entity_history.async_add_state_change(event)
                 if (
                     current_period_start_timestamp
                     <= floored_timestamp(new_state.last_changed)
                     <= current_period_end_timestamp
                 ):
-                    self._history_current_period.append(
-                        HistoryState(
-                            new_state.state, new_state.last_changed.timestamp()
-                        )
-                    )
                     new_data = True
             if not new_data and current_period_end_timestamp < now_timestamp:
                 # If period has not changed and current time after the period end...
                 # Don't compute anything as the value cannot have changed
                 return self._state
-        else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
-            )
-            self._previous_run_before_start = False
+        self._previous_run_before_start = False
+
+        self._history_current_period = await self._async_entity_history(
+            current_period_start_timestamp,
+            current_period_end_timestamp,
+            now_timestamp,
+        )
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
             now_timestamp,
@@ -137,37 +271,34 @@ class HistoryStats:
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
-    async def _async_history_from_db(
+    async def _async_entity_history(
         self,
         current_period_start_timestamp: float,
         current_period_end_timestamp: float,
-    ) -> None:
-        """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
+        now_timestamp: float,
+    ) -> list[HistoryState]:
+        """Return the history of the entity for the current period."""
+        if self._entity_history is None:
+            histories = self.hass.data.setdefault(DATA_ENTITY_HISTORIES, {})
+            if (entity_history := histories.get(self.entity_id)) is None:
+                entity_history = histories[self.entity_id] = EntityHistory(
+                    self.hass, self.entity_id
+                )
+            entity_history.async_add_user(self)
+            self._entity_history = entity_history
+        return await self._entity_history.async_get_states(
+            self,
             current_period_start_timestamp,
             current_period_end_timestamp,
+            now_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
 
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
+    @callback
+    def async_release(self) -> None:
+        """Stop following the history of the entity."""
+        if self._entity_history is not None:
+            self._entity_history.async_remove_user(self)
+            self._entity_history = None
 
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
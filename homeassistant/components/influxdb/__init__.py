@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 import logging
 import math
 import queue
@@ -14,7 +16,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -35,18 +37,18 @@ from homeassistant.const import (
     CONF_USERNAME,
     CONF_VERIFY_SSL,
     EVENT_HOMEASSISTANT_STOP,
-    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Event, HomeAssistant, State, callback
-from homeassistant.helpers import event as event_helper, state as state_helper
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import event as event_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.state_exporter import StateRecord, register_state_exporter
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -59,13 +61,17 @@ from .const import (
     CODE_INVALID_INPUTS,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
     CONF_API_VERSION,
+    CONF_BATCH_SIZE,
     CONF_BUCKET,
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_FLUSH_INTERVAL,
+    CONF_GZIP,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_MAX_CONCURRENT_WRITES,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -77,16 +83,12 @@ from .const import (
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
+    DEFAULT_MAX_CONCURRENT_WRITES,
     DEFAULT_MEASUREMENT_ATTR,
     DEFAULT_SSL_V2,
     DOMAIN,
-    EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
@@ -96,15 +98,30 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_MAX_SIZE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import LineSpool
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_UNIT = {"us": 1, "ms": 1000, "s": 1000000}
+
+# Escaping of the line protocol, newlines are escaped too so a point
+# never spans more than one line
+_MEASUREMENT_ESCAPE = str.maketrans({",": r"\,", " ": r"\ ", "\\": r"\\", "\n": r"\n"})
+_KEY_ESCAPE = str.maketrans(
+    {",": r"\,", "=": r"\=", " ": r"\ ", "\\": r"\\", "\n": r"\n"}
+)
+_STRING_ESCAPE = str.maketrans({'"': r"\"", "\\": r"\\", "\n": r"\n"})
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -165,6 +182,14 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_BATCH_SIZE, default=BATCH_BUFFER_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_FLUSH_INTERVAL, default=BATCH_TIMEOUT): cv.positive_float,
+        vol.Optional(
+            CONF_MAX_CONCURRENT_WRITES, default=DEFAULT_MAX_CONCURRENT_WRITES
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+        vol.Optional(CONF_GZIP, default=True): cv.boolean,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -201,9 +226,15 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
-    entity_filter = convert_include_exclude_filter(conf)
+def _format_field(value: float | str) -> str:
+    """Format a field value for the line protocol."""
+    if type(value) is str:
+        return f'"{value.translate(_STRING_ESCAPE)}"'
+    return repr(value)
+
+
+def _generate_record_to_line(conf: dict) -> Callable[[StateRecord], str | None]:
+    """Build state record to line protocol converter and add to config."""
     tags = conf.get(CONF_TAGS)
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
@@ -215,28 +246,18 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    precision = conf.get(CONF_PRECISION)
+    microseconds_per_unit = _MICROSECONDS_PER_UNIT.get(precision)
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
-        state: State | None = event.data.get(EVENT_NEW_STATE)
-        if (
-            state is None
-            or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE, None)
-            or not entity_filter(state.entity_id)
-        ):
+    def record_to_line(record: StateRecord) -> str | None:
+        """Convert state record into a line of the line protocol Influx expects."""
+        state = record.new_state
+        if state is None or state.state in (STATE_UNKNOWN, "", STATE_UNAVAILABLE, None):
             return None
 
-        try:
-            _include_state = _include_value = False
-
-            _state_as_value = float(state.state)
-            _include_value = True
-        except ValueError:
-            try:
-                _state_as_value = float(state_helper.state_as_number(state))
-                _include_state = _include_value = True
-            except ValueError:
-                _include_state = True
+        _state_as_value = record.number
+        _include_value = _state_as_value is not None
+        _include_state = record.value is None
 
         include_uom = True
         include_dc = True
@@ -266,59 +287,75 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        point_tags: dict[str, Any] = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
+        fields: dict[str, Any] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                point_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
-
-        json[INFLUX_CONF_TAGS].update(tags)
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
+
+        point_tags.update(tags)
+
+        # Influx sorts the tags of a point, sending them sorted saves it the work
+        series = ",".join(
+            [
+                str(measurement).translate(_MEASUREMENT_ESCAPE),
+                *(
+                    f"{key.translate(_KEY_ESCAPE)}={tag_value}"
+                    for key, value in sorted(point_tags.items())
+                    if value is not None
+                    and (tag_value := str(value).translate(_KEY_ESCAPE))
+                ),
+            ]
+        )
+        field_set = ",".join(
+            f"{key.translate(_KEY_ESCAPE)}={_format_field(value)}"
+            for key, value in fields.items()
+        )
+        timestamp = (record.time_fired - _EPOCH) // _ONE_MICROSECOND
+        if microseconds_per_unit is None:
+            timestamp *= 1000
+        else:
+            timestamp //= microseconds_per_unit
 
-        return json
+        return f"{series} {field_set} {timestamp}"
 
-    return event_to_json
+    return record_to_line
 
 
 @dataclass
@@ -326,7 +363,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -348,15 +385,17 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are batched and run in parallel by the InfluxThread already
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines of the line protocol to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -367,7 +406,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -391,7 +430,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -429,12 +467,15 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    if conf.get(CONF_GZIP):
+        kwargs[CONF_GZIP] = True
+
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines of the line protocol to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +484,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -491,10 +532,21 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    record_to_line = _generate_record_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        influx,
+        record_to_line,
+        max_tries,
+        conf[CONF_BATCH_SIZE],
+        conf[CONF_FLUSH_INTERVAL],
+        conf[CONF_MAX_CONCURRENT_WRITES],
+        LineSpool(hass.config.path(SPOOL_FILE), SPOOL_MAX_SIZE),
+    )
     instance.start()
+    register_state_exporter(
+        hass, DOMAIN, instance.export_states, convert_include_exclude_filter(conf)
+    )
 
     def shutdown(event):
         """Shut down the thread."""
@@ -507,44 +559,99 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+@dataclass(slots=True, frozen=True)
+class InfluxWriteStats:
+    """Statistics of the writes to InfluxDB."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    events_written: int
+    batches_written: int
+    events_spooled: int
+    events_lost: int
+    mean_write_seconds: float
+    events_per_second: float
+
+
+class InfluxThread(threading.Thread):
+    """A threaded event handler class.
+
+    Events are batched by this thread and written by a pool of writers, so a
+    slow write doesn't hold up the next batches. Batches which can't be
+    written while Influx is down are kept in a spool on disk and written as
+    soon as Influx is back.
+    """
+
+    def __init__(
+        self,
+        influx,
+        record_to_line,
+        max_tries,
+        batch_size=BATCH_BUFFER_SIZE,
+        flush_interval=BATCH_TIMEOUT,
+        max_concurrent_writes=DEFAULT_MAX_CONCURRENT_WRITES,
+        spool=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
-            queue.SimpleQueue()
-        )
+        self.queue: queue.SimpleQueue[
+            threading.Event | tuple[float, StateRecord] | None
+        ] = queue.SimpleQueue()
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.record_to_line = record_to_line
         self.max_tries = max_tries
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_concurrent_writes = max_concurrent_writes
+        self.spool: LineSpool | None = spool
         self.write_errors = 0
         self.shutdown = False
-        hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
+        self._in_flight = threading.BoundedSemaphore(max_concurrent_writes)
+        self._waiters: list[threading.Event] = []
+        self._stats_lock = threading.Lock()
+        self._failing = False
+        self._started = time.monotonic()
+        self._events_written = 0
+        self._batches_written = 0
+        self._events_spooled = 0
+        self._events_lost = 0
+        self._write_seconds = 0.0
+
+    @property
+    def stats(self) -> InfluxWriteStats:
+        """Return statistics about the writes to InfluxDB."""
+        with self._stats_lock:
+            batches = self._batches_written
+            return InfluxWriteStats(
+                events_written=self._events_written,
+                batches_written=batches,
+                events_spooled=self._events_spooled,
+                events_lost=self._events_lost,
+                mean_write_seconds=self._write_seconds / batches if batches else 0.0,
+                events_per_second=self._events_written
+                / max(time.monotonic() - self._started, 1e-9),
+            )
 
     @callback
-    def _event_listener(self, event):
-        """Listen for new messages on the bus and queue them for Influx."""
-        item = (time.monotonic(), event)
-        self.queue.put(item)
+    def export_states(self, records: list[StateRecord]) -> None:
+        """Queue state changes for Influx."""
+        now = time.monotonic()
+        for record in records:
+            self.queue.put((now, record))
 
-    @staticmethod
-    def batch_timeout():
+    def batch_timeout(self):
         """Return number of seconds to wait for more events."""
-        return BATCH_TIMEOUT
+        return self.flush_interval
 
-    def get_events_json(self):
+    def get_events_lines(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines = []
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < self.batch_size and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -552,51 +659,121 @@ class InfluxThread(threading.Thread):
                 if item is None:
                     self.shutdown = True
                 elif type(item) is tuple:
-                    timestamp, event = item
+                    timestamp, record = item
                     age = time.monotonic() - timestamp
 
                     if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
+                        if line := self.record_to_line(record):
+                            lines.append(line)
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
-                    item.set()
+                    # Released once the batch up to here has been written
+                    self._waiters.append(item)
+                    break
 
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        return count, lines
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines):
+        """Write lines to influxdb, with retry.
+
+        Return if the lines were written, lines which still can't be written
+        after the last try are spooled.
+        """
         for retry in range(self.max_tries + 1):
+            start = time.monotonic()
             try:
-                self.influx.write(json)
-
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
-
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
+                self.influx.write(lines)
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                return False
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    continue
+                self._write_failed(lines, err)
+                return False
+            self._write_done(lines, time.monotonic() - start)
+            return True
+        return False
+
+    def _write_done(self, lines, seconds):
+        """Record lines were written."""
+        with self._stats_lock:
+            if self.write_errors:
+                _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                self.write_errors = 0
+            self._failing = False
+            self._events_written += len(lines)
+            self._batches_written += 1
+            self._write_seconds += seconds
+        _LOGGER.debug(WROTE_MESSAGE, len(lines))
+
+    def _write_failed(self, lines, err):
+        """Spool lines which could not be written, or count them as lost."""
+        spooled = self.spool is not None and self.spool.append(lines)
+        with self._stats_lock:
+            if not self._failing:
+                _LOGGER.error(err)
+                self._failing = True
+            if spooled:
+                self._events_spooled += len(lines)
+            else:
+                self._events_lost += len(lines)
+                self.write_errors += len(lines)
+
+    def _write_spooled(self):
+        """Write the lines which were spooled while Influx was down."""
+        if self.spool is None or not (lines := self.spool.take()):
+            return
+        for index in range(0, len(lines), self.batch_size):
+            batch = lines[index : index + self.batch_size]
+            start = time.monotonic()
+            try:
+                self.influx.write(batch)
+            except ValueError as err:
+                _LOGGER.error(err)
+                continue
+            except ConnectionError as err:
+                self._write_failed(lines[index:], err)
+                return
+            self._write_done(batch, time.monotonic() - start)
+
+    def _write_batch(self, lines):
+        """Write a batch from a writer, followed by the spooled lines."""
+        try:
+            if self.write_to_influxdb(lines) and self.spool and self.spool.size:
+                self._write_spooled()
+        finally:
+            self._in_flight.release()
+
+    def _wait_for_writes(self):
+        """Wait for all writes in flight."""
+        for _ in range(self.max_concurrent_writes):
+            self._in_flight.acquire()
+        for _ in range(self.max_concurrent_writes):
+            self._in_flight.release()
 
     def run(self):
         """Process incoming events."""
-        while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrent_writes,
+            thread_name_prefix=f"{DOMAIN}_writer",
+        ) as executor:
+            while not self.shutdown:
+                _, lines = self.get_events_lines()
+                if lines:
+                    # Bound the writes in flight, new events keep queuing up
+                    self._in_flight.acquire()
+                    executor.submit(self._write_batch, lines)
+                if self._waiters:
+                    self._wait_for_writes()
+                    for waiter in self._waiters:
+                        waiter.set()
+                    self._waiters.clear()
 
     def block_till_done(self):
         """Block till all events processed.
@@ -30,6 +30,10 @@ CONF_COMPONENT_CONFIG = "component_config"
 CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
+CONF_BATCH_SIZE = "batch_size"
+CONF_FLUSH_INTERVAL = "flush_interval"
+CONF_MAX_CONCURRENT_WRITES = "max_concurrent_writes"
+CONF_GZIP = "gzip"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
@@ -78,6 +82,9 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+DEFAULT_MAX_CONCURRENT_WRITES = 2
+SPOOL_FILE = ".influxdb_spool"
+SPOOL_MAX_SIZE = 10 * 1024 * 1024  # bytes
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -119,6 +126,7 @@ QUERY_ERROR = (
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
+SPOOL_ERROR_MESSAGE = "Could not keep events to write later: %s."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
@@ -0,0 +1,65 @@
+"""Keep lines which could not be written to InfluxDB on disk."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+
+from .const import SPOOL_ERROR_MESSAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LineSpool:
+    """A bounded file of line protocol lines to write once InfluxDB is back.
+
+    Lines left over when Home Assistant stopped are written after the next
+    start, as soon as a write succeeds again.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        try:
+            self._size = os.path.getsize(path)
+        except OSError:
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes in the spool."""
+        return self._size
+
+    def append(self, lines: list[str]) -> bool:
+        """Add lines to the spool, return False if they don't fit."""
+        data = "".join(f"{line}\n" for line in lines).encode()
+        with self._lock:
+            if self._size + len(data) > self.max_size:
+                return False
+            try:
+                with open(self.path, "ab") as file:
+                    file.write(data)
+            except OSError as err:
+                _LOGGER.error(SPOOL_ERROR_MESSAGE, err)
+                return False
+            self._size += len(data)
+        return True
+
+    def take(self) -> list[str]:
+        """Remove all lines from the spool and return them."""
+        with self._lock:
+            if not self._size:
+                return []
+            try:
+                with open(self.path, "rb") as file:
+                    data = file.read()
+                os.unlink(self.path)
+            except OSError as err:
+                _LOGGER.error(SPOOL_ERROR_MESSAGE, err)
+                return []
+            self._size = 0
+        # Newlines in values are escaped, so a line never spans two lines
+        return data.decode().split("\n")[:-1]
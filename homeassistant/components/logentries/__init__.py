@@ -6,10 +6,10 @@ import logging
 import requests
 import voluptuous as vol
 
-from homeassistant.const import CONF_TOKEN, EVENT_STATE_CHANGED
+from homeassistant.const import CONF_TOKEN
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.state_exporter import StateRecord, register_state_exporter
 from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,29 +29,27 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     token = conf.get(CONF_TOKEN)
     le_wh = f"{DEFAULT_HOST}{token}"
 
-    def logentries_event_listener(event):
-        """Listen for new messages on the bus and sends them to Logentries."""
-        if (state := event.data.get("new_state")) is None:
-            return
-        try:
-            _state = state_helper.state_as_number(state)
-        except ValueError:
-            _state = state.state
+    def logentries_state_exporter(records: list[StateRecord]) -> None:
+        """Send a batch of state changes to Logentries."""
         json_body = [
             {
                 "domain": state.domain,
                 "entity_id": state.object_id,
                 "attributes": dict(state.attributes),
-                "time": str(event.time_fired),
-                "value": _state,
+                "time": str(record.time_fired),
+                "value": state.state if record.number is None else record.number,
             }
+            for record in records
+            if (state := record.new_state) is not None
         ]
+        if not json_body:
+            return
         try:
             payload = {"host": le_wh, "event": json_body}
             requests.post(le_wh, data=json.dumps(payload), timeout=10)
         except requests.exceptions.RequestException:
             _LOGGER.exception("Error sending to Logentries")
 
-    hass.bus.listen(EVENT_STATE_CHANGED, logentries_event_listener)
+    register_state_exporter(hass, DOMAIN, logentries_state_exporter)
 
     return True
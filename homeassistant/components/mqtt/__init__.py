@@ -42,6 +42,7 @@ from . import debug_info, discovery
 from .client import (  # noqa: F401
     MQTT,
     async_publish,
+    async_publish_bulk,
     async_subscribe,
     async_subscribe_internal,
     publish,
@@ -87,6 +88,7 @@ from .models import (  # noqa: F401
     MqttData,
     MqttValueTemplate,
     PayloadSentinel,
+    PublishMessage,
     PublishPayloadType,
     ReceiveMessage,
     convert_outgoing_mqtt_payload,
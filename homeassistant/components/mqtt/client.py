@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
@@ -83,7 +83,12 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
-from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
+from .util import (
+    EnsureJobAfterCooldown,
+    TopicTrie,
+    get_file_path,
+    mqtt_config_entry_enabled,
+)
 
 if TYPE_CHECKING:
     # Only import for paho-mqtt type checking here, imports are done locally
@@ -117,6 +122,12 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Number of topics to remember the matching subscriptions of
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
+MAX_PUBLISH_QUEUE_SIZE = 10000
+MAX_PUBLISHES_PER_FLUSH = 500
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -184,6 +195,32 @@ async def async_publish(
     )
 
 
+async def async_publish_bulk(
+    hass: HomeAssistant,
+    messages: list[PublishMessage],
+    failed_callback: Callable[[list[PublishMessage]], None] | None = None,
+) -> None:
+    """Publish messages without waiting for the broker to acknowledge them.
+
+    Waits only when the outgoing queue is full, until it has room again.
+    The messages which fail to be transmitted, for example while the client
+    is disconnected, are passed to the failed callback.
+    """
+    if not messages:
+        return
+    if not mqtt_config_entry_enabled(hass):
+        topic = messages[0].topic
+        raise HomeAssistantError(
+            f"Cannot publish to topic '{topic}', MQTT is not enabled",
+            translation_key="mqtt_not_setup_cannot_publish",
+            translation_domain=DOMAIN,
+            translation_placeholders={"topic": topic},
+        )
+    await hass.data[DATA_MQTT].client.async_publish_bulk(
+        messages, failed_callback=failed_callback
+    )
+
+
 @bind_hass
 async def async_subscribe(
     hass: HomeAssistant,
@@ -191,12 +228,19 @@ async def async_subscribe(
     msg_callback: Callable[[ReceiveMessage], Coroutine[Any, Any, None] | None],
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
+    coalesce_window: float = 0,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
+    With a coalesce window (in seconds), a message on a topic is delivered
+    right away, but of the messages received on the topic during the
+    following window only the latest is delivered when the window ends.
+
     Call the return value to unsubscribe.
     """
-    return async_subscribe_internal(hass, topic, msg_callback, qos, encoding)
+    return async_subscribe_internal(
+        hass, topic, msg_callback, qos, encoding, coalesce_window=coalesce_window
+    )
 
 
 @callback
@@ -207,6 +251,7 @@ def async_subscribe_internal(
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
     job_type: HassJobType | None = None,
+    coalesce_window: float = 0,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
@@ -234,7 +279,9 @@ def async_subscribe_internal(
             translation_domain=DOMAIN,
             translation_placeholders={"topic": topic},
         )
-    return client.async_subscribe(topic, msg_callback, qos, encoding, job_type)
+    return client.async_subscribe(
+        topic, msg_callback, qos, encoding, job_type, coalesce_window
+    )
 
 
 @bind_hass
@@ -267,10 +314,29 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    coalesce_window: float = 0
+
+
+@dataclass(slots=True)
+class _CoalesceWindow:
+    """A window during which messages of a subscription on a topic coalesce."""
+
+    timer: asyncio.TimerHandle
+    pending: ReceiveMessage | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class MqttMessageStats:
+    """Statistics of the messages handled by the MQTT client."""
+
+    received: int
+    delivered: int
+    coalesced: int
+    publish_queued: int
+    publish_failed: int
 
 
 class MqttClientSetup:
@@ -377,11 +443,26 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
+        self._coalesce_windows: dict[tuple[Subscription, str], _CoalesceWindow] = {}
+        self._messages_received = 0
+        self._messages_delivered = 0
+        self._messages_coalesced = 0
+        # Messages published in bulk are queued and published in batches,
+        # the broker acknowledging them is not waited for
+        self._publish_queue: deque[
+            tuple[PublishMessage, Callable[[list[PublishMessage]], None] | None]
+        ] = deque()
+        self._publish_queue_has_room = asyncio.Event()
+        self._publish_queue_has_room.set()
+        self._publish_flush: asyncio.Handle | None = None
+        self._publish_failed = 0
+        self._fire_and_forget_mids: set[int] = set()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -435,10 +516,29 @@ class MQTT:
             *self._wildcard_subscriptions,
         }
 
+    @property
+    def message_stats(self) -> MqttMessageStats:
+        """Return statistics about the received messages."""
+        return MqttMessageStats(
+            received=self._messages_received,
+            delivered=self._messages_delivered,
+            coalesced=self._messages_coalesced,
+            publish_queued=len(self._publish_queue),
+            publish_failed=self._publish_failed,
+        )
+
     def cleanup(self) -> None:
         """Clean up listeners."""
         while self._cleanup_on_unload:
             self._cleanup_on_unload.pop()()
+        for window in self._coalesce_windows.values():
+            window.timer.cancel()
+        self._coalesce_windows.clear()
+        if self._publish_flush is not None:
+            self._publish_flush.cancel()
+            self._publish_flush = None
+        self._publish_queue.clear()
+        self._publish_queue_has_room.set()
 
     @contextlib.asynccontextmanager
     async def _async_connect_in_executor(self) -> AsyncGenerator[None]:
@@ -643,6 +743,61 @@ class MQTT:
         )
         await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
 
+    async def async_publish_bulk(
+        self,
+        messages: Iterable[PublishMessage],
+        failed_callback: Callable[[list[PublishMessage]], None] | None = None,
+    ) -> None:
+        """Queue MQTT messages to publish in batches.
+
+        No future is created to wait for the broker to acknowledge the
+        messages. When the queue is full, wait until it has room again.
+        The messages failing to be transmitted are passed to the failed
+        callback.
+        """
+        queue = self._publish_queue
+        for message in messages:
+            while len(queue) >= MAX_PUBLISH_QUEUE_SIZE:
+                self._publish_queue_has_room.clear()
+                await self._publish_queue_has_room.wait()
+            queue.append((message, failed_callback))
+            if self._publish_flush is None:
+                self._publish_flush = self.loop.call_soon(
+                    self._async_flush_publish_queue
+                )
+
+    @callback
+    def _async_flush_publish_queue(self) -> None:
+        """Publish a batch of the queued messages."""
+        self._publish_flush = None
+        queue = self._publish_queue
+        publish = self._mqttc.publish
+        failed: defaultdict[
+            Callable[[list[PublishMessage]], None] | None, list[PublishMessage]
+        ] = defaultdict(list)
+        for _ in range(min(len(queue), MAX_PUBLISHES_PER_FLUSH)):
+            message, failed_callback = queue.popleft()
+            msg_info = publish(
+                message.topic, message.payload, message.qos, message.retain
+            )
+            if msg_info.rc != 0:
+                self._publish_failed += 1
+                _LOGGER.debug(
+                    "Failed to transmit message on %s, rc: %s",
+                    message.topic,
+                    msg_info.rc,
+                )
+                failed[failed_callback].append(message)
+                continue
+            self._fire_and_forget_mids.add(msg_info.mid)
+        for failed_callback, failed_messages in failed.items():
+            if failed_callback is not None:
+                failed_callback(failed_messages)
+        if queue:
+            self._publish_flush = self.loop.call_soon(self._async_flush_publish_queue)
+        if len(queue) < MAX_PUBLISH_QUEUE_SIZE:
+            self._publish_queue_has_room.set()
+
     async def async_connect(self, client_available: asyncio.Future[bool]) -> None:
         """Connect to the host. Does not process messages yet."""
         # pylint: disable-next=import-outside-toplevel
@@ -755,6 +910,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscriptions_trie.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,6 +929,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -817,6 +974,7 @@ class MQTT:
         qos: int,
         encoding: str | None = None,
         job_type: HassJobType | None = None,
+        coalesce_window: float = 0,
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos."""
         if not isinstance(topic, str):
@@ -835,9 +993,10 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(
+            topic, is_simple_match, job, qos, encoding, coalesce_window
+        )
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -854,6 +1013,11 @@ class MQTT:
         self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
+        if subscription.coalesce_window:
+            for key in [
+                key for key in self._coalesce_windows if key[0] is subscription
+            ]:
+                self._coalesce_windows.pop(key).timer.cancel()
         # Only unsubscribe if currently connected
         if self.connected:
             self._async_unsubscribe(subscription.topic)
@@ -1044,18 +1208,12 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions_trie.matches(topic))
         return subscriptions
 
     @callback
@@ -1084,6 +1242,7 @@ class MQTT:
             msg.qos,
             msg.payload[0:8192],
         )
+        self._messages_received += 1
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
 
@@ -1126,20 +1285,65 @@ class MQTT:
                 msg_cache_by_subscription_topic[subscription_topic] = receive_msg
             else:
                 receive_msg = msg_cache_by_subscription_topic[subscription_topic]
-            job = subscription.job
-            if job.job_type is HassJobType.Callback:
-                # We do not wrap Callback jobs in catch_log_exception since
-                # its expensive and we have to do it 2x for every entity
-                try:
-                    job.target(receive_msg)
-                except Exception:  # noqa: BLE001
-                    log_exception(
-                        partial(self._exception_message, job.target, receive_msg)
-                    )
-            else:
-                self.hass.async_run_hass_job(job, receive_msg)
+            if subscription.coalesce_window and not self._async_open_coalesce_window(
+                subscription, receive_msg
+            ):
+                continue
+            self._async_deliver(subscription.job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
+    @callback
+    def _async_deliver(
+        self,
+        job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None],
+        receive_msg: ReceiveMessage,
+    ) -> None:
+        """Deliver a message to the job of a subscription."""
+        self._messages_delivered += 1
+        if job.job_type is HassJobType.Callback:
+            # We do not wrap Callback jobs in catch_log_exception since
+            # its expensive and we have to do it 2x for every entity
+            try:
+                job.target(receive_msg)
+            except Exception:  # noqa: BLE001
+                log_exception(partial(self._exception_message, job.target, receive_msg))
+        else:
+            self.hass.async_run_hass_job(job, receive_msg)
+
+    @callback
+    def _async_open_coalesce_window(
+        self, subscription: Subscription, receive_msg: ReceiveMessage
+    ) -> bool:
+        """Open a coalesce window for the topic of a message.
+
+        Return False if a window is open already, the message is then kept
+        to be delivered when the window ends, replacing any message kept before.
+        """
+        key = (subscription, receive_msg.topic)
+        if (window := self._coalesce_windows.get(key)) is not None:
+            if window.pending is not None:
+                self._messages_coalesced += 1
+            window.pending = receive_msg
+            return False
+        self._coalesce_windows[key] = _CoalesceWindow(
+            self.loop.call_later(
+                subscription.coalesce_window, self._async_end_coalesce_window, key
+            )
+        )
+        return True
+
+    @callback
+    def _async_end_coalesce_window(self, key: tuple[Subscription, str]) -> None:
+        """Deliver the latest message received during a coalesce window."""
+        window = self._coalesce_windows.pop(key)
+        if (receive_msg := window.pending) is None:
+            return
+        subscription = key[0]
+        # Messages keep coalescing until a window passes without any
+        self._async_open_coalesce_window(subscription, receive_msg)
+        self._async_deliver(subscription.job, receive_msg)
+        self._mqtt_data.state_write_requests.process_write_state_requests(receive_msg)
+
     @callback
     def _async_mqtt_on_callback(
         self,
@@ -1153,6 +1357,9 @@ class MQTT:
         # The callback signature for on_unsubscribe is different from on_subscribe
         # see https://github.com/eclipse/paho.mqtt.python/issues/687
         # properties and reason codes are not used in Home Assistant
+        if mid in self._fire_and_forget_mids:
+            self._fire_and_forget_mids.remove(mid)
+            return
         future = self._async_get_mid_future(mid)
         if future.done() and (future.cancelled() or future.exception()):
             # Timed out or cancelled
@@ -1189,6 +1396,8 @@ class MQTT:
         # result is set make sure the first connection result is set
         self._async_connection_result(False)
         self.connected = False
+        # The broker won't acknowledge messages published in bulk any more
+        self._fire_and_forget_mids.clear()
         async_dispatcher_send(self.hass, MQTT_CONNECTION_STATE, False)
         _LOGGER.log(
             logging.INFO if result_code == 0 else logging.DEBUG,
@@ -1206,6 +1415,9 @@ class MQTT:
 
     async def _async_wait_for_mid_or_raise(self, mid: int, result_code: int) -> None:
         """Wait for ACK from broker or raise on error."""
+        # The mid may be reused after a message published in bulk was
+        # never acknowledged
+        self._fire_and_forget_mids.discard(mid)
         if result_code != 0:
             # pylint: disable-next=import-outside-toplevel
             import paho.mqtt.client as mqtt
@@ -1247,13 +1459,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -19,7 +19,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
+from homeassistant.helpers.service_info.mqtt import MqttServiceInfo, ReceivePayloadType
 from homeassistant.helpers.typing import DiscoveryInfoType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
@@ -191,7 +191,7 @@ async def async_start(  # noqa: C901
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
-    integration_discovery_messages: dict[str, int] = {}
+    integration_discovery_messages: dict[str, ReceivePayloadType] = {}
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
@@ -239,6 +239,27 @@ async def async_start(  # noqa: C901
 
         component, node_id, object_id = match.groups()
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        payloads = mqtt_data.discovery_payloads
+        if not payload:
+            payloads.pop(topic, None)
+        elif (
+            payloads.get(topic) == payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+        ):
+            # The retained discovery messages are received again on every
+            # reconnect, skip parsing and validating the unchanged ones
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload: %s %s", component, discovery_id
+            )
+            return
+        else:
+            payloads[topic] = payload
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -253,10 +274,6 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
@@ -370,7 +387,7 @@ async def async_start(  # noqa: C901
         """Process the received message."""
         if (
             msg.topic in integration_discovery_messages
-            and integration_discovery_messages[msg.topic] == hash(msg.payload)
+            and integration_discovery_messages[msg.topic] == msg.payload
         ):
             _LOGGER.debug(
                 "Ignoring already processed discovery message for '%s' on topic %s: %s",
@@ -398,9 +415,9 @@ async def async_start(  # noqa: C901
             )
             if msg.payload:
                 # Update the last discovered config message
-                integration_discovery_messages[msg.topic] = hash(msg.payload)
+                integration_discovery_messages[msg.topic] = msg.payload
             elif msg.topic in integration_discovery_messages:
-                # Cleanup hash if discovery payload is empty
+                # Cleanup if discovery payload is empty
                 del integration_discovery_messages[msg.topic]
 
     integration_unsubscribe.update(
@@ -358,7 +358,7 @@ class EntityTopicState:
         self.subscribe_calls: dict[str, Entity] = {}
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+    def process_write_state_requests(self, msg: MQTTMessage | ReceiveMessage) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
             entity_id, entity = self.subscribe_calls.popitem()
@@ -395,6 +395,7 @@ class MqttData:
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
+    discovery_payloads: dict[str, ReceivePayloadType] = field(default_factory=dict)
     discovery_registry_hooks: dict[tuple[str, str], CALLBACK_TYPE] = field(
         default_factory=dict
     )
@@ -145,6 +145,83 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """Node of a topic trie, one per topic level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicTrie[_T]:
+    """Match topics against topic filters which may contain wildcards.
+
+    The filters are stored in a trie with a node per topic level, so
+    matching a topic takes time proportional to its number of levels
+    instead of to the number of filters.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.add(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path = [(self._root, "")]
+        for level in topic_filter.split("/"):
+            path.append((path[-1][0].children[level], level))
+        path[-1][0].values.remove(value)
+        # Prune the nodes which no longer lead to any value
+        for (parent, _), (node, level) in zip(
+            reversed(path[:-1]), reversed(path[1:]), strict=True
+        ):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        found: list[_T] = []
+        # Wildcards on the first level don't match topics starting with $
+        wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_TopicTrieNode[_T]] = []
+            for node in nodes:
+                children = node.children
+                if wildcards and (multi_level := children.get("#")) is not None:
+                    found.extend(multi_level.values)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards and (single_level := children.get("+")) is not None:
+                    next_nodes.append(single_level)
+            if not next_nodes:
+                return found
+            nodes = next_nodes
+            wildcards = True
+        for node in nodes:
+            found.extend(node.values)
+            # A multi level wildcard also matches its parent level
+            if (multi_level := node.children.get("#")) is not None:
+                found.extend(multi_level.values)
+        return found
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
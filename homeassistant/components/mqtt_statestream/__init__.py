@@ -7,8 +7,9 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import valid_publish_topic
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -16,6 +17,10 @@ from homeassistant.helpers.entityfilter import (
 )
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.start import async_at_start
+from homeassistant.helpers.state_exporter import (
+    StateRecord,
+    async_register_state_exporter,
+)
 from homeassistant.helpers.typing import ConfigType
 
 CONF_BASE_TOPIC = "base_topic"
@@ -55,58 +60,80 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if not base_topic.endswith("/"):
         base_topic = f"{base_topic}/"
 
-    async def _state_publisher(evt: Event[EventStateChangedData]) -> None:
-        entity_id = evt.data["entity_id"]
-        new_state = evt.data["new_state"]
-        assert new_state
-
-        payload = new_state.state
-
-        mybase = f"{base_topic}{entity_id.replace('.', '/')}/"
-        await mqtt.async_publish(hass, f"{mybase}state", payload, 1, True)
-
-        if publish_timestamps:
-            if new_state.last_updated:
-                await mqtt.async_publish(
-                    hass,
-                    f"{mybase}last_updated",
-                    new_state.last_updated.isoformat(),
-                    1,
-                    True,
-                )
-            if new_state.last_changed:
-                await mqtt.async_publish(
-                    hass,
-                    f"{mybase}last_changed",
-                    new_state.last_changed.isoformat(),
-                    1,
-                    True,
-                )
-
-        if publish_attributes:
-            for key, val in new_state.attributes.items():
-                encoded_val = json.dumps(val, cls=JSONEncoder)
-                await mqtt.async_publish(hass, mybase + key, encoded_val, 1, True)
+    # The payloads last published per entity, keyed by topic
+    published: dict[str, dict[str, str]] = {}
 
-    @callback
-    def _ha_started(hass: HomeAssistant) -> None:
-        @callback
-        def _event_filter(event_data: EventStateChangedData) -> bool:
-            entity_id = event_data["entity_id"]
-            new_state = event_data["new_state"]
+    async def _state_publisher(records: list[StateRecord]) -> None:
+        messages: list[mqtt.PublishMessage] = []
+        entity_ids: dict[str, str] = {}
+        for record in records:
+            entity_id = record.entity_id
+            new_state = record.new_state
             if new_state is None:
-                return False
-            if not publish_filter(entity_id):
-                return False
-            return True
+                published.pop(entity_id, None)
+                continue
+
+            mybase = f"{base_topic}{entity_id.replace('.', '/')}/"
+            payloads = {f"{mybase}state": new_state.state}
+
+            if publish_timestamps:
+                if new_state.last_updated:
+                    payloads[f"{mybase}last_updated"] = (
+                        new_state.last_updated.isoformat()
+                    )
+                if new_state.last_changed:
+                    payloads[f"{mybase}last_changed"] = (
+                        new_state.last_changed.isoformat()
+                    )
+
+            if publish_attributes:
+                for key, val in new_state.attributes.items():
+                    payloads[mybase + key] = json.dumps(val, cls=JSONEncoder)
+
+            # Only publish what changed since it was last published
+            last_payloads = published.setdefault(entity_id, {})
+            for topic, payload in payloads.items():
+                if last_payloads.get(topic) != payload:
+                    messages.append(mqtt.PublishMessage(topic, payload, 1, True))
+                    entity_ids[topic] = entity_id
+            last_payloads.update(payloads)
+
+        @callback
+        def _publish_failed(failed: list[mqtt.PublishMessage]) -> None:
+            # Publish the failed topics again with the next change
+            for message in failed:
+                if last_payloads := published.get(entity_ids[message.topic]):
+                    last_payloads.pop(message.topic, None)
+
+        try:
+            await mqtt.async_publish_bulk(
+                hass, messages, failed_callback=_publish_failed
+            )
+        except HomeAssistantError:
+            # Publish everything of these entities again with the next change
+            for record in records:
+                published.pop(record.entity_id, None)
+            raise
 
-        callback_handler = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _state_publisher, _event_filter
+    @callback
+    def _connection_status_changed(_: bool) -> None:
+        # A broker without persistence loses the retained messages when it
+        # restarts, publish everything again with the next change
+        published.clear()
+
+    @callback
+    def _ha_started(hass: HomeAssistant) -> None:
+        unregister_exporter = async_register_state_exporter(
+            hass, DOMAIN, _state_publisher, publish_filter
+        )
+        unsubscribe_connection_status = mqtt.async_subscribe_connection_status(
+            hass, _connection_status_changed
         )
 
         @callback
         def _ha_stopping(_: Event) -> None:
-            callback_handler()
+            unregister_exporter()
+            unsubscribe_connection_status()
 
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _ha_stopping)
 
@@ -259,6 +259,8 @@ async def async_setup_entry(  # noqa: C901
             for handle in getattr(hass.loop, "_scheduled"):
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
+            for wheel_handle in hass.timer_wheel.handles():
+                _LOGGER.critical("Scheduled: %s", wheel_handle)
 
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
@@ -6,11 +6,14 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 import string
+import threading
+import time
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -49,7 +52,6 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
-    EVENT_STATE_CHANGED,
     PERCENTAGE,
     STATE_ALARM_ARMED_AWAY,
     STATE_ALARM_ARMED_CUSTOM_BYPASS,
@@ -70,7 +72,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -78,6 +80,7 @@ from homeassistant.helpers.entity_registry import (
     EventEntityRegistryUpdatedData,
 )
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.helpers.state_exporter import StateRecord, register_state_exporter
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
@@ -86,6 +89,10 @@ _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
 
+# Time in seconds a scrape may spend re-rendering metrics, the metrics left
+# are served as rendered before and re-rendered with the next scrape
+SCRAPE_TIME_BUDGET = 1.0
+
 DOMAIN = "prometheus"
 CONF_FILTER = "filter"
 CONF_REQUIRES_AUTH = "requires_auth"
@@ -128,8 +135,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -143,15 +148,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
-        entity_filter,
         namespace,
         climate_units,
         component_config,
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(metrics, conf[CONF_REQUIRES_AUTH]))
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+    register_state_exporter(hass, DOMAIN, metrics.handle_state_records, entity_filter)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
         metrics.handle_entity_registry_updated,
@@ -164,12 +169,32 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+class _ExpositionCache:
+    """Metrics rendered in one exposition format."""
+
+    def __init__(self, render: Callable[[Any], bytes]) -> None:
+        """Initialize the exposition cache."""
+        self.render = render
+        self.rendered: dict[str, bytes] = {}
+        # Metrics changed since they were last rendered
+        self.dirty: set[str] = set()
+        self.lock = threading.Lock()
+
+
+def _render_openmetrics(registry: Any) -> bytes:
+    """Render metrics in the OpenMetrics format, without the end marker."""
+    return openmetrics_exposition.generate_latest(registry).removesuffix(b"# EOF\n")
+
+
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    The rendered text of each metric is cached, a scrape only renders the
+    metrics which changed since the previous scrape again.
+    """
 
     def __init__(
         self,
-        entity_filter: entityfilter.EntityFilter,
         namespace: str,
         climate_units: UnitOfTemperature,
         component_config: EntityValues,
@@ -180,7 +205,6 @@ class PrometheusMetrics:
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
-        self._filter = entity_filter
         self._sensor_metric_handlers: list[
             Callable[[State, str | None], str | None]
         ] = [
@@ -198,25 +222,97 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
         self._climate_units = climate_units
+        self._registry = prometheus_client.CollectorRegistry(auto_describe=True)
+        # Held while metrics are updated, states are handled in executor threads
+        self._lock = threading.RLock()
+        self._caches = {
+            False: _ExpositionCache(prometheus_client.generate_latest),
+            True: _ExpositionCache(_render_openmetrics),
+        }
+        self._scrape_registry = prometheus_client.CollectorRegistry()
+        self._scrape_duration = prometheus_client.Gauge(
+            self._sanitize_metric_name(
+                f"{self.metrics_prefix}prometheus_scrape_duration_seconds"
+            ),
+            "Time spent rendering the metrics of the last scrape",
+            registry=self._scrape_registry,
+        )
+        self._scrape_rendered = prometheus_client.Gauge(
+            self._sanitize_metric_name(
+                f"{self.metrics_prefix}prometheus_scrape_rendered_metrics"
+            ),
+            "Number of metrics rendered again by the last scrape",
+            registry=self._scrape_registry,
+        )
+        self._scrape_stale = prometheus_client.Gauge(
+            self._sanitize_metric_name(
+                f"{self.metrics_prefix}prometheus_scrape_stale_metrics"
+            ),
+            "Number of changed metrics the last scrape had no time to render",
+            registry=self._scrape_registry,
+        )
 
-    def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
-        """Handle new messages from the bus."""
-        if (state := event.data.get("new_state")) is None:
-            return
-
-        if not self._filter(state.entity_id):
-            _LOGGER.debug("Filtered out entity %s", state.entity_id)
+    def generate_latest(self, openmetrics: bool = False) -> bytes:
+        """Render all metrics, in the OpenMetrics format if requested."""
+        cache = self._caches[openmetrics]
+        with cache.lock:
+            start = time.monotonic()
+            with self._lock:
+                dirty, cache.dirty = cache.dirty, set()
+                metrics = dict(self._metrics)
+
+            deadline = start + SCRAPE_TIME_BUDGET
+            stale: set[str] = set()
+            for metric in dirty:
+                if metric in cache.rendered and time.monotonic() > deadline:
+                    stale.add(metric)
+                    continue
+                cache.rendered[metric] = cache.render(metrics[metric])
+            if stale:
+                with self._lock:
+                    cache.dirty |= stale
+
+            self._scrape_duration.set(time.monotonic() - start)
+            self._scrape_rendered.set(len(dirty) - len(stale))
+            self._scrape_stale.set(len(stale))
+            body = b"".join(
+                (
+                    cache.render(prometheus_client.REGISTRY),
+                    *(
+                        cache.rendered[metric]
+                        for metric in metrics
+                        if metric in cache.rendered
+                    ),
+                    cache.render(self._scrape_registry),
+                )
+            )
+        if openmetrics:
+            body += b"# EOF\n"
+        return body
+
+    def handle_state_records(self, records: list[StateRecord]) -> None:
+        """Handle a batch of state changes of the entities passing the filter."""
+        with self._lock:
+            for record in records:
+                self._handle_state_record(record)
+
+    def _handle_state_record(self, record: StateRecord) -> None:
+        if (state := record.new_state) is None:
             return
 
-        if (old_state := event.data.get("old_state")) is not None and (
+        if (old_state := record.old_state) is not None and (
             old_friendly_name := old_state.attributes.get(ATTR_FRIENDLY_NAME)
         ) != state.attributes.get(ATTR_FRIENDLY_NAME):
             self._remove_labelsets(old_state.entity_id, old_friendly_name)
 
-        self.handle_state(state)
+        self._handle_state(state)
 
     def handle_state(self, state: State) -> None:
         """Add/update a state in Prometheus."""
+        with self._lock:
+            self._handle_state(state)
+
+    def _handle_state(self, state: State) -> None:
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
         domain, _ = hacore.split_entity_id(entity_id)
@@ -271,13 +367,14 @@ class PrometheusMetrics:
                 metrics_entity_id = entity_id
 
         if metrics_entity_id:
-            self._remove_labelsets(metrics_entity_id)
+            with self._lock:
+                self._remove_labelsets(metrics_entity_id)
 
     def _remove_labelsets(
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in list(self._metrics.values()):
+        for name, metric in list(self._metrics.items()):
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
             ].samples:
@@ -291,6 +388,12 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                    self._metric_changed(name)
+
+    def _metric_changed(self, metric: str) -> None:
+        """Mark a metric to be rendered again."""
+        for cache in self._caches.values():
+            cache.dirty.add(metric)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -313,13 +416,14 @@ class PrometheusMetrics:
         documentation: str,
         extra_labels: list[str] | None = None,
     ) -> _MetricBaseT:
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
+        # Metrics are only looked up to be changed
+        self._metric_changed(metric)
         try:
             return cast(_MetricBaseT, self._metrics[metric])
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
@@ -327,7 +431,7 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=self._registry,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
@@ -853,8 +957,9 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, metrics: PrometheusMetrics, requires_auth: bool) -> None:
         """Initialize Prometheus view."""
+        self.metrics = metrics
         self.requires_auth = requires_auth
 
     async def get(self, request: web.Request) -> web.Response:
@@ -862,10 +967,19 @@ class PrometheusView(HomeAssistantView):
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
+        openmetrics = "application/openmetrics-text" in request.headers.get(
+            hdrs.ACCEPT, ""
         )
-        return web.Response(
-            body=body,
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        body = await hass.async_add_executor_job(
+            self.metrics.generate_latest, openmetrics
         )
+        if openmetrics:
+            response = web.Response(
+                body=body,
+                headers={hdrs.CONTENT_TYPE: openmetrics_exposition.CONTENT_TYPE_LATEST},
+            )
+        else:
+            response = web.Response(body=body, content_type=CONTENT_TYPE_TEXT_PLAIN)
+        # Compressed when the scraper accepts it
+        response.enable_compression()
+        return response
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass
 import logging
 from typing import TYPE_CHECKING, Any, cast
@@ -52,6 +53,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
+    CONF_EXECUTION_POOL,
     CONF_MAX,
     CONF_MAX_EXCEEDED,
     Script,
@@ -382,13 +384,20 @@ async def _async_process_config(
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        # Scripts can only match configs with the same key, index them by key
+        # to avoid comparing every script with every config on reload
+        script_configs_by_key: defaultdict[str, list[int]] = defaultdict(list)
+        for config_idx, script_config in enumerate(script_configs):
+            script_configs_by_key[script_config.key].append(config_idx)
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
+            if script.unique_id is None:
+                continue
+            for config_idx in script_configs_by_key.get(script.unique_id, ()):
                 if config_idx in config_matches:
                     # Only allow a script config to match at most once
                     continue
-                if script_matches_config(script, script_config):
+                if script_matches_config(script, script_configs[config_idx]):
                     script_matches.add(script_idx)
                     config_matches.add(config_idx)
                     # Only allow a script to match at most once
@@ -571,6 +580,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             script_mode=cfg[CONF_MODE],
             max_runs=cfg[CONF_MAX],
             max_exceeded=cfg[CONF_MAX_EXCEEDED],
+            execution_pool=cfg.get(CONF_EXECUTION_POOL),
             logger=logging.getLogger(f"{__name__}.{key}"),
             variables=cfg.get(CONF_VARIABLES),
         )
@@ -754,6 +764,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
     async def async_will_remove_from_hass(self) -> None:
         """Stop script and remove service when it will be removed from HA."""
         await self.script.async_stop()
+        self.script.async_release()
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self._attr_unique_id)
@@ -12,6 +12,7 @@ from homeassistant.components.trace import (
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_disabled
 
 from .const import DOMAIN
 
@@ -36,7 +37,8 @@ def trace_script(
     async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
-        yield trace
+        with trace_disabled(not trace_config[CONF_STORED_TRACES]):
+            yield trace
     except Exception as ex:
         if item_id:
             trace.set_error(ex)
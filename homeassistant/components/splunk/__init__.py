@@ -63,7 +63,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     use_ssl = conf[CONF_SSL]
     verify_ssl = conf.get(CONF_VERIFY_SSL)
     name = conf.get(CONF_NAME)
-    entity_filter = conf[CONF_FILTER]
+    entity_filter = conf[CONF_FILTER].get_filter()
 
     event_collector = hass_splunk(
         session=async_get_clientsession(hass),
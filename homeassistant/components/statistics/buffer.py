@@ -0,0 +1,305 @@
+"""Sample buffer keeping the statistics of its samples up to date."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+from fractions import Fraction
+import math
+
+# Splits a float into two halves whose products are exact
+_SPLITTER = 134217729.0
+
+
+class RunningSum:
+    """A sum of floats which values can be added to and removed from.
+
+    The sum is kept as exact partial sums, so removing a value doesn't leave
+    rounding errors behind, no matter how many values went through it.
+    """
+
+    __slots__ = ("_partials",)
+
+    def __init__(self) -> None:
+        """Initialize the sum."""
+        self._partials: list[float] = []
+
+    def add(self, value: float) -> None:
+        """Add a value to the sum."""
+        partials = self._partials
+        i = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            high = value + partial
+            low = partial - (high - value)
+            if low:
+                partials[i] = low
+                i += 1
+            value = high
+        partials[i:] = [value]
+
+    def add_square(self, value: float) -> None:
+        """Add the exact square of a value to the sum."""
+        square = value * value
+        scaled = _SPLITTER * value
+        high = scaled - (scaled - value)
+        low = value - high
+        self.add(square)
+        self.add(((high * high - square) + 2 * high * low) + low * low)
+
+    def remove(self, value: float) -> None:
+        """Remove a value from the sum."""
+        self.add(-value)
+
+    def remove_square(self, value: float) -> None:
+        """Remove the exact square of a value from the sum."""
+        square = value * value
+        scaled = _SPLITTER * value
+        high = scaled - (scaled - value)
+        low = value - high
+        self.add(-square)
+        self.add(-(((high * high - square) + 2 * high * low) + low * low))
+
+    def clear(self) -> None:
+        """Reset the sum to zero."""
+        self._partials.clear()
+
+    @property
+    def value(self) -> float:
+        """Return the sum."""
+        return math.fsum(self._partials)
+
+    @property
+    def fraction(self) -> Fraction:
+        """Return the exact sum, needs all values to be finite."""
+        return sum(map(Fraction, self._partials), Fraction(0))
+
+
+class SampleBuffer:
+    """A ring buffer of samples and their ages.
+
+    The statistics of the samples are updated as samples are added and
+    removed, so that they don't have to be calculated over all samples every
+    time one changes. When the buffer is full, adding a sample removes the
+    oldest one.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        """Initialize the sample buffer."""
+        self.max_size = max_size
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        # The samples in ascending order, for the median and percentiles
+        self._sorted: list[float | bool] = []
+        # Candidates for the minimum and maximum as (sample number, value),
+        # the first one is the earliest minimum or maximum in the buffer
+        self._min: deque[tuple[int, float | bool]] = deque()
+        self._max: deque[tuple[int, float | bool]] = deque()
+        self._added = 0
+        self._removed = 0
+        self._count_on = 0
+        self._sum = RunningSum()
+        self._sum_squares = RunningSum()
+        self._sin_sum = RunningSum()
+        self._cos_sum = RunningSum()
+        self._sum_differences = RunningSum()
+        self._sum_differences_nonnegative = RunningSum()
+        # Areas under the samples over time, in seconds
+        self._area_linear = RunningSum()
+        self._area_step = RunningSum()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def append(self, state: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest one if the buffer is full.
+
+        Raises ValueError for infinite and NaN samples, as the statistics
+        could not recover from them.
+        """
+        if not math.isfinite(state):
+            raise ValueError(f"Sample {state} is not finite")
+        states = self.states
+        if len(states) == self.max_size:
+            self.popleft()
+        if states:
+            previous = states[-1]
+            seconds = (age - self.ages[-1]).total_seconds()
+            self._sum_differences.add(abs(state - previous))
+            self._sum_differences_nonnegative.add(
+                state - previous if state >= previous else state
+            )
+            self._area_linear.add(0.5 * (state + previous) * seconds)
+            self._area_step.add(previous * seconds)
+        states.append(state)
+        self.ages.append(age)
+
+        insort(self._sorted, state)
+        number = self._added
+        self._added += 1
+        while self._min and self._min[-1][1] > state:
+            self._min.pop()
+        self._min.append((number, state))
+        while self._max and self._max[-1][1] < state:
+            self._max.pop()
+        self._max.append((number, state))
+
+        if state is True:
+            self._count_on += 1
+        self._sum.add(state)
+        self._sum_squares.add_square(state)
+        radians = math.radians(state)
+        self._sin_sum.add(math.sin(radians))
+        self._cos_sum.add(math.cos(radians))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        state = self.states.popleft()
+        age = self.ages.popleft()
+        if not self.states:
+            self._clear_statistics()
+            return
+        following = self.states[0]
+        seconds = (self.ages[0] - age).total_seconds()
+        self._sum_differences.remove(abs(following - state))
+        self._sum_differences_nonnegative.remove(
+            following - state if following >= state else following
+        )
+        self._area_linear.remove(0.5 * (following + state) * seconds)
+        self._area_step.remove(state * seconds)
+
+        del self._sorted[bisect_left(self._sorted, state)]
+        number = self._removed
+        self._removed += 1
+        if self._min[0][0] == number:
+            self._min.popleft()
+        if self._max[0][0] == number:
+            self._max.popleft()
+
+        if state is True:
+            self._count_on -= 1
+        self._sum.remove(state)
+        self._sum_squares.remove_square(state)
+        radians = math.radians(state)
+        self._sin_sum.remove(math.sin(radians))
+        self._cos_sum.remove(math.cos(radians))
+
+    def _clear_statistics(self) -> None:
+        """Reset the statistics once the buffer is empty."""
+        self._sorted.clear()
+        self._min.clear()
+        self._max.clear()
+        self._added = self._removed = 0
+        self._count_on = 0
+        for running_sum in (
+            self._sum,
+            self._sum_squares,
+            self._sin_sum,
+            self._cos_sum,
+            self._sum_differences,
+            self._sum_differences_nonnegative,
+            self._area_linear,
+            self._area_step,
+        ):
+            running_sum.clear()
+
+    @property
+    def age_range_seconds(self) -> float:
+        """Return the seconds between the oldest and the newest sample."""
+        return (self.ages[-1] - self.ages[0]).total_seconds()
+
+    @property
+    def area_linear(self) -> float:
+        """Return the area under the samples, interpolated linearly."""
+        return self._area_linear.value
+
+    @property
+    def area_step(self) -> float:
+        """Return the area under the samples, each holding until the next."""
+        return self._area_step.value
+
+    @property
+    def count_on(self) -> int:
+        """Return the number of samples which are True."""
+        return self._count_on
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the samples."""
+        return self._sum.value
+
+    @property
+    def sum_differences(self) -> float:
+        """Return the sum of the absolute differences between samples."""
+        return self._sum_differences.value
+
+    @property
+    def sum_differences_nonnegative(self) -> float:
+        """Return the sum of the increases, counting decreases as resets."""
+        return self._sum_differences_nonnegative.value
+
+    @property
+    def sin_sum(self) -> float:
+        """Return the sum of the sines of the samples in degrees."""
+        return self._sin_sum.value
+
+    @property
+    def cos_sum(self) -> float:
+        """Return the sum of the cosines of the samples in degrees."""
+        return self._cos_sum.value
+
+    @property
+    def min(self) -> float | bool:
+        """Return the smallest sample."""
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float | bool:
+        """Return the largest sample."""
+        return self._max[0][1]
+
+    @property
+    def min_age(self) -> datetime:
+        """Return the age of the first smallest sample."""
+        return self.ages[self._min[0][0] - self._removed]
+
+    @property
+    def max_age(self) -> datetime:
+        """Return the age of the first largest sample."""
+        return self.ages[self._max[0][0] - self._removed]
+
+    def median(self) -> float:
+        """Return the median, like statistics.median."""
+        data = self._sorted
+        n = len(data)
+        i = n // 2
+        if n % 2 == 1:
+            return data[i]
+        return (data[i - 1] + data[i]) / 2
+
+    def quantile(self, i: int, n: int) -> float:
+        """Return the i-th of the n-quantiles.
+
+        Like statistics.quantiles with the exclusive method, needs two samples.
+        """
+        data = self._sorted
+        size = len(data)
+        m = size + 1
+        j = i * m // n
+        j = 1 if j < 1 else min(j, size - 1)
+        delta = i * m - j * n
+        return (data[j - 1] * (n - delta) + data[j] * delta) / n
+
+    def variance(self) -> float:
+        """Return the sample variance, like statistics.variance.
+
+        Calculated exactly from the sums, needs two samples.
+        """
+        if not math.isfinite(self._sum_squares.value):
+            return math.nan
+        n = len(self.states)
+        total = self._sum.fraction
+        return float((n * self._sum_squares.fraction - total * total) / (n * (n - 1)))
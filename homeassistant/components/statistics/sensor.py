@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable, Mapping
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -56,6 +54,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .buffer import SampleBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -362,8 +361,7 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.samples = SampleBuffer(self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
@@ -446,10 +444,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self.samples.append(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self.samples.append(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -553,8 +550,8 @@ class StatisticsSensor(SensorEntity):
             self.samples_keep_last,
         )
 
-        while self.ages and (now - self.ages[0]) > max_age:
-            if self.samples_keep_last and len(self.ages) == 1:
+        while self.samples.ages and (now - self.samples.ages[0]) > max_age:
+            if self.samples_keep_last and len(self.samples.ages) == 1:
                 # Under normal circumstance this will not be executed, as a purge will not
                 # be scheduled for the last value if samples_keep_last is enabled.
                 # If this happens to be called outside normal scheduling logic or a
@@ -562,39 +559,38 @@ class StatisticsSensor(SensorEntity):
                 _LOGGER.debug(
                     "%s: preserving expired record with datetime %s(%s)",
                     self.entity_id,
-                    dt_util.as_local(self.ages[0]),
-                    (now - self.ages[0]),
+                    dt_util.as_local(self.samples.ages[0]),
+                    (now - self.samples.ages[0]),
                 )
                 break
 
             _LOGGER.debug(
                 "%s: purging record with datetime %s(%s)",
                 self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
+                dt_util.as_local(self.samples.ages[0]),
+                (now - self.samples.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self.samples.popleft()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._samples_max_age:
-            if self.samples_keep_last and len(self.ages) == 1:
+        if self.samples.ages and self._samples_max_age:
+            if self.samples_keep_last and len(self.samples.ages) == 1:
                 # Preserve the most recent entry if it is the only value.
                 # Do not schedule another purge. When a new source
                 # value is inserted it will restart purge cycle.
                 _LOGGER.debug(
                     "%s: skipping purge cycle for last record with datetime %s(%s)",
                     self.entity_id,
-                    dt_util.as_local(self.ages[0]),
-                    (dt_util.utcnow() - self.ages[0]),
+                    dt_util.as_local(self.samples.ages[0]),
+                    (dt_util.utcnow() - self.samples.ages[0]),
                 )
                 return None
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._samples_max_age
+            return self.samples.ages[0] + self._samples_max_age
         return None
 
     async def async_update(self) -> None:
@@ -692,13 +688,13 @@ class StatisticsSensor(SensorEntity):
         """Calculate and update the various attributes."""
         if self._samples_max_buffer_size is not None:
             self.attributes[STAT_BUFFER_USAGE_RATIO] = round(
-                len(self.states) / self._samples_max_buffer_size, 2
+                len(self.samples) / self._samples_max_buffer_size, 2
             )
 
         if self._samples_max_age is not None:
-            if len(self.states) >= 1:
+            if len(self.samples) >= 1:
                 self.attributes[STAT_AGE_COVERAGE_RATIO] = round(
-                    (self.ages[-1] - self.ages[0]).total_seconds()
+                    self.samples.age_range_seconds
                     / self._samples_max_age.total_seconds(),
                     2,
                 )
@@ -735,183 +731,160 @@ class StatisticsSensor(SensorEntity):
     # Statistics for numeric sensor
 
     def _stat_average_linear(self) -> StateType:
-        if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+        if len(self.samples) >= 2:
+            return self.samples.area_linear / self.samples.age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
-        if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+        if len(self.samples) >= 2:
+            return self.samples.area_step / self.samples.age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
         return self._stat_mean()
 
     def _stat_change(self) -> StateType:
-        if len(self.states) > 0:
-            return self.states[-1] - self.states[0]
+        if len(self.samples) > 0:
+            return self.samples.states[-1] - self.samples.states[0]
         return None
 
     def _stat_change_sample(self) -> StateType:
-        if len(self.states) > 1:
-            return (self.states[-1] - self.states[0]) / (len(self.states) - 1)
+        if len(self.samples) > 1:
+            return (self.samples.states[-1] - self.samples.states[0]) / (
+                len(self.samples) - 1
+            )
         return None
 
     def _stat_change_second(self) -> StateType:
-        if len(self.states) > 1:
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
+        if len(self.samples) > 1:
+            age_range_seconds = self.samples.age_range_seconds
             if age_range_seconds > 0:
-                return (self.states[-1] - self.states[0]) / age_range_seconds
+                return (
+                    self.samples.states[-1] - self.samples.states[0]
+                ) / age_range_seconds
         return None
 
     def _stat_count(self) -> StateType:
-        return len(self.states)
+        return len(self.samples)
 
     def _stat_datetime_newest(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[-1]
+        if len(self.samples) > 0:
+            return self.samples.ages[-1]
         return None
 
     def _stat_datetime_oldest(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[0]
+        if len(self.samples) > 0:
+            return self.samples.ages[0]
         return None
 
     def _stat_datetime_value_max(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+        if len(self.samples) > 0:
+            return self.samples.max_age
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+        if len(self.samples) > 0:
+            return self.samples.min_age
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
-        if len(self.states) >= 2:
+        if len(self.samples) >= 2:
             return 2 * 1.96 * cast(float, self._stat_standard_deviation())
         return None
 
     def _stat_distance_99_percent_of_values(self) -> StateType:
-        if len(self.states) >= 2:
+        if len(self.samples) >= 2:
             return 2 * 2.58 * cast(float, self._stat_standard_deviation())
         return None
 
     def _stat_distance_absolute(self) -> StateType:
-        if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+        if len(self.samples) > 0:
+            return self.samples.max - self.samples.min
         return None
 
     def _stat_mean(self) -> StateType:
-        if len(self.states) > 0:
-            return statistics.mean(self.states)
+        if len(self.samples) > 0:
+            return self.samples.sum / len(self.samples)
         return None
 
     def _stat_mean_circular(self) -> StateType:
-        if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+        if len(self.samples) > 0:
+            sin_sum = self.samples.sin_sum
+            cos_sum = self.samples.cos_sum
             return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
         return None
 
     def _stat_median(self) -> StateType:
-        if len(self.states) > 0:
-            return statistics.median(self.states)
+        if len(self.samples) > 0:
+            return self.samples.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
-        if len(self.states) >= 2:
-            return cast(float, self._stat_sum_differences()) / (len(self.states) - 1)
+        if len(self.samples) >= 2:
+            return cast(float, self._stat_sum_differences()) / (len(self.samples) - 1)
         return None
 
     def _stat_percentile(self) -> StateType:
-        if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+        if len(self.samples) >= 2:
+            return self.samples.quantile(self._percentile, 100)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
-        if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+        if len(self.samples) >= 2:
+            return math.sqrt(self.samples.variance())
         return None
 
     def _stat_sum(self) -> StateType:
-        if len(self.states) > 0:
-            return sum(self.states)
+        if len(self.samples) > 0:
+            return self.samples.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
-        if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+        if len(self.samples) >= 2:
+            return self.samples.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
-        if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+        if len(self.samples) >= 2:
+            return self.samples.sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
         return self._stat_sum()
 
     def _stat_value_max(self) -> StateType:
-        if len(self.states) > 0:
-            return max(self.states)
+        if len(self.samples) > 0:
+            return self.samples.max
         return None
 
     def _stat_value_min(self) -> StateType:
-        if len(self.states) > 0:
-            return min(self.states)
+        if len(self.samples) > 0:
+            return self.samples.min
         return None
 
     def _stat_variance(self) -> StateType:
-        if len(self.states) >= 2:
-            return statistics.variance(self.states)
+        if len(self.samples) >= 2:
+            return self.samples.variance()
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
-        if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+        if len(self.samples) >= 2:
+            return 100 / self.samples.age_range_seconds * self.samples.area_step
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
         return self._stat_binary_mean()
 
     def _stat_binary_count(self) -> StateType:
-        return len(self.states)
+        return len(self.samples)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self.samples.count_on
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.samples) - self.samples.count_on
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -920,6 +893,6 @@ class StatisticsSensor(SensorEntity):
         return self._stat_datetime_oldest()
 
     def _stat_binary_mean(self) -> StateType:
-        if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+        if len(self.samples) > 0:
+            return 100.0 / len(self.samples) * self.samples.count_on
         return None
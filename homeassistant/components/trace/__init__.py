@@ -18,10 +18,13 @@ from . import websocket_api
 from .const import (
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_MEMORY,
     DATA_TRACE_STORE,
+    DEFAULT_ACTIVE_TRACES,
     DEFAULT_STORED_TRACES,
+    DEFAULT_TRACE_MEMORY_BUDGET,
 )
-from .models import ActionTrace
+from .models import ActionTrace, TraceData, TraceMemory
 from .util import async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,7 +50,11 @@ __all__ = [
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
-    hass.data[DATA_TRACE] = {}
+    traces: TraceData = {}
+    hass.data[DATA_TRACE] = traces
+    hass.data[DATA_TRACE_MEMORY] = TraceMemory(
+        traces, DEFAULT_TRACE_MEMORY_BUDGET, DEFAULT_ACTIVE_TRACES
+    )
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
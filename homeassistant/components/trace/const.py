@@ -9,11 +9,16 @@ from homeassistant.util.hass_dict import HassKey
 if TYPE_CHECKING:
     from homeassistant.helpers.storage import Store
 
-    from .models import TraceData
+    from .models import TraceData, TraceMemory
 
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
+DATA_TRACE_MEMORY: HassKey[TraceMemory] = HassKey("trace_memory")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+# Memory budget shared by the finished traces of all scripts and automations
+DEFAULT_TRACE_MEMORY_BUDGET = 16 * 1024 * 1024
+# Most recently finished traces which are only compacted when leaving the window
+DEFAULT_ACTIVE_TRACES = 10
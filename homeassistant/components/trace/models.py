@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import abc
-from collections import deque
+from collections import OrderedDict, deque
 import datetime as dt
-from typing import Any
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import Context
+import orjson
+
+from homeassistant.core import Context, callback
+from homeassistant.helpers.json import json_encoder_default
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,18 +21,51 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads_object
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 import homeassistant.util.uuid as uuid_util
 
+_LOGGER = logging.getLogger(__name__)
+
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
 
+def _trace_json_default(obj: Any) -> Any:
+    """Convert objects the same way ExtendedJSONEncoder does."""
+    if isinstance(obj, dt.timedelta):
+        return {"__type": str(type(obj)), "total_seconds": obj.total_seconds()}
+    if isinstance(obj, dt.datetime):
+        return obj.isoformat()
+    if isinstance(obj, (dt.date, dt.time)):
+        return {"__type": str(type(obj)), "isoformat": obj.isoformat()}
+    try:
+        return json_encoder_default(obj)
+    except TypeError:
+        return {"__type": str(type(obj)), "repr": repr(obj)}
+
+
+if TYPE_CHECKING:
+
+    def _compact_json(obj: Any) -> bytes:
+        """Encode a trace to compact json bytes."""
+
+else:
+    _compact_json = partial(
+        orjson.dumps,
+        option=orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME,
+        default=_trace_json_default,
+    )
+
+
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
 
     context: Context
     key: str
     run_id: str
+    memory_size: int = 0
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -36,6 +74,9 @@ class BaseTrace(abc.ABC):
             "short_dict": self.as_short_dict(),
         }
 
+    def compact(self) -> None:
+        """Reduce the memory used by a finished trace and set its memory size."""
+
     @abc.abstractmethod
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
@@ -69,8 +110,9 @@ class ActionTrace(BaseTrace):
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
         self.key = f"{self._domain}.{item_id}"
-        self._dict: dict[str, Any] | None = None
+        self._compact_trace: bytes | None = None
         self._short_dict: dict[str, Any] | None = None
+        self._memory: TraceMemory | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
@@ -83,23 +125,55 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    def set_memory(self, memory: TraceMemory) -> None:
+        """Set the memory accounting the trace once finished."""
+        self._memory = memory
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        if self._memory is not None:
+            self._memory.async_add_finished(self)
+
+    def compact(self) -> None:
+        """Encode the trace elements of a stopped trace to json bytes.
+
+        The trace elements keep a copy of the variables of the step before
+        them, the encoded trace only holds the changed variables of each step.
+        The encoded trace is expanded again each time the trace is viewed.
+        """
+        if self._compact_trace is not None:
+            return
+        # Cache the short dict while the trace elements are still available
+        self.as_short_dict()
+        try:
+            self._compact_trace = _compact_json(self._trace_as_dict())
+        except JSON_ENCODE_EXCEPTIONS as err:
+            _LOGGER.debug("Not compacting trace %s %s: %s", self.key, self.run_id, err)
+            return
+        self._trace = None
+        self.memory_size = len(self._compact_trace)
+
+    def _trace_as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the trace elements as dictionaries."""
+        if not self._trace:
+            return {}
+        return {
+            key: [item.as_dict() for item in trace_list]
+            for key, trace_list in self._trace.items()
+        }
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
-        if self._dict:
-            return self._dict
-
         result = dict(self.as_short_dict())
 
-        traces = {}
-        if self._trace:
-            for key, trace_list in self._trace.items():
-                traces[key] = [item.as_dict() for item in trace_list]
+        traces: dict[str, Any]
+        if self._compact_trace is not None:
+            traces = json_loads_object(self._compact_trace)
+        else:
+            traces = self._trace_as_dict()
 
         result.update(
             {
@@ -109,10 +183,6 @@ class ActionTrace(BaseTrace):
                 "context": self.context,
             }
         )
-
-        if self._state == "stopped":
-            # Execution has stopped, save the result
-            self._dict = result
         return result
 
     def as_short_dict(self) -> dict[str, Any]:
@@ -162,13 +232,97 @@ class RestoredTrace(BaseTrace):
         self.context = context
         self.key = f"{extended_dict['domain']}.{extended_dict['item_id']}"
         self.run_id = extended_dict["run_id"]
-        self._dict = extended_dict
+        self._compact_dict = _compact_json(extended_dict)
         self._short_dict = short_dict
+        self.memory_size = len(self._compact_dict)
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this RestoredTrace."""
-        return self._dict  # type: ignore[no-any-return]
+        return json_loads_object(self._compact_dict)
 
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
         return self._short_dict  # type: ignore[no-any-return]
+
+
+class TraceMemory:
+    """Keep the memory used by stored traces within a budget.
+
+    Finished traces of all scripts and automations share the budget. When
+    it is exceeded, the least recently finished or viewed traces are evicted.
+
+    The most recently finished traces are kept as they are in an active
+    window. They are compacted only when they leave it, so the traces which
+    the per item limit drops before are never encoded.
+    """
+
+    def __init__(self, traces: TraceData, budget: int, active_window: int) -> None:
+        """Initialize the trace memory."""
+        self._traces = traces
+        self.budget = budget
+        self.active_window = active_window
+        self._active: OrderedDict[tuple[str, str], BaseTrace] = OrderedDict()
+        self._sizes: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self.size = 0
+        self.evicted = 0
+
+    def _is_stored(self, trace: BaseTrace) -> bool:
+        """Return if a trace was not dropped by the per item limit."""
+        traces = self._traces.get(trace.key)
+        return traces is not None and traces.get(trace.run_id) is trace
+
+    @callback
+    def async_add_finished(self, trace: BaseTrace) -> None:
+        """Add a finished trace to the active window."""
+        if not self._is_stored(trace):
+            return
+        self._active[(trace.key, trace.run_id)] = trace
+        while len(self._active) > self.active_window:
+            _, oldest = self._active.popitem(last=False)
+            oldest.compact()
+            self.async_add(oldest)
+
+    @callback
+    def async_add(self, trace: BaseTrace, oldest: bool = False) -> None:
+        """Account for a compacted trace and evict traces over the budget."""
+        if not self._is_stored(trace):
+            return
+        trace_id = (trace.key, trace.run_id)
+        self.async_discard(*trace_id)
+        self._sizes[trace_id] = trace.memory_size
+        self.size += trace.memory_size
+        if oldest:
+            self._sizes.move_to_end(trace_id, last=False)
+        while self.size > self.budget and len(self._sizes) > 1:
+            (key, run_id), size = self._sizes.popitem(last=False)
+            self.size -= size
+            self.evicted += 1
+            if (traces := self._traces.get(key)) is not None:
+                traces.pop(run_id, None)
+
+    @callback
+    def async_discard(self, key: str, run_id: str) -> None:
+        """Stop accounting for a trace."""
+        self._active.pop((key, run_id), None)
+        if (size := self._sizes.pop((key, run_id), None)) is not None:
+            self.size -= size
+
+    @callback
+    def async_touch(self, key: str, run_id: str) -> None:
+        """Mark a trace as recently used."""
+        if (key, run_id) in self._sizes:
+            self._sizes.move_to_end((key, run_id))
+        elif (key, run_id) in self._active:
+            self._active.move_to_end((key, run_id))
+
+    @callback
+    def async_stats(self) -> dict[str, int]:
+        """Return statistics about the memory used by traces."""
+        return {
+            "traces": sum(len(traces) for traces in self._traces.values()),
+            "active_traces": len(self._active),
+            "compacted_traces": len(self._sizes),
+            "size": self.size,
+            "budget": self.budget,
+            "evicted": self.evicted,
+        }
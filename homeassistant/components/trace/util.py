@@ -6,11 +6,11 @@ from collections.abc import Mapping
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import DATA_TRACE, DATA_TRACE_MEMORY, DATA_TRACE_STORE, DATA_TRACES_RESTORED
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,7 +23,9 @@ async def async_get_trace(
     # Restore saved traces if not done
     await async_restore_traces(hass)
 
-    return hass.data[DATA_TRACE][key][run_id].as_extended_dict()
+    trace = hass.data[DATA_TRACE][key][run_id]
+    hass.data[DATA_TRACE_MEMORY].async_touch(key, run_id)
+    return trace.as_extended_dict()
 
 
 async def async_list_contexts(
@@ -59,6 +61,12 @@ def _get_debug_traces(hass: HomeAssistant, key: str) -> list[dict[str, Any]]:
     return []
 
 
+@callback
+def async_get_memory_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return statistics about the memory used by traces."""
+    return hass.data[DATA_TRACE_MEMORY].async_stats()
+
+
 async def async_list_traces(
     hass: HomeAssistant, wanted_domain: str, wanted_key: str | None
 ) -> list[dict[str, Any]]:
@@ -84,11 +92,18 @@ def async_store_trace(
     """Store a trace if its key is valid."""
     if key := trace.key:
         traces = hass.data[DATA_TRACE]
+        memory = hass.data[DATA_TRACE_MEMORY]
         if key not in traces:
             traces[key] = LimitedSizeDict(size_limit=stored_traces)
         else:
             traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        traces_for_key = traces[key]
+        # Drop the oldest traces here to keep the memory accounting in sync
+        while traces_for_key and len(traces_for_key) >= stored_traces:
+            run_id, _ = traces_for_key.popitem(last=False)
+            memory.async_discard(key, run_id)
+        traces_for_key[trace.run_id] = trace
+        trace.set_memory(memory)
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -99,6 +114,7 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
         traces[key] = LimitedSizeDict()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
+    hass.data[DATA_TRACE_MEMORY].async_add(trace, oldest=True)
 
 
 async def async_restore_traces(hass: HomeAssistant) -> None:
@@ -26,7 +26,12 @@ from homeassistant.helpers.script import (
     debug_stop,
 )
 
-from .util import async_get_trace, async_list_contexts, async_list_traces
+from .util import (
+    async_get_memory_stats,
+    async_get_trace,
+    async_list_contexts,
+    async_list_traces,
+)
 
 TRACE_DOMAINS = ("automation", "script")
 
@@ -37,6 +42,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_trace_get)
     websocket_api.async_register_command(hass, websocket_trace_list)
     websocket_api.async_register_command(hass, websocket_trace_contexts)
+    websocket_api.async_register_command(hass, websocket_trace_memory)
     websocket_api.async_register_command(hass, websocket_breakpoint_clear)
     websocket_api.async_register_command(hass, websocket_breakpoint_list)
     websocket_api.async_register_command(hass, websocket_breakpoint_set)
@@ -125,6 +131,18 @@ async def websocket_trace_contexts(
     connection.send_result(msg["id"], contexts)
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "trace/memory"})
+def websocket_trace_memory(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return statistics about the memory used by traces."""
+    connection.send_result(msg["id"], async_get_memory_stats(hass))
+
+
 @callback
 @websocket_api.require_admin
 @websocket_api.websocket_command(
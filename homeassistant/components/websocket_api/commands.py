@@ -55,6 +55,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
@@ -561,10 +562,15 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_timings = async_get_import_timings(hass)
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": seconds}
+            {
+                "domain": integration,
+                "seconds": seconds,
+                "import_seconds": import_timings.get(integration, 0.0),
+            }
             for integration, seconds in async_get_setup_timings(hass).items()
         ],
     )
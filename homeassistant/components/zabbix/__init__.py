@@ -81,7 +81,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     publish_states_host = conf.get(CONF_PUBLISH_STATES_HOST)
 
-    entities_filter = convert_include_exclude_filter(conf)
+    entities_filter = convert_include_exclude_filter(conf).get_filter()
 
     try:
         zapi = ZabbixAPI(url=url, user=username, password=password)
@@ -73,7 +73,13 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlTypeError,
+    load_yaml_dict,
+    prune_yaml_cache,
+)
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -507,6 +513,8 @@ def load_yaml_config_file(
 
     This method needs to run in an executor.
     """
+    # Files removed or renamed since the last load are not loaded again
+    prune_yaml_cache()
     try:
         conf_dict = load_yaml_dict(config_path, secrets)
     except YamlTypeError as exc:
@@ -24,6 +24,7 @@ import datetime
 import enum
 import functools
 import inspect
+from itertools import chain
 import logging
 import os
 import pathlib
@@ -111,6 +112,7 @@ from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import TimerWheel
 from .util.ulid import ulid_at_time, ulid_now
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
@@ -449,6 +451,8 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Timing wheel shared by the time tracking helpers
+        self.timer_wheel: TimerWheel = TimerWheel(self.loop)
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
         self.import_executor = InterruptibleThreadPoolExecutor(
@@ -1229,7 +1233,9 @@ class HomeAssistant:
 
     def _cancel_cancellable_timers(self) -> None:
         """Cancel timer handles marked as cancellable."""
-        for handle in get_scheduled_timer_handles(self.loop):
+        for handle in chain(
+            get_scheduled_timer_handles(self.loop), self.timer_wheel.handles()
+        ):
             if (
                 not handle.cancelled()
                 and (args := handle._args)  # noqa: SLF001
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Container, Generator
+from collections.abc import Callable, Container, Generator, Hashable
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import logging
@@ -46,7 +48,7 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
     WEEKDAYS,
 )
-from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     ConditionError,
     ConditionErrorContainer,
@@ -58,6 +60,8 @@ from homeassistant.exceptions import (
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import config_validation as cv, entity_registry as er
 from .sun import get_astral_event_date
@@ -65,6 +69,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_disabled_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -96,6 +101,18 @@ INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
 
+# Number of trigger contexts for which condition results are kept
+_CONDITION_CACHE_CONTEXTS = 8
+
+DATA_CONDITION_CACHE: HassKey[
+    LimitedSizeDict[str, dict[Hashable, _CachedConditionResult]]
+] = HassKey("condition_cache")
+
+# Condition results shared within the current trigger context
+condition_cache_cv: ContextVar[dict[Hashable, _CachedConditionResult] | None] = (
+    ContextVar("condition_cache_cv", default=None)
+)
+
 
 class ConditionProtocol(Protocol):
     """Define the format of device_condition modules.
@@ -119,6 +136,92 @@ class ConditionProtocol(Protocol):
 type ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
 
 
+@dataclass(slots=True)
+class _CachedConditionResult:
+    """Result of a condition shared within a trigger context."""
+
+    result: bool
+    hits: int = 0
+
+
+@contextmanager
+def async_condition_cache(
+    hass: HomeAssistant, context: Context | None
+) -> Generator[None]:
+    """Share results of cacheable conditions evaluated for the same context.
+
+    Automations reacting to the same event are triggered with the same context,
+    conditions they have in common are then only evaluated once as long as the
+    states they depend on did not change.
+    """
+    if context is None:
+        yield
+        return
+    if (caches := hass.data.get(DATA_CONDITION_CACHE)) is None:
+        caches = hass.data[DATA_CONDITION_CACHE] = LimitedSizeDict(
+            size_limit=_CONDITION_CACHE_CONTEXTS
+        )
+    if (results := caches.get(context.id)) is None:
+        results = caches[context.id] = {}
+    token = condition_cache_cv.set(results)
+    try:
+        yield
+    finally:
+        condition_cache_cv.reset(token)
+
+
+def _freeze_config(value: Any) -> Hashable:
+    """Return a hashable version of a condition config."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_config(val)) for key, val in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze_config(val) for val in value)
+    if isinstance(value, Template):
+        return (Template, value.template)
+    return cast(Hashable, value)
+
+
+def _cacheable_condition(
+    config: ConfigType,
+    input_entity_ids: list[str],
+    checker: ConditionCheckerType,
+) -> ConditionCheckerType:
+    """Share the result of a condition which only depends on entity states."""
+    config_key = _freeze_config(config)
+    try:
+        hash(config_key)
+    except TypeError:
+        return checker
+
+    def cached_checker(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool | None:
+        if (results := condition_cache_cv.get()) is None:
+            return checker(hass, variables)
+        states = hass.states
+        cache_key = (
+            config_key,
+            *(
+                state.last_updated_timestamp
+                if (state := states.get(entity_id)) is not None
+                else None
+                for entity_id in input_entity_ids
+            ),
+        )
+        if (cached := results.get(cache_key)) is not None:
+            cached.hits += 1
+            condition_trace_set_result(
+                cached.result, cached=True, cache_hits=cached.hits
+            )
+            return cached.result
+        result = checker(hass, variables)
+        if result is not None:
+            results[cache_key] = _CachedConditionResult(result)
+        return result
+
+    return cached_checker
+
+
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
     trace_element = TraceElement(variables, path)
@@ -177,6 +280,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_disabled_cv.get():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -506,7 +611,6 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
-    @trace_condition_function
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -538,7 +642,17 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_numeric_state
+    if value_template is not None:
+        # The template may depend on variables
+        return trace_condition_function(if_numeric_state)
+
+    input_entity_ids = [
+        *entity_ids,
+        *(limit for limit in (below, above) if isinstance(limit, str)),
+    ]
+    return trace_condition_function(
+        _cacheable_condition(config, input_entity_ids, if_numeric_state)
+    )
 
 
 def state(
@@ -625,7 +739,6 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
-    @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         errors = []
@@ -652,7 +765,21 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return result
 
-    return if_state
+    if for_period is not None:
+        # The result depends on the current time
+        return trace_condition_function(if_state)
+
+    input_entity_ids = [
+        *entity_ids,
+        *(
+            req_state
+            for req_state in req_states
+            if isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state)
+        ),
+    ]
+    return trace_condition_function(
+        _cacheable_condition(config, input_entity_ids, if_state)
+    )
 
 
 def sun(
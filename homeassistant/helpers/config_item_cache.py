@@ -0,0 +1,182 @@
+"""Reuse validated config items of YAML files which did not change."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import device_registry as dr, entity_registry as er
+from .json import json_bytes
+from .typing import ConfigType
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CONFIG_ITEM_CACHES: HassKey[dict[str, ConfigItemCache[Any]]] = HassKey(
+    "helpers.config_item_cache"
+)
+
+type _ItemKey = tuple[str | None, tuple[str, ...], bytes]
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigItemCacheStats:
+    """Statistics of a config item cache."""
+
+    items: int
+    hits: int
+    misses: int
+    validate_seconds: float
+
+
+class ConfigItemCache[_T]:
+    """Remember validated config items between reloads.
+
+    Items are keyed by the YAML file they were loaded from and their content.
+    Validating the items of a domain again only validates the items which
+    were added or changed since the previous validation, the validated form
+    of the others is reused. Validation can resolve entity registry ids and
+    check devices, so the items are dropped when an entity is renamed or
+    removed, or a device is changed or removed.
+    """
+
+    def __init__(self, domain: str, reusable: Callable[[_T], bool]) -> None:
+        """Initialize the config item cache."""
+        self.domain = domain
+        self._reusable = reusable
+        self._items: dict[_ItemKey, _T] = {}
+        self._next_items: dict[_ItemKey, _T] = {}
+        self._changed_files: set[str | None] = set()
+        self._hits = 0
+        self._misses = 0
+        self._validate_seconds = 0.0
+
+    @property
+    def stats(self) -> ConfigItemCacheStats:
+        """Return statistics about the config item cache."""
+        return ConfigItemCacheStats(
+            items=len(self._items),
+            hits=self._hits,
+            misses=self._misses,
+            validate_seconds=self._validate_seconds,
+        )
+
+    async def async_validate(
+        self,
+        config: ConfigType,
+        validate: Callable[[], Awaitable[_T | None]],
+        *key: str,
+    ) -> _T | None:
+        """Validate a config item, or reuse the result of a previous validation.
+
+        The key is added to the content of the item to tell items apart
+        whose validation depends on more than their content.
+        """
+        try:
+            item_key: _ItemKey = (
+                getattr(config, "__config_file__", None),
+                key,
+                json_bytes(config),
+            )
+        except TypeError:
+            # Not serializable, so we can't tell if it changed
+            return await self._async_validate(validate)
+
+        if (validated := self._items.get(item_key)) is not None:
+            self._hits += 1
+            self._next_items[item_key] = validated
+            return validated
+
+        self._changed_files.add(item_key[0])
+        validated = await self._async_validate(validate)
+        if validated is not None and self._reusable(validated):
+            self._next_items[item_key] = validated
+        return validated
+
+    async def _async_validate(
+        self, validate: Callable[[], Awaitable[_T | None]]
+    ) -> _T | None:
+        """Validate a config item, timing the validation."""
+        self._misses += 1
+        start = monotonic()
+        try:
+            return await validate()
+        finally:
+            self._validate_seconds += monotonic() - start
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop the validated items, validating all items again next time."""
+        self._items = {}
+        self._next_items = {}
+
+    @callback
+    def async_finish(self) -> None:
+        """Finish validating the items, dropping the items which are gone."""
+        if self._changed_files:
+            _LOGGER.debug(
+                "Validated %s config from %s",
+                self.domain,
+                ", ".join(sorted(str(file) for file in self._changed_files)),
+            )
+        self._items = self._next_items
+        self._next_items = {}
+        self._changed_files = set()
+
+
+@callback
+def async_get_config_item_cache[_T](
+    hass: HomeAssistant, domain: str, reusable: Callable[[_T], bool]
+) -> ConfigItemCache[_T]:
+    """Return the config item cache of a domain."""
+    if (caches := hass.data.get(DATA_CONFIG_ITEM_CACHES)) is None:
+        caches = hass.data[DATA_CONFIG_ITEM_CACHES] = {}
+        _async_setup_registry_listeners(hass, caches)
+    if (cache := caches.get(domain)) is None:
+        cache = caches[domain] = ConfigItemCache(domain, reusable)
+    return cache
+
+
+@callback
+def _async_setup_registry_listeners(
+    hass: HomeAssistant, caches: dict[str, ConfigItemCache[Any]]
+) -> None:
+    """Clear the caches when validated items may depend on stale registry data."""
+
+    @callback
+    def _async_clear_caches(event: Event[Any]) -> None:
+        """Clear all config item caches."""
+        for cache in caches.values():
+            cache.async_clear()
+
+    @callback
+    def _entity_registry_filter(
+        event_data: er.EventEntityRegistryUpdatedData,
+    ) -> bool:
+        """Filter entity registry events which change entity ids."""
+        return event_data["action"] == "remove" or (
+            event_data["action"] == "update" and "old_entity_id" in event_data
+        )
+
+    @callback
+    def _device_registry_filter(
+        event_data: dr.EventDeviceRegistryUpdatedData,
+    ) -> bool:
+        """Filter device registry events which change or remove devices."""
+        return event_data["action"] in ("remove", "update")
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_clear_caches,
+        event_filter=_entity_registry_filter,
+    )
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_clear_caches,
+        event_filter=_device_registry_filter,
+    )
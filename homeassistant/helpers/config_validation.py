@@ -4,9 +4,12 @@
 # with PEP 695 syntax. Fixed in Python 3.13.
 # from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Callable, Hashable, Mapping
 import contextlib
 from contextvars import ContextVar
+import copy
+from dataclasses import dataclass
 from datetime import (
     date as date_sys,
     datetime as datetime_sys,
@@ -23,9 +26,11 @@ from socket import (  # type: ignore[attr-defined]  # private, not in typeshed
     _GLOBAL_DEFAULT_TIMEOUT,
 )
 import threading
+from time import monotonic
 from typing import Any, cast, overload
 from urllib.parse import urlparse
 from uuid import UUID
+import weakref
 
 import voluptuous as vol
 import voluptuous_serialize
@@ -165,6 +170,131 @@ def not_async_friendly[**_P, _R](validator: Callable[_P, _R]) -> Callable[_P, _R
     return _not_async_friendly
 
 
+MEMOIZED_SCHEMA_MAX_SIZE = 1024
+
+
+@dataclass(slots=True, frozen=True)
+class MemoizedSchemaStats:
+    """Statistics of a memoized schema."""
+
+    size: int
+    hits: int
+    misses: int
+    validate_seconds: float
+
+
+_MISSING = object()
+
+
+def _memo_key(value: Any) -> Hashable:
+    """Return a hashable key representing the structure of a config value.
+
+    Raises TypeError if the value contains something else than the types
+    YAML and JSON configs are made of.
+    """
+    if isinstance(value, dict):
+        return (
+            type(value),
+            tuple((_memo_key(key), _memo_key(item)) for key, item in value.items()),
+        )
+    if isinstance(value, list):
+        return (type(value), tuple(_memo_key(item) for item in value))
+    if value is None or isinstance(value, (str, int, float)):
+        # Include the type to tell True and 1 apart
+        return (type(value), value)
+    raise TypeError(f"Can't memoize {type(value)}")
+
+
+def _copy_containers[_T](value: _T) -> _T:
+    """Copy the dicts and lists of a validated config, sharing other values."""
+    if isinstance(value, dict):
+        value_copy = copy.copy(value)
+        for key, item in value.items():
+            value_copy[key] = _copy_containers(item)
+        return value_copy  # type: ignore[return-value]
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]  # type: ignore[return-value]
+    return value
+
+
+class MemoizedSchema(vol.Schema):
+    """Schema which remembers the result of validating a config.
+
+    Validating a config which is structurally equal to a config validated
+    before returns a copy of the earlier result instead of validating it
+    again. The results are kept per Home Assistant instance, since validated
+    templates are bound to it, and the least recently used results are
+    dropped when there are more than MEMOIZED_SCHEMA_MAX_SIZE. Only
+    validation in the event loop is memoized, and failures never are.
+    """
+
+    def __init__(
+        self, name: str, schema: Any, max_size: int = MEMOIZED_SCHEMA_MAX_SIZE
+    ) -> None:
+        """Initialize the memoized schema."""
+        super().__init__(schema)
+        self.name = name
+        self.max_size = max_size
+        self._results: weakref.WeakKeyDictionary[
+            HomeAssistant, OrderedDict[Hashable, Any]
+        ] = weakref.WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._validate_seconds = 0.0
+        _memoized_schemas[name] = self
+
+    @property
+    def stats(self) -> MemoizedSchemaStats:
+        """Return statistics about the memoized schema."""
+        return MemoizedSchemaStats(
+            size=sum(len(results) for results in self._results.values()),
+            hits=self._hits,
+            misses=self._misses,
+            validate_seconds=self._validate_seconds,
+        )
+
+    def __call__(self, data: Any) -> Any:
+        """Validate data against the schema, reusing earlier results."""
+        if (
+            not (hass := _async_get_hass_or_none())
+            or hass.loop_thread_id != threading.get_ident()
+        ):
+            return super().__call__(data)
+        try:
+            key = _memo_key(data)
+        except TypeError:
+            return super().__call__(data)
+
+        if (results := self._results.get(hass)) is None:
+            results = self._results[hass] = OrderedDict()
+        elif (result := results.get(key, _MISSING)) is not _MISSING:
+            self._hits += 1
+            results.move_to_end(key)
+            return _copy_containers(result)
+
+        self._misses += 1
+        start = monotonic()
+        try:
+            result = super().__call__(data)
+        finally:
+            self._validate_seconds += monotonic() - start
+        results[key] = _copy_containers(result)
+        if len(results) > self.max_size:
+            results.popitem(last=False)
+        return result
+
+
+# Schemas are only listed while in use
+_memoized_schemas: weakref.WeakValueDictionary[str, MemoizedSchema] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_memoized_schema_stats() -> dict[str, MemoizedSchemaStats]:
+    """Return statistics about all memoized schemas."""
+    return {name: schema.stats for name, schema in _memoized_schemas.items()}
+
+
 class UrlProtocolSchema(StrEnum):
     """Valid URL protocol schema values."""
 
@@ -1415,7 +1545,7 @@ def script_action(value: Any) -> dict:
     return ACTION_TYPE_SCHEMAS[action](value)
 
 
-SCRIPT_SCHEMA = vol.All(ensure_list, [script_action])
+SCRIPT_SCHEMA = vol.All(ensure_list, [MemoizedSchema("action", script_action)])
 
 SCRIPT_ACTION_BASE_SCHEMA: VolDictType = {
     vol.Optional(CONF_ALIAS): string,
@@ -1706,7 +1836,8 @@ CONDITION_SHORTHAND_SCHEMA = vol.Schema(
     }
 )
 
-CONDITION_SCHEMA: vol.Schema = vol.Schema(
+CONDITION_SCHEMA: vol.Schema = MemoizedSchema(
+    "condition",
     vol.Any(
         vol.All(
             expand_condition_shorthand,
@@ -1728,7 +1859,7 @@ CONDITION_SCHEMA: vol.Schema = vol.Schema(
             ),
         ),
         dynamic_template_condition_action,
-    )
+    ),
 )
 
 CONDITIONS_SCHEMA = vol.All(ensure_list, [CONDITION_SCHEMA])
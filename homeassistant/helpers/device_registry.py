@@ -584,16 +584,18 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
     def __init__(self) -> None:
         """Initialize the container.
 
-        Maintains three additional indexes:
+        Maintains four additional indexes:
 
         - area_id -> dict[key, True]
         - config_entry_id -> dict[key, True]
         - label -> dict[key, True]
+        - via_device_id -> dict[key, True]
         """
         super().__init__()
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._via_device_id_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: DeviceEntry) -> None:
         """Index an entry."""
@@ -604,6 +606,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
             self._labels_index[label][key] = True
         for config_entry_id in entry.config_entries:
             self._config_entry_id_index[config_entry_id][key] = True
+        if (via_device_id := entry.via_device_id) is not None:
+            self._via_device_id_index[via_device_id][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: DeviceEntry | None = None
@@ -617,6 +621,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
                 self._unindex_entry_value(key, label, self._labels_index)
         for config_entry_id in entry.config_entries:
             self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
+        if via_device_id := entry.via_device_id:
+            self._unindex_entry_value(key, via_device_id, self._via_device_id_index)
         super()._unindex_entry(key, replacement_entry)
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
@@ -638,6 +644,11 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
             data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
+    def get_devices_for_via_device_id(self, via_device_id: str) -> list[DeviceEntry]:
+        """Get devices connected via a device."""
+        data = self.data
+        return [data[key] for key in self._via_device_id_index.get(via_device_id, ())]
+
 
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
@@ -655,6 +666,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_sections={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -1150,9 +1162,8 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             id=device.id,
             orphaned_timestamp=None,
         )
-        for other_device in list(self.devices.values()):
-            if other_device.via_device_id == device_id:
-                self.async_update_device(other_device.id, via_device_id=None)
+        for other_device in self.devices.get_devices_for_via_device_id(device_id):
+            self.async_update_device(other_device.id, via_device_id=None)
         self.hass.bus.async_fire_internal(
             EVENT_DEVICE_REGISTRY_UPDATED,
             _EventDeviceRegistryUpdatedData_CreateRemove(
@@ -549,13 +549,14 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains seven additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+    - platform -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -567,6 +568,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._platform_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -582,6 +584,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._area_id_index[area_id][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
+        self._platform_index[entry.platform][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -599,6 +602,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -642,6 +646,11 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        data = self.data
+        return [data[key] for key in self._platform_index.get(platform, ())]
+
 
 def _validate_item(
     hass: HomeAssistant,
@@ -713,6 +722,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_sections={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
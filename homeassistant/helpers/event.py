@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
@@ -42,6 +41,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.timer_wheel import TimerWheelHandle
 
 from . import frame
 from .device_registry import (
@@ -1487,13 +1487,13 @@ class _TrackPointUTCTime:
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     utc_point_in_time: datetime
     expected_fire_timestamp: float
-    _cancel_callback: asyncio.TimerHandle | None = None
+    _cancel_callback: TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        loop = self.hass.loop
-        self._cancel_callback = loop.call_at(
-            loop.time() + self.expected_fire_timestamp - time.time(), self
+        hass = self.hass
+        self._cancel_callback = hass.timer_wheel.async_call_at(
+            hass.loop.time() + self.expected_fire_timestamp - time.time(), self
         )
 
     @callback
@@ -1512,8 +1512,10 @@ class _TrackPointUTCTime:
         # time.
         if (delta := (self.expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
-            loop = self.hass.loop
-            self._cancel_callback = loop.call_at(loop.time() + delta, self)
+            hass = self.hass
+            self._cancel_callback = hass.timer_wheel.async_call_at(
+                hass.loop.time() + delta, self
+            )
             return
 
         self.hass.async_run_hass_job(self.job, self.utc_point_in_time)
@@ -1618,7 +1620,7 @@ class _TrackTimeInterval:
     cancel_on_shutdown: bool | None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
-    _timer_handle: asyncio.TimerHandle | None = None
+    _timer_handle: TimerWheelHandle | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1640,9 +1642,8 @@ class _TrackTimeInterval:
         if TYPE_CHECKING:
             assert self._track_job is not None
         hass = self.hass
-        loop = hass.loop
-        self._timer_handle = loop.call_at(
-            loop.time() + self.seconds, self._interval_listener, self._track_job
+        self._timer_handle = hass.timer_wheel.async_call_at(
+            hass.loop.time() + self.seconds, self._interval_listener, self._track_job
         )
 
     @callback
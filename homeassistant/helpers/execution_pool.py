@@ -0,0 +1,252 @@
+"""Named execution pools bounding concurrent work across scripts."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_EXECUTION_POOLS: HassKey[dict[str, ExecutionPool]] = HassKey(
+    "helpers.execution_pool"
+)
+
+# Names of the execution pools a slot is held of, inherited by the tasks
+# started while holding it
+_held_pools_cv: ContextVar[frozenset[str]] = ContextVar(
+    "_held_pools_cv", default=frozenset()
+)
+
+type _Limits = tuple[int, float | None, int | None]
+
+
+class ExecutionPoolTimeoutError(HomeAssistantError):
+    """Error to indicate no slot of an execution pool became available in time."""
+
+
+class ExecutionPoolFullError(HomeAssistantError):
+    """Error to indicate the queue of an execution pool is full."""
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionPoolStats:
+    """Statistics of an execution pool."""
+
+    running: int
+    queued: int
+    max_queued: int
+    completed: int
+    timeouts: int
+    rejected: int
+    mean_wait: float
+
+
+class ExecutionPool:
+    """Bound the number of concurrent runs sharing a name.
+
+    Waiters are queued per owner and woken round robin between owners, so a
+    burst from one script does not starve the others. Runs started while
+    holding a slot, like a script calling another script sharing the pool,
+    share that slot instead of waiting for one, which could deadlock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        timeout: float | None = None,
+        max_queued: int | None = None,
+    ) -> None:
+        """Initialize the execution pool."""
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.max_queued = max_queued
+        self._definitions: dict[str, _Limits] = {}
+        self._running = 0
+        self._queues: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+        self._queued = 0
+        self._max_queued_seen = 0
+        self._completed = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._waited = 0
+        self._wait_total = 0.0
+
+    @property
+    def stats(self) -> ExecutionPoolStats:
+        """Return statistics about the execution pool."""
+        return ExecutionPoolStats(
+            running=self._running,
+            queued=self._queued,
+            max_queued=self._max_queued_seen,
+            completed=self._completed,
+            timeouts=self._timeouts,
+            rejected=self._rejected,
+            mean_wait=self._wait_total / self._waited if self._waited else 0.0,
+        )
+
+    @callback
+    def async_define(
+        self,
+        owner: str,
+        max_concurrent: int,
+        timeout: float | None,
+        max_queued: int | None,
+    ) -> bool:
+        """Define the limits of the execution pool for an owner.
+
+        All owners must define the same limits, an owner can only change them
+        if no other owner defines the pool. Return False if the definition
+        conflicts with the one of other owners, it is then not applied.
+        """
+        limits = (max_concurrent, timeout, max_queued)
+        if any(
+            other != owner and defined != limits
+            for other, defined in self._definitions.items()
+        ):
+            return False
+        self._definitions[owner] = limits
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.max_queued = max_queued
+        self._wake_next()
+        return True
+
+    @callback
+    def async_undefine(self, owner: str) -> None:
+        """Remove the definition of an owner which no longer uses the pool.
+
+        The pool keeps its limits until an owner defines it again.
+        """
+        self._definitions.pop(owner, None)
+
+    @asynccontextmanager
+    async def async_slot(self, owner: str) -> AsyncGenerator[None]:
+        """Hold a slot of the execution pool, waiting for one if needed."""
+        held = _held_pools_cv.get()
+        if self.name in held:
+            yield
+            return
+        await self._async_acquire(owner)
+        token = _held_pools_cv.set(held | {self.name})
+        try:
+            yield
+        finally:
+            _held_pools_cv.reset(token)
+            self._running -= 1
+            self._completed += 1
+            self._wake_next()
+
+    async def _async_acquire(self, owner: str) -> None:
+        """Take a slot of the execution pool."""
+        if self._running < self.max_concurrent and not self._queued:
+            self._running += 1
+            return
+        if self.max_queued is not None and self._queued >= self.max_queued:
+            self._rejected += 1
+            raise ExecutionPoolFullError(
+                f"Execution pool {self.name} has {self._queued} queued runs"
+            )
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        if (queue := self._queues.get(owner)) is None:
+            queue = self._queues[owner] = deque()
+        queue.append(future)
+        self._queued += 1
+        self._max_queued_seen = max(self._queued, self._max_queued_seen)
+        start = loop.time()
+        try:
+            async with asyncio.timeout(self.timeout):
+                await future
+        except BaseException as err:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before we were interrupted
+                self._running -= 1
+                self._wake_next()
+            else:
+                self._discard(owner, future)
+            if isinstance(err, TimeoutError):
+                self._timeouts += 1
+                raise ExecutionPoolTimeoutError(
+                    f"Timed out waiting for execution pool {self.name}"
+                ) from err
+            raise
+        self._waited += 1
+        self._wait_total += loop.time() - start
+
+    def _discard(self, owner: str, future: asyncio.Future[None]) -> None:
+        """Remove a waiter which gave up from the queue."""
+        if (queue := self._queues.get(owner)) is None or future not in queue:
+            return
+        queue.remove(future)
+        self._queued -= 1
+        if not queue:
+            del self._queues[owner]
+
+    def _wake_next(self) -> None:
+        """Hand free slots to the next waiters, round robin between owners."""
+        queues = self._queues
+        while queues and self._running < self.max_concurrent:
+            owner, queue = next(iter(queues.items()))
+            future = queue.popleft()
+            self._queued -= 1
+            if queue:
+                queues.move_to_end(owner)
+            else:
+                del queues[owner]
+            if future.done():
+                continue
+            future.set_result(None)
+            self._running += 1
+
+
+@callback
+def async_get_execution_pool(
+    hass: HomeAssistant,
+    name: str,
+    owner: str,
+    max_concurrent: int,
+    timeout: float | None = None,
+    max_queued: int | None = None,
+) -> ExecutionPool:
+    """Return the execution pool with a name, defining it for an owner.
+
+    A definition conflicting with the one of other owners is rejected, the
+    pool then keeps its limits.
+    """
+    pools = hass.data.setdefault(DATA_EXECUTION_POOLS, {})
+    if (pool := pools.get(name)) is None:
+        pool = pools[name] = ExecutionPool(name, max_concurrent, timeout, max_queued)
+    if not pool.async_define(owner, max_concurrent, timeout, max_queued):
+        _LOGGER.error(
+            "Execution pool %s is defined with other limits than by %s, "
+            "keeping max %s, timeout %s and max_queued %s",
+            name,
+            owner,
+            pool.max_concurrent,
+            pool.timeout,
+            pool.max_queued,
+        )
+    return pool
+
+
+@callback
+def async_get_execution_pool_stats(
+    hass: HomeAssistant,
+) -> dict[str, ExecutionPoolStats]:
+    """Return statistics about all execution pools."""
+    return {
+        name: pool.stats
+        for name, pool in hass.data.get(DATA_EXECUTION_POOLS, {}).items()
+    }
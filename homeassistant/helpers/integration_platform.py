@@ -27,6 +27,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_INTEGRATION_PLATFORMS: HassKey[list[IntegrationPlatform]] = HassKey(
     "integration_platforms"
 )
+DATA_ON_DEMAND_PLATFORMS: HassKey[dict[str, asyncio.Future[None]]] = HassKey(
+    "integration_platforms_on_demand"
+)
 
 
 @dataclass(slots=True, frozen=True)
@@ -218,6 +221,57 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_process_integration_platforms_on_demand(
+    hass: HomeAssistant,
+    platform_name: str,
+    # Any = platform.
+    process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
+) -> None:
+    """Process a specific platform the first time it is needed.
+
+    Platforms which are rarely used are not preloaded with their integration.
+    The first caller processes the platform for all loaded integrations and
+    registers it for future ones, later callers wait for that to finish.
+    """
+    futures = hass.data.setdefault(DATA_ON_DEMAND_PLATFORMS, {})
+    if (future := futures.get(platform_name)) is not None:
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The caller processing the platform was cancelled, try again
+            await async_process_integration_platforms_on_demand(
+                hass, platform_name, process_platform
+            )
+        return
+
+    future = futures[platform_name] = hass.loop.create_future()
+    registered = list(hass.data.get(DATA_INTEGRATION_PLATFORMS, ()))
+    try:
+        await async_process_integration_platforms(
+            hass, platform_name, process_platform, wait_for_platforms=True
+        )
+    except BaseException as err:
+        # Forget the platform so that the next caller processes it again
+        del futures[platform_name]
+        if integration_platforms := hass.data.get(DATA_INTEGRATION_PLATFORMS):
+            integration_platforms[:] = [
+                integration_platform
+                for integration_platform in integration_platforms
+                if integration_platform.platform_name != platform_name
+                or any(integration_platform is known for known in registered)
+            ]
+        if isinstance(err, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(err)
+            # Don't log the exception if no other caller waited for it
+            future.exception()
+        raise
+    future.set_result(None)
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
     platform_name: str,
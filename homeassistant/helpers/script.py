@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -49,6 +49,7 @@ from homeassistant.const import (
     CONF_FOR_EACH,
     CONF_IF,
     CONF_MODE,
+    CONF_NAME,
     CONF_PARALLEL,
     CONF_REPEAT,
     CONF_RESPONSE_VARIABLE,
@@ -67,6 +68,8 @@ from homeassistant.const import (
     CONF_WAIT_FOR_TRIGGER,
     CONF_WAIT_TEMPLATE,
     CONF_WHILE,
+    ENTITY_MATCH_ALL,
+    ENTITY_MATCH_NONE,
     EVENT_HOMEASSISTANT_STOP,
     SERVICE_TURN_ON,
 )
@@ -79,6 +82,7 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
@@ -90,6 +94,7 @@ from . import condition, config_validation as cv, service, template
 from .condition import ConditionCheckerType, trace_condition_function
 from .dispatcher import async_dispatcher_connect, async_dispatcher_send_internal
 from .event import async_call_later, async_track_template
+from .execution_pool import ExecutionPool, async_get_execution_pool
 from .script_variables import ScriptVariables
 from .template import Template
 from .trace import (
@@ -97,6 +102,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_disabled_cv,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -130,6 +136,10 @@ CONF_MAX_EXCEEDED = "max_exceeded"
 _MAX_EXCEEDED_CHOICES = [*LOGSEVERITY, "SILENT"]
 DEFAULT_MAX_EXCEEDED = "WARNING"
 
+CONF_EXECUTION_POOL = "execution_pool"
+CONF_MAX_QUEUED = "max_queued"
+DEFAULT_EXECUTION_POOL_MAX = 4
+
 ATTR_CUR = "current"
 ATTR_MAX = "max"
 
@@ -259,6 +269,18 @@ async def trace_action(
         trace_stack_pop(trace_stack_cv)
 
 
+EXECUTION_POOL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Optional(CONF_MAX, default=DEFAULT_EXECUTION_POOL_MAX): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_TIMEOUT): cv.positive_time_period,
+        vol.Optional(CONF_MAX_QUEUED): cv.positive_int,
+    }
+)
+
+
 def make_script_schema(
     schema: Mapping[Any, Any], default_script_mode: str, extra: int = vol.PREVENT_EXTRA
 ) -> vol.Schema:
@@ -275,6 +297,7 @@ def make_script_schema(
             vol.Optional(CONF_MAX_EXCEEDED, default=DEFAULT_MAX_EXCEEDED): vol.All(
                 vol.Upper, vol.In(_MAX_EXCEEDED_CHOICES)
             ),
+            vol.Optional(CONF_EXECUTION_POOL): EXECUTION_POOL_SCHEMA,
         },
         extra=extra,
     )
@@ -402,10 +425,23 @@ class _StopScript(_HaltScript):
         self.response = response
 
 
+async def _async_run_in_pool[_T](
+    pool: ExecutionPool, owner: str, coro: Coroutine[Any, Any, _T]
+) -> _T:
+    """Run a coroutine holding a slot of an execution pool."""
+    try:
+        async with pool.async_slot(owner):
+            return await coro
+    finally:
+        # Close the coroutine if waiting for a slot was interrupted
+        coro.close()
+
+
 class _ScriptRun:
     """Manage Script sequence run."""
 
     _action: dict[str, Any]
+    _script_step: _ScriptStep
 
     def __init__(
         self,
@@ -457,7 +493,10 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            for self._step, self._script_step in enumerate(
+                self._script._get_plan()  # noqa: SLF001
+            ):
+                self._action = self._script_step.action
                 if self._stop.done():
                     script_execution_set("cancelled")
                     break
@@ -491,46 +530,48 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        if trace_disabled_cv.get():
+            # The trace is thrown away, don't build it
+            await self._async_run_step(log_exceptions)
+            return
 
         with trace_path(str(self._step)):
             async with trace_action(
                 self._hass, self, self._stop, self._variables
             ) as trace_element:
-                if self._stop.done():
-                    return
-
-                action = cv.determine_script_action(self._action)
-
-                if CONF_ENABLED in self._action:
-                    enabled = self._action[CONF_ENABLED]
-                    if isinstance(enabled, Template):
-                        try:
-                            enabled = enabled.async_render(limited=True)
-                        except exceptions.TemplateError as ex:
-                            self._handle_exception(
-                                ex,
-                                continue_on_error,
-                                self._log_exceptions or log_exceptions,
-                            )
-                    if not enabled:
-                        self._log(
-                            "Skipped disabled step %s",
-                            self._action.get(CONF_ALIAS, action),
-                        )
-                        trace_set_result(enabled=False)
-                        return
-
-                handler = f"_async_{action}_step"
                 try:
-                    await getattr(self, handler)()
-                except Exception as ex:  # noqa: BLE001
-                    self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
-                    )
+                    await self._async_run_step(log_exceptions)
                 finally:
                     trace_element.update_variables(self._variables)
 
+    async def _async_run_step(self, log_exceptions: bool) -> None:
+        if self._stop.done():
+            return
+
+        step = self._script_step
+        enabled = step.enabled
+        if isinstance(enabled, Template):
+            try:
+                enabled = enabled.async_render(limited=True)
+            except exceptions.TemplateError as ex:
+                self._handle_exception(
+                    ex, step.continue_on_error, self._log_exceptions or log_exceptions
+                )
+        if not enabled:
+            self._log(
+                "Skipped disabled step %s",
+                self._action.get(CONF_ALIAS, step.action_type),
+            )
+            trace_set_result(enabled=False)
+            return
+
+        try:
+            await step.handler(self)
+        except Exception as ex:  # noqa: BLE001
+            self._handle_exception(
+                ex, step.continue_on_error, self._log_exceptions or log_exceptions
+            )
+
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
         if not self._script.is_running:
@@ -581,7 +622,7 @@ class _ScriptRun:
             raise exception
 
     def _log_exception(self, exception: Exception) -> None:
-        action_type = cv.determine_script_action(self._action)
+        action_type = self._script_step.action_type
 
         error = str(exception)
         level = logging.ERROR
@@ -728,13 +769,32 @@ class _ScriptRun:
         except ScriptStoppedError as ex:
             raise asyncio.CancelledError from ex
 
+    async def _async_run_pooled[_T](self, coro: Coroutine[Any, Any, _T]) -> _T | None:
+        """Run an action in the execution pool of the script, if it has one."""
+        if (pool := self._script.execution_pool) is None:
+            return await coro
+        return await self._async_run_long_action(
+            self._hass.async_create_task_internal(
+                _async_run_in_pool(pool, self._script.name, coro), eager_start=True
+            )
+        )
+
     async def _async_call_service_step(self) -> None:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        if (static_params := self._script_step.service_params) is not None:
+            # The service call does not depend on variables, only copy the
+            # parts which are mutated by the service registry
+            params: service.ServiceParams = {
+                **static_params,
+                "service_data": dict(static_params["service_data"]),
+                "target": dict(static_params["target"]),
+            }
+        else:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -761,16 +821,16 @@ class _ScriptRun:
             or params[CONF_DOMAIN] in ("python_script", "script")
         )
         trace_set_result(params=params, running_script=running_script)
+        call = self._hass.services.async_call(
+            **params,
+            blocking=True,
+            context=self._context,
+            return_response=return_response,
+        )
+        if (pool := self._script.execution_pool) is not None:
+            call = _async_run_in_pool(pool, self._script.name, call)
         response_data = await self._async_run_long_action(
-            self._hass.async_create_task_internal(
-                self._hass.services.async_call(
-                    **params,
-                    blocking=True,
-                    context=self._context,
-                    return_response=return_response,
-                ),
-                eager_start=True,
-            )
+            self._hass.async_create_task_internal(call, eager_start=True)
         )
         if response_variable:
             self._variables[response_variable] = response_data
@@ -778,20 +838,24 @@ class _ScriptRun:
     async def _async_device_step(self) -> None:
         """Perform the device automation specified in the action."""
         self._step_log("device automation")
-        await device_action.async_call_action_from_config(
-            self._hass, self._action, self._variables, self._context
+        await self._async_run_pooled(
+            device_action.async_call_action_from_config(
+                self._hass, self._action, self._variables, self._context
+            )
         )
 
     async def _async_scene_step(self) -> None:
         """Activate the scene specified in the action."""
         self._step_log("activate scene")
         trace_set_result(scene=self._action[CONF_SCENE])
-        await self._hass.services.async_call(
-            scene.DOMAIN,
-            SERVICE_TURN_ON,
-            {ATTR_ENTITY_ID: self._action[CONF_SCENE]},
-            blocking=True,
-            context=self._context,
+        await self._async_run_pooled(
+            self._hass.services.async_call(
+                scene.DOMAIN,
+                SERVICE_TURN_ON,
+                {ATTR_ENTITY_ID: self._action[CONF_SCENE]},
+                blocking=True,
+                context=self._context,
+            )
         )
 
     async def _async_event_step(self) -> None:
@@ -1371,6 +1435,63 @@ def _referenced_extract_ids(data: Any, key: str, found: set[str]) -> None:
             found.add(item_id)
 
 
+@dataclass(slots=True, frozen=True)
+class _ScriptStep:
+    """Script action with its handler and static parts resolved ahead of runs."""
+
+    action: dict[str, Any]
+    action_type: str
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    continue_on_error: bool
+    enabled: bool | Template
+    service_params: service.ServiceParams | None
+
+
+def _static_service_params(
+    hass: HomeAssistant, action: dict[str, Any]
+) -> service.ServiceParams | None:
+    """Prepare a service call which does not depend on variables, if possible."""
+    if template.is_complex(action):
+        return None
+    # Entity registry ids are resolved to entity ids when preparing the call,
+    # which may change so they have to be resolved on every run
+    entity_ids = action.get(CONF_TARGET, {}).get(ATTR_ENTITY_ID)
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    if entity_ids and not all(
+        isinstance(entity_id, str)
+        and (
+            valid_entity_id(entity_id)
+            or entity_id in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)
+        )
+        for entity_id in entity_ids
+    ):
+        return None
+    try:
+        return service.async_prepare_call_from_config(hass, action)
+    except (exceptions.HomeAssistantError, vol.Invalid):
+        # Let the run raise the error
+        return None
+
+
+def _compile_step(hass: HomeAssistant, action: dict[str, Any]) -> _ScriptStep:
+    """Resolve the handler and the static parts of a script action."""
+    action_type = cv.determine_script_action(action)
+    enabled = action.get(CONF_ENABLED, True)
+    return _ScriptStep(
+        action=action,
+        action_type=action_type,
+        handler=getattr(_ScriptRun, f"_async_{action_type}_step"),
+        continue_on_error=action.get(CONF_CONTINUE_ON_ERROR, False),
+        enabled=enabled,
+        service_params=(
+            _static_service_params(hass, action)
+            if action_type == cv.SCRIPT_ACTION_CALL_SERVICE and enabled is not False
+            else None
+        ),
+    )
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -1404,6 +1525,7 @@ class Script:
         # Used in "Running <running_description>" log message
         change_listener: Callable[[], Any] | None = None,
         copy_variables: bool = False,
+        execution_pool: ConfigType | None = None,
         log_exceptions: bool = True,
         logger: logging.Logger | None = None,
         max_exceeded: str = DEFAULT_MAX_EXCEEDED,
@@ -1448,6 +1570,19 @@ class Script:
         self._runs: list[_ScriptRun] = []
         self.max_runs = max_runs
         self._max_exceeded = max_exceeded
+        self._execution_pool_config = execution_pool
+        self._execution_pool_owner = f"{domain}.{name}"
+        self.execution_pool: ExecutionPool | None = None
+        if execution_pool is not None:
+            timeout: timedelta | None = execution_pool.get(CONF_TIMEOUT)
+            self.execution_pool = async_get_execution_pool(
+                hass,
+                execution_pool[CONF_NAME],
+                self._execution_pool_owner,
+                execution_pool[CONF_MAX],
+                None if timeout is None else timeout.total_seconds(),
+                execution_pool.get(CONF_MAX_QUEUED),
+            )
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: dict[frozenset[tuple[str, str]], ConditionCheckerType] = {}
@@ -1456,6 +1591,7 @@ class Script:
         self._if_data: dict[int, _IfData] = {}
         self._parallel_scripts: dict[int, list[Script]] = {}
         self._sequence_scripts: dict[int, Script] = {}
+        self._plan: list[_ScriptStep] | None = None
         self.variables = variables
         self._variables_dynamic = template.is_complex(variables)
         self._copy_variables_on_run = copy_variables
@@ -1820,6 +1956,18 @@ class Script:
             return
         await asyncio.shield(create_eager_task(self._async_stop(aws, update_state)))
 
+    @callback
+    def async_release(self) -> None:
+        """Release what the script shares with other scripts when discarding it."""
+        if self.execution_pool is not None:
+            self.execution_pool.async_undefine(self._execution_pool_owner)
+
+    def _get_plan(self) -> list[_ScriptStep]:
+        """Return the sequence compiled to script steps."""
+        if self._plan is None:
+            self._plan = [_compile_step(self._hass, action) for action in self.sequence]
+        return self._plan
+
     async def _async_get_condition(self, config: ConfigType) -> ConditionCheckerType:
         config_cache_key = frozenset((k, str(v)) for k, v in config.items())
         if not (cond := self._config_cache.get(config_cache_key)):
@@ -1838,6 +1986,7 @@ class Script:
             running_description=self.running_description,
             script_mode=SCRIPT_MODE_PARALLEL,
             max_runs=self.max_runs,
+            execution_pool=self._execution_pool_config,
             logger=self._logger,
             top_level=False,
         )
@@ -1868,6 +2017,7 @@ class Script:
                 running_description=self.running_description,
                 script_mode=SCRIPT_MODE_PARALLEL,
                 max_runs=self.max_runs,
+                execution_pool=self._execution_pool_config,
                 logger=self._logger,
                 top_level=False,
             )
@@ -1886,6 +2036,7 @@ class Script:
                 running_description=self.running_description,
                 script_mode=SCRIPT_MODE_PARALLEL,
                 max_runs=self.max_runs,
+                execution_pool=self._execution_pool_config,
                 logger=self._logger,
                 top_level=False,
             )
@@ -1920,6 +2071,7 @@ class Script:
             running_description=self.running_description,
             script_mode=SCRIPT_MODE_PARALLEL,
             max_runs=self.max_runs,
+            execution_pool=self._execution_pool_config,
             logger=self._logger,
             top_level=False,
         )
@@ -1934,6 +2086,7 @@ class Script:
                 running_description=self.running_description,
                 script_mode=SCRIPT_MODE_PARALLEL,
                 max_runs=self.max_runs,
+                execution_pool=self._execution_pool_config,
                 logger=self._logger,
                 top_level=False,
             )
@@ -1969,6 +2122,7 @@ class Script:
                 running_description=self.running_description,
                 script_mode=SCRIPT_MODE_PARALLEL,
                 max_runs=self.max_runs,
+                execution_pool=self._execution_pool_config,
                 logger=self._logger,
                 top_level=False,
                 copy_variables=True,
@@ -1999,6 +2153,7 @@ class Script:
             running_description=self.running_description,
             script_mode=SCRIPT_MODE_PARALLEL,
             max_runs=self.max_runs,
+            execution_pool=self._execution_pool_config,
             logger=self._logger,
             top_level=False,
         )
@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -76,6 +77,11 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
+TARGET_RESOLUTION_CACHE: HassKey[_TargetResolutionCache] = HassKey(
+    "target_resolution_cache"
+)
+TARGET_RESOLUTION_CACHE_MAX_SIZE = 256
+
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
@@ -502,7 +508,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,6 +532,147 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    resolved = _async_get_target_resolution_cache(hass).async_resolve(selector)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _ResolvedTargets:
+    """Entities, devices and areas a target selector resolves to."""
+
+    indirectly_referenced: frozenset[str]
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+    missing_floors: frozenset[str]
+    missing_labels: frozenset[str]
+    referenced_devices: frozenset[str]
+    referenced_areas: frozenset[str]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class TargetResolutionCacheStats:
+    """Statistics of the target resolution cache."""
+
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of resolutions served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
+
+
+class _TargetResolutionCache:
+    """Cache what device, area, floor and label targets resolve to.
+
+    The cache is cleared when any of the registries the resolution is based
+    on is updated or replaced.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the target resolution cache."""
+        self._hass = hass
+        self._resolved: dict[_TargetKey, _ResolvedTargets] = {}
+        self._registries: tuple[object, ...] = ()
+        self._hits = 0
+        self._misses = 0
+        for event_type in (
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_invalidate)
+
+    @property
+    def stats(self) -> TargetResolutionCacheStats:
+        """Return statistics about the target resolution cache."""
+        return TargetResolutionCacheStats(
+            size=len(self._resolved), hits=self._hits, misses=self._misses
+        )
+
+    @callback
+    def _async_invalidate(self, _event: Event[Any]) -> None:
+        """Clear the cache when a registry was updated."""
+        self._resolved.clear()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> _ResolvedTargets:
+        """Resolve the device, area, floor and label targets of a selector."""
+        hass = self._hass
+        registries = (
+            entity_registry.async_get(hass),
+            device_registry.async_get(hass),
+            area_registry.async_get(hass),
+            floor_registry.async_get(hass),
+            label_registry.async_get(hass),
+        )
+        if registries != self._registries:
+            self._registries = registries
+            self._resolved.clear()
+
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (resolved := self._resolved.get(key)) is not None:
+            self._hits += 1
+            return resolved
+
+        self._misses += 1
+        if len(self._resolved) >= TARGET_RESOLUTION_CACHE_MAX_SIZE:
+            del self._resolved[next(iter(self._resolved))]
+        selected = _async_resolve_targets(hass, selector)
+        resolved = self._resolved[key] = _ResolvedTargets(
+            frozenset(selected.indirectly_referenced),
+            frozenset(selected.missing_devices),
+            frozenset(selected.missing_areas),
+            frozenset(selected.missing_floors),
+            frozenset(selected.missing_labels),
+            frozenset(selected.referenced_devices),
+            frozenset(selected.referenced_areas),
+        )
+        return resolved
+
+
+@callback
+def _async_get_target_resolution_cache(hass: HomeAssistant) -> _TargetResolutionCache:
+    """Return the target resolution cache."""
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        cache = hass.data[TARGET_RESOLUTION_CACHE] = _TargetResolutionCache(hass)
+    return cache
+
+
+@callback
+def async_get_target_resolution_stats(
+    hass: HomeAssistant,
+) -> TargetResolutionCacheStats:
+    """Return statistics about the target resolution cache."""
+    return _async_get_target_resolution_cache(hass).stats
+
+
+@callback
+def _async_resolve_targets(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label targets of a selector."""
+    selected = SelectedEntities()
+
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -1153,10 +1300,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.entities.get_entries_for_platform(domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
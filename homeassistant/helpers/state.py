@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import lru_cache
 import logging
 from types import ModuleType
 from typing import Any
@@ -25,6 +26,22 @@ from homeassistant.loader import IntegrationNotFound, async_get_integration, bin
 
 _LOGGER = logging.getLogger(__name__)
 
+STATE_NUMBERS_CACHE_SIZE = 8192
+
+_STATES_AS_ONE = frozenset(
+    (STATE_ON, LockState.LOCKED, STATE_ABOVE_HORIZON, STATE_OPEN, STATE_HOME)
+)
+_STATES_AS_ZERO = frozenset(
+    (
+        STATE_OFF,
+        LockState.UNLOCKED,
+        STATE_UNKNOWN,
+        STATE_BELOW_HORIZON,
+        STATE_CLOSED,
+        STATE_NOT_HOME,
+    )
+)
+
 
 @bind_hass
 async def async_reproduce_state(
@@ -76,22 +93,28 @@ def state_as_number(state: State) -> float:
 
     Raises ValueError if this is not possible.
     """
-    if state.state in (
-        STATE_ON,
-        LockState.LOCKED,
-        STATE_ABOVE_HORIZON,
-        STATE_OPEN,
-        STATE_HOME,
-    ):
+    if state.state in _STATES_AS_ONE:
         return 1
-    if state.state in (
-        STATE_OFF,
-        LockState.UNLOCKED,
-        STATE_UNKNOWN,
-        STATE_BELOW_HORIZON,
-        STATE_CLOSED,
-        STATE_NOT_HOME,
-    ):
+    if state.state in _STATES_AS_ZERO:
         return 0
 
     return float(state.state)
+
+
+@lru_cache(maxsize=STATE_NUMBERS_CACHE_SIZE)
+def state_value_as_numbers(value: str) -> tuple[float | None, float | None]:
+    """Coerce the value of a state to a float and to a number.
+
+    The float is None if the value is not numeric, the number is None if
+    state_as_number can't coerce the value either. The results are cached,
+    this is meant for converting the states of many entities.
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        if value in _STATES_AS_ONE:
+            return None, 1
+        if value in _STATES_AS_ZERO:
+            return None, 0
+        return None, None
+    return number, number
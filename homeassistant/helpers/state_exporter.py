@@ -0,0 +1,275 @@
+"""Shared pipeline handing state changes to exporters in batches."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .entityfilter import EntityFilter
+from .event import threaded_listener_factory
+from .state import state_value_as_numbers
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_EXPORTERS: HassKey[StateExporterPipeline] = HassKey("helpers.state_exporter")
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_QUEUED = 10000
+
+type StateExporterSink = Callable[[list[StateRecord]], Coroutine[Any, Any, None] | None]
+
+
+@dataclass(slots=True, frozen=True)
+class StateRecord:
+    """A state change handed to exporters."""
+
+    entity_id: str
+    old_state: State | None
+    new_state: State | None
+    time_fired_timestamp: float
+    # The new state as a float, None if it's not numeric
+    value: float | None
+    # The new state as a number like state_as_number, None if not possible
+    number: float | None
+
+    @property
+    def time_fired(self) -> datetime:
+        """Return the time the state changed."""
+        return dt_util.utc_from_timestamp(self.time_fired_timestamp)
+
+
+@dataclass(slots=True, frozen=True)
+class StateExporterStats:
+    """Statistics of a state exporter."""
+
+    exported: int
+    batches: int
+    queued: int
+    dropped: int
+
+
+class StateExporter:
+    """Queue the state changes of one exporter and hand them over in batches.
+
+    Only one batch is handed to the sink at a time, state changes coming in
+    meanwhile are queued and handed over with the next batch. When the queue
+    is full the oldest state changes are dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        sink: StateExporterSink,
+        entity_filter: Callable[[str], bool] | None,
+        batch_size: int,
+        flush_interval: float,
+        max_queued: int,
+    ) -> None:
+        """Initialize the state exporter."""
+        self.hass = hass
+        self.name = name
+        self.entity_filter = entity_filter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._job = HassJob(sink, f"state exporter {name}")
+        self._queue: deque[StateRecord] = deque(maxlen=max_queued)
+        self._flush_handle: asyncio.Handle | None = None
+        self._flushing: asyncio.Future[Any] | None = None
+        self._exported = 0
+        self._batches = 0
+        self._dropped = 0
+
+    @property
+    def stats(self) -> StateExporterStats:
+        """Return statistics about the state exporter."""
+        return StateExporterStats(
+            exported=self._exported,
+            batches=self._batches,
+            queued=len(self._queue),
+            dropped=self._dropped,
+        )
+
+    @callback
+    def async_add(self, record: StateRecord) -> None:
+        """Queue a state change for the sink."""
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self._dropped += 1
+        queue.append(record)
+        if self._flushing is not None:
+            return
+        if len(queue) >= self.batch_size:
+            self._async_cancel_flush()
+            self._async_flush()
+        elif self._flush_handle is None:
+            loop = self.hass.loop
+            if self.flush_interval:
+                self._flush_handle = loop.call_at(
+                    loop.time() + self.flush_interval, self._async_flush
+                )
+            else:
+                # Hand over the state changes of this loop iteration together
+                self._flush_handle = loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_cancel_flush(self) -> None:
+        """Cancel a scheduled flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    @callback
+    def _async_flush(self) -> None:
+        """Hand a batch of queued state changes to the sink."""
+        self._flush_handle = None
+        queue = self._queue
+        while queue and self._flushing is None:
+            batch_size = min(len(queue), self.batch_size)
+            batch = [queue.popleft() for _ in range(batch_size)]
+            self._exported += batch_size
+            self._batches += 1
+            try:
+                result = self.hass.async_run_hass_job(self._job, batch)
+            except Exception:
+                _LOGGER.exception("Error exporting states to %s", self.name)
+                continue
+            if result is not None:
+                self._flushing = result
+                result.add_done_callback(self._async_flush_done)
+
+    @callback
+    def _async_flush_done(self, future: asyncio.Future[Any]) -> None:
+        """Hand over the state changes queued while the sink was busy."""
+        self._flushing = None
+        if not future.cancelled() and (err := future.exception()) is not None:
+            _LOGGER.error(
+                "Error exporting states to %s",
+                self.name,
+                exc_info=(type(err), err, err.__traceback__),
+            )
+        self._async_flush()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop handing over state changes."""
+        self._async_cancel_flush()
+        self._queue.clear()
+
+
+class StateExporterPipeline:
+    """Listen to state changes once for all state exporters."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pipeline."""
+        self.hass = hass
+        self.exporters: list[StateExporter] = []
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, exporter: StateExporter) -> CALLBACK_TYPE:
+        """Add an exporter to the pipeline."""
+        self.exporters.append(exporter)
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+        @callback
+        def _async_remove() -> None:
+            """Remove the exporter from the pipeline."""
+            self.exporters.remove(exporter)
+            exporter.async_shutdown()
+            if not self.exporters and self._unsub_state_changed is not None:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+
+        return _async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Hand a state change to the exporters which want it."""
+        entity_id = event.data["entity_id"]
+        record: StateRecord | None = None
+        for exporter in self.exporters:
+            if exporter.entity_filter is not None and not exporter.entity_filter(
+                entity_id
+            ):
+                continue
+            if record is None:
+                new_state = event.data["new_state"]
+                value, number = (
+                    (None, None)
+                    if new_state is None
+                    else state_value_as_numbers(new_state.state)
+                )
+                record = StateRecord(
+                    entity_id,
+                    event.data["old_state"],
+                    new_state,
+                    event.time_fired_timestamp,
+                    value,
+                    number,
+                )
+            exporter.async_add(record)
+
+
+@callback
+def async_register_state_exporter(
+    hass: HomeAssistant,
+    name: str,
+    sink: StateExporterSink,
+    entity_filter: Callable[[str], bool] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    flush_interval: float = 0,
+    max_queued: int = DEFAULT_MAX_QUEUED,
+) -> CALLBACK_TYPE:
+    """Hand the state changes of the entities passing a filter to a sink.
+
+    The sink is called with batches of state changes, in the order they
+    happened. It can be a callback, a coroutine function or a function run
+    in the executor. Returns a function to stop exporting.
+    """
+    if isinstance(entity_filter, EntityFilter):
+        # Call the cached filter function directly, it runs for every state change
+        entity_filter = (
+            None if entity_filter.empty_filter else entity_filter.get_filter()
+        )
+    if (pipeline := hass.data.get(DATA_STATE_EXPORTERS)) is None:
+        pipeline = hass.data[DATA_STATE_EXPORTERS] = StateExporterPipeline(hass)
+    return pipeline.async_add(
+        StateExporter(
+            hass, name, sink, entity_filter, batch_size, flush_interval, max_queued
+        )
+    )
+
+
+register_state_exporter = threaded_listener_factory(async_register_state_exporter)
+
+
+@callback
+def async_get_state_exporter_stats(
+    hass: HomeAssistant,
+) -> dict[str, StateExporterStats]:
+    """Return statistics about all state exporters."""
+    if (pipeline := hass.data.get(DATA_STATE_EXPORTERS)) is None:
+        return {}
+    return {exporter.name: exporter.stats for exporter in pipeline.exporters}
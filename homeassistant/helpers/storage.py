@@ -9,13 +9,17 @@ from copy import deepcopy
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
 import os
 from pathlib import Path
+import sys
 from typing import Any
+import zlib
 
 from propcache import cached_property
 
 from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
@@ -32,8 +36,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -49,6 +54,27 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# The snapshot holds the decoded data of the stores which are loaded on every
+# startup. It is only a cache, the JSON files stay the source of truth.
+SNAPSHOT_FILE = "core.snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_KEYS = (
+    "core.area_registry",
+    "core.category_registry",
+    "core.config_entries",
+    "core.device_registry",
+    "core.entity_registry",
+    "core.floor_registry",
+    "core.label_registry",
+    "core.restore_state",
+)
+
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal when it grows larger than this part of the JSON file
+JOURNAL_MAX_SIZE_RATIO = 0.5
+
+_MISSING = object()
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -117,6 +143,7 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._snapshot_checksums: dict[str, tuple[int, int]] = {}
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -126,6 +153,10 @@ class _StoreManager:
             EVENT_HOMEASSISTANT_STARTED,
             self._async_schedule_cleanup,
         )
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE,
+            self._async_create_snapshot_task,
+        )
 
     @callback
     def async_invalidate(self, key: str) -> None:
@@ -225,6 +256,241 @@ class _StoreManager:
         """Initialize the cache."""
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
+            if SNAPSHOT_FILE in self._files:
+                self._restore_snapshot()
+
+    def _read_source(self, key: str) -> bytes | None:
+        """Read the JSON file of a store if it exists."""
+        try:
+            return self._storage_path.joinpath(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _restore_snapshot(self) -> None:
+        """Preload the stores of the snapshot which match their JSON file.
+
+        Decoding the snapshot is a lot cheaper than parsing the JSON files,
+        which only need to be read to compare their checksums.
+        """
+        try:
+            version, python_version, entries = marshal.loads(
+                self._storage_path.joinpath(SNAPSHOT_FILE).read_bytes()
+            )
+        except (OSError, EOFError, ValueError, TypeError) as ex:
+            _LOGGER.debug("Error loading snapshot: %s", ex)
+            return
+        if version != SNAPSHOT_VERSION or python_version != sys.version_info[:2]:
+            _LOGGER.debug("Ignoring snapshot of an other version")
+            return
+        for key, (size, checksum, data) in entries.items():
+            if (source := self._read_source(key)) is None:
+                continue
+            if len(source) != size or zlib.crc32(source) != checksum:
+                _LOGGER.debug("%s: Snapshot is outdated", key)
+                continue
+            self._data_preload[key] = data
+            self._snapshot_checksums[key] = (size, checksum)
+
+    @callback
+    def _async_create_snapshot_task(self, _event: Event) -> None:
+        """Write the snapshot once the final writes are done."""
+        self._hass.async_create_task_internal(
+            self._async_write_snapshot(), "write storage snapshot", eager_start=True
+        )
+
+    async def _async_write_snapshot(self) -> None:
+        """Write the snapshot."""
+        await self._hass.async_add_executor_job(self._write_snapshot)
+
+    def _write_snapshot(self) -> None:
+        """Write the snapshot if any of its stores changed."""
+        sources = {
+            key: source
+            for key in SNAPSHOT_KEYS
+            if (source := self._read_source(key)) is not None
+        }
+        checksums = {
+            key: (len(source), zlib.crc32(source)) for key, source in sources.items()
+        }
+        if checksums == self._snapshot_checksums:
+            return
+        entries: dict[str, tuple[int, int, json_util.JsonValueType]] = {}
+        for key, source in sources.items():
+            try:
+                entries[key] = (*checksums[key], json_util.json_loads(source))
+            except ValueError as ex:
+                _LOGGER.debug("Not adding %s to the snapshot: %s", key, ex)
+        try:
+            write_utf8_file(
+                str(self._storage_path.joinpath(SNAPSHOT_FILE)),
+                marshal.dumps((SNAPSHOT_VERSION, sys.version_info[:2], entries)),
+                True,
+                "wb",
+            )
+        except WriteError:
+            return
+        self._snapshot_checksums = checksums
+
+
+class _StoreJournal:
+    """Append-only journal of the changed entries of a store.
+
+    The lists of the stored data named by the sections are journaled: saving
+    appends the entries which were added, changed or removed since the last
+    save to the journal instead of writing the whole JSON file. The JSON file
+    is written again, compacting the journal, when anything else changed or
+    the journal grew too large.
+
+    The first line of the journal holds the id of the JSON file it belongs
+    to, so a journal left behind by an interrupted compaction is ignored.
+    All methods must be called from the executor.
+    """
+
+    def __init__(self, sections: Mapping[str, str]) -> None:
+        """Initialize the journal, sections map a list to its id key."""
+        self._sections = sections
+        self._journal_id: str | None = None
+        self._entries: dict[str, dict[bytes, Any]] = {}
+        self._rest = b""
+        self._size = 0
+        self._max_size = 0
+
+    def replay(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the journal to the data loaded from the JSON file."""
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "rb") as fd:
+                lines = fd.read().splitlines()
+        except FileNotFoundError:
+            return
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except (IndexError, ValueError):
+            header = {}
+        if (journal_id := data.get("journal_id")) is None or header.get(
+            "journal_id"
+        ) != journal_id:
+            _LOGGER.debug("%s: Ignoring journal of an other file", path)
+            return
+
+        stored = data["data"]
+        sections = {
+            section: {entry[id_key]: entry for entry in stored[section]}
+            for section, id_key in self._sections.items()
+            if section in stored
+        }
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+                entries = sections[record["section"]]
+                if "delete" in record:
+                    entries.pop(record["delete"], None)
+                else:
+                    entry = record["set"]
+                    entries[entry[self._sections[record["section"]]]] = entry
+            except (KeyError, TypeError, ValueError) as ex:
+                # The last record is cut short if we did not shut down cleanly
+                _LOGGER.debug("%s: Stopping replay of journal: %s", path, ex)
+                break
+        for section, entries in sections.items():
+            stored[section] = list(entries.values())
+        _LOGGER.debug("%s: Replayed %s journal records", path, len(lines) - 1)
+
+    def append(self, path: str, data: dict[str, Any]) -> bool:
+        """Append the changed entries to the journal.
+
+        Returns False if the JSON file must be written instead.
+        """
+        if self._journal_id is None:
+            return False
+        try:
+            rest, entries = self._serialize(data)
+        except (KeyError, TypeError, ValueError):
+            return False
+        if rest != self._rest:
+            return False
+
+        records: list[bytes] = []
+        for section, new in entries.items():
+            old = self._entries[section]
+            records.extend(
+                b'{"section":%b,"set":%b}\n' % (json_helper.json_bytes(section), raw)
+                for raw in new
+                if raw not in old
+            )
+            records.extend(
+                json_helper.json_bytes({"section": section, "delete": entry_id}) + b"\n"
+                for entry_id in set(old.values()).difference(new.values())
+            )
+        if not records:
+            return True
+        journal = b"".join(records)
+        if self._size + len(journal) > self._max_size:
+            return False
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "ab") as fd:
+                fd.write(journal)
+        except OSError as ex:
+            _LOGGER.debug("%s: Error appending to journal: %s", path, ex)
+            return False
+        _LOGGER.debug("%s: Appended %s journal records", path, len(records))
+        self._entries = entries
+        self._size += len(journal)
+        return True
+
+    def reset(self, path: str, data: dict[str, Any], private: bool) -> None:
+        """Start a new journal for the JSON file which was written."""
+        self._journal_id = None
+        try:
+            self._rest, self._entries = self._serialize(data)
+            write_utf8_file(
+                f"{path}{JOURNAL_SUFFIX}",
+                json_helper.json_bytes({"journal_id": data["journal_id"]}) + b"\n",
+                private,
+                "wb",
+            )
+            self._max_size = int(os.path.getsize(path) * JOURNAL_MAX_SIZE_RATIO)
+        except (KeyError, OSError, TypeError, ValueError, WriteError) as ex:
+            _LOGGER.debug("%s: Error starting journal: %s", path, ex)
+            return
+        self._journal_id = data["journal_id"]
+        self._size = 0
+
+    def remove(self, path: str) -> None:
+        """Remove the journal."""
+        self._journal_id = None
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+
+    def _serialize(
+        self, data: dict[str, Any]
+    ) -> tuple[bytes, dict[str, dict[bytes, Any]]]:
+        """Serialize the journaled entries and the rest of the data.
+
+        The entries are mapped to their id, which only needs to be decoded
+        for entries which were not seen before.
+        """
+        stored = data["data"]
+        rest = json_helper.json_bytes(
+            [
+                data["version"],
+                data["minor_version"],
+                {
+                    key: value
+                    for key, value in stored.items()
+                    if key not in self._sections
+                },
+            ]
+        )
+        entries: dict[str, dict[bytes, Any]] = {}
+        for section, id_key in self._sections.items():
+            old = self._entries.get(section, {})
+            new = entries[section] = {}
+            for entry in stored[section]:
+                raw = json_helper.json_bytes(entry)
+                if (entry_id := old.get(raw, _MISSING)) is _MISSING:
+                    entry_id = json_util.json_loads_object(raw)[id_key]
+                new[raw] = entry_id
+        return rest, entries
 
 
 @bind_hass
@@ -242,8 +508,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_sections: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores with mapping data can journal the changes to the lists named by
+        journal_sections, which map each list to the key holding the id of
+        its entries, instead of rewriting the whole file on every save.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,6 +531,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal: _StoreJournal | None = None
+        if journal_sections and (encoder is None or encoder is JSONEncoder):
+            self._journal = _StoreJournal(journal_sections)
 
     @cached_property
     def path(self):
@@ -326,6 +601,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                await self.hass.async_add_executor_job(
+                    self._journal.replay, self.path, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -388,6 +667,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal:
+                await self.hass.async_add_executor_job(
+                    self._journal.replay, self.path, data
+                )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -552,6 +836,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            if self._journal.append(path, data):
+                return
+            data["journal_id"] = ulid_now()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +849,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal:
+            self._journal.reset(path, data, self._private)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +864,5 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            await self.hass.async_add_executor_job(self._journal.remove, self.path)
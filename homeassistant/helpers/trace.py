@@ -7,6 +7,7 @@ from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import wraps
+import sys
 from typing import Any
 
 from homeassistant.core import ServiceResponse
@@ -35,7 +36,8 @@ class TraceElement:
         self._child_key: str | None = None
         self._child_run_id: str | None = None
         self._error: BaseException | None = None
-        self.path: str = path
+        # Paths repeat for every run, share the strings between traces
+        self.path: str = sys.intern(path)
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
@@ -120,6 +122,8 @@ trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
 )
+# Set when the trace of the current run is not stored, skips building trace elements
+trace_disabled_cv: ContextVar[bool] = ContextVar("trace_disabled_cv", default=False)
 
 
 def trace_id_set(trace_id: tuple[str, str]) -> None:
@@ -260,6 +264,20 @@ def trace_path(suffix: str | list[str]) -> Generator[None]:
         trace_path_pop(count)
 
 
+@contextmanager
+def trace_disabled(disabled: bool = True) -> Generator[None]:
+    """Skip building trace elements while the trace is not stored."""
+    token = trace_disabled_cv.set(disabled)
+    # Don't let results leak into the trace of a caller
+    stack_token = trace_stack_cv.set(None) if disabled else None
+    try:
+        yield
+    finally:
+        if stack_token is not None:
+            trace_stack_cv.reset(stack_token)
+        trace_disabled_cv.reset(token)
+
+
 def async_trace_path[*_Ts](
     suffix: str | list[str],
 ) -> Callable[
@@ -15,7 +15,9 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,8 +31,9 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
+from .exceptions import HomeAssistantError
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -49,6 +52,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,10 +68,13 @@ _LOGGER = logging.getLogger(__name__)
 #
 # This list can be extended by calling async_register_preload_platform
 #
+# Platforms which are rarely used, like diagnostics and repairs, are not
+# preloaded. They are imported on first use, see
+# async_process_integration_platforms_on_demand.
+#
 BASE_PRELOAD_PLATFORMS = [
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "logbook",
@@ -75,7 +82,6 @@ BASE_PRELOAD_PLATFORMS = [
     "intent",
     "media_source",
     "recorder",
-    "repairs",
     "system_health",
     "trigger",
 ]
@@ -132,6 +138,12 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+DATA_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("import_times")
+_IMPORT_TIMES_LOCK = threading.Lock()
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -270,6 +282,8 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_MANIFEST_CACHE] = ManifestCache(hass)
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -653,6 +667,132 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+class ManifestCache:
+    """Cache of parsed manifests kept between restarts.
+
+    An entry is used as long as the manifest has the same modification time
+    and size and, for integrations which are not virtual, the integration
+    directory has the same modification time. This replaces reading and
+    parsing the manifest and listing the integration directory by two stat
+    calls. The cache is dropped when the Home Assistant version changes.
+    Only the entries looked up since the start are stored, so manifests of
+    removed integrations don't stay in the cache.
+
+    Entries are looked up and added from executor threads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        self._hass = hass
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._store: Store[dict[str, Any]] | None = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store(
+            self._hass,
+            MANIFEST_CACHE_STORAGE_VERSION,
+            MANIFEST_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError:
+            _LOGGER.exception("Error loading manifest cache")
+            return
+        if data is not None and data.get("ha_version") == __version__:
+            self._entries = {**data["manifests"], **self._entries}
+        if self._seen:
+            self._schedule_save()
+
+    def get(
+        self, manifest_path: pathlib.Path, manifest_stat: os.stat_result
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return a cached manifest and its top level files if still valid."""
+        key = str(manifest_path)
+        if key not in self._seen:
+            self._seen.add(key)
+            self._schedule_save()
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry["mtime"] != manifest_stat.st_mtime_ns
+            or entry["size"] != manifest_stat.st_size
+            or (
+                entry["files"] is not None
+                and entry["dir_mtime"] != os.stat(manifest_path.parent).st_mtime_ns
+            )
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        files = entry["files"]
+        return (
+            cast(Manifest, dict(entry["manifest"])),
+            None if files is None else set(files),
+        )
+
+    def set(
+        self,
+        manifest_path: pathlib.Path,
+        manifest_stat: os.stat_result,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Add a manifest to the cache."""
+        key = str(manifest_path)
+        self._seen.add(key)
+        self._entries[key] = {
+            "mtime": manifest_stat.st_mtime_ns,
+            "size": manifest_stat.st_size,
+            "dir_mtime": None
+            if top_level_files is None
+            else os.stat(manifest_path.parent).st_mtime_ns,
+            "manifest": dict(manifest),
+            "files": None if top_level_files is None else sorted(top_level_files),
+        }
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the cache from any thread."""
+        if not self._dirty and self._store is not None:
+            self._dirty = True
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        assert self._store is not None
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store, without the unseen entries."""
+        self._dirty = False
+        entries = dict(self._entries)
+        manifests = {key: entry for key, entry in entries.items() if key in self._seen}
+        _LOGGER.debug(
+            "Saving manifest cache with %s entries, %s hits, %s misses",
+            len(manifests),
+            self.hits,
+            self.misses,
+        )
+        return {"ha_version": __version__, "manifests": manifests}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the manifest cache from storage."""
+    await hass.data[DATA_MANIFEST_CACHE].async_load()
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -661,30 +801,46 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+                manifest_stat = manifest_path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(manifest_stat.st_mode):
                 continue
 
             file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            if manifest_cache is not None and (
+                cached := manifest_cache.get(manifest_path, manifest_stat)
+            ):
+                manifest, top_level_files = cached
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None:
+                    manifest_cache.set(
+                        manifest_path, manifest_stat, manifest, top_level_files
+                    )
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -778,6 +934,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_times = hass.data[DATA_IMPORT_TIMES]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1075,6 +1232,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1089,6 +1247,8 @@ class Integration:
                 "Unexpected exception importing component %s", self.pkg_path
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
+        finally:
+            self._add_import_time(start)
 
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
@@ -1273,6 +1433,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1297,9 +1458,23 @@ class Integration:
             raise ImportError(
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
+        finally:
+            self._add_import_time(start)
 
         return cast(ModuleType, cache[full_name])
 
+    def _add_import_time(self, start: float) -> None:
+        """Add the time spent importing since start to the integration.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        elapsed = time.perf_counter() - start
+        with _IMPORT_TIMES_LOCK:
+            self._import_times[self.domain] = (
+                self._import_times.get(self.domain, 0.0) + elapsed
+            )
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform.
 
@@ -1343,6 +1518,17 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return the time spent importing the modules of each integration.
+
+    The time of an integration includes importing the modules it pulls in,
+    like its requirements and integrations it depends on which were not
+    imported yet.
+    """
+    return dict(hass.data[DATA_IMPORT_TIMES])
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -6,6 +6,8 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gzip
 import logging
 from timeit import default_timer as timer
 
@@ -17,6 +19,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +311,125 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_match_topics(hass):
+    """Match 10k topics against 10k MQTT topic filters."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    trie: TopicTrie[int] = TopicTrie()
+    for i in range(10**4):
+        if i % 3 == 0:
+            trie.add(f"homeassistant/+/node_{i}/#", i)
+        elif i % 3 == 1:
+            trie.add(f"zigbee2mqtt/device_{i}/+", i)
+        else:
+            trie.add(f"tasmota/device_{i}/state", i)
+    topics = [f"zigbee2mqtt/device_{i}/state" for i in range(10**4)]
+
+    start = timer()
+    for topic in topics:
+        trie.matches(topic)
+    return timer() - start
+
+
+@benchmark
+async def influxdb_write_states(hass):
+    """Write 50k state changes to a local stand-in of InfluxDB."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp import web
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import influxdb
+
+    received = 0
+
+    async def write(request: web.Request) -> web.Response:
+        """Count the lines written like InfluxDB would store them."""
+        nonlocal received
+        body = await request.read()
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        received += body.count(b"\n")
+        return web.Response(status=204)
+
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/write", write)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    config = influxdb.CONFIG_SCHEMA(
+        {influxdb.DOMAIN: {"host": "127.0.0.1", "port": port, "batch_size": 1000}}
+    )
+    await hass.async_add_executor_job(influxdb.setup, hass, config)
+    instance = hass.data[influxdb.DOMAIN]
+    count = 5 * 10**4
+
+    start = timer()
+    for i in range(count):
+        hass.states.async_set(
+            f"sensor.benchmark_{i % 100}", i, {"unit_of_measurement": "W"}
+        )
+    await hass.async_add_executor_job(instance.block_till_done)
+    runtime = timer() - start
+
+    print(f"Wrote {received} of {count} points with", instance.stats)
+    instance.queue.put(None)
+    await hass.async_add_executor_job(instance.join)
+    await runner.cleanup()
+    return runtime
+
+
+@benchmark
+async def statistics_characteristics(hass):
+    """Add 10k samples to a full statistics sensor of each characteristic."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics import sensor as statistics
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    count = 10**4
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.source",
+            str(i % 997 / 10),
+            last_updated=now + timedelta(seconds=i),
+        )
+        for i in range(2 * count)
+    ]
+    total = 0
+
+    for characteristic in sorted(statistics.STATS_NUMERIC_SUPPORT):
+        sensor = statistics.StatisticsSensor(
+            hass,
+            "sensor.source",
+            characteristic,
+            None,
+            characteristic,
+            count,
+            None,
+            False,
+            2,
+            95,
+        )
+        for state in states[:count]:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+
+        start = timer()
+        for state in states[count:]:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+            sensor._update_value()  # noqa: SLF001
+        runtime = timer() - start
+        print(f"{characteristic}: {runtime}s")
+        total += runtime
+
+    return total
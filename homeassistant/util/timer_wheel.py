@@ -0,0 +1,342 @@
+"""Hierarchical timing wheel.
+
+Schedules a large number of timers while keeping a single timer handle
+on the event loop. Timers are bucketed by the tick they are due in;
+buckets further in the future live on coarser levels and cascade down
+as the wheel advances.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+import math
+from typing import Any
+
+# Slots per level: seconds in a minute, minutes in an hour, hours in a day
+_LEVEL_SLOTS = (60, 60, 24)
+_OVERFLOW = -1
+_MINUTE_TICKS = 60
+_HOUR_TICKS = 3600
+
+
+@dataclass(slots=True, frozen=True)
+class TimerWheelStats:
+    """Statistics of a timer wheel."""
+
+    pending: int
+    fired: int
+    wakeups: int
+    max_late: float
+    mean_late: float
+
+
+class TimerWheelHandle:
+    """Handle of a timer scheduled on a timer wheel.
+
+    Mirrors the parts of asyncio.TimerHandle that callers rely on.
+    """
+
+    __slots__ = (
+        "_when",
+        "_callback",
+        "_args",
+        "_cancelled",
+        "_wheel",
+        "_slot",
+        "_level",
+    )
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Initialize the handle."""
+        self._wheel = wheel
+        self._when = when
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+        self._slot: set[TimerWheelHandle] | None = None
+        self._level = _OVERFLOW
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        state = " cancelled" if self._cancelled else ""
+        return (
+            f"<TimerWheelHandle{state} when={self._when} "
+            f"{self._callback!r}{self._args!r}>"
+        )
+
+    def when(self) -> float:
+        """Return the scheduled loop time."""
+        return self._when
+
+    def cancelled(self) -> bool:
+        """Return if the timer was cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        if self._slot is not None:
+            self._wheel._remove(self)  # noqa: SLF001
+
+    def _run(self) -> None:
+        """Run the callback right away and take it off the wheel."""
+        if self._slot is not None:
+            self._wheel._remove(self)  # noqa: SLF001
+        try:
+            self._callback(*self._args)
+        except Exception as exc:  # noqa: BLE001
+            self._wheel.loop.call_exception_handler(
+                {
+                    "message": f"Exception in timer wheel callback {self!r}",
+                    "exception": exc,
+                    "handle": self,
+                }
+            )
+
+
+class TimerWheel:
+    """Hierarchical timing wheel driven by one event loop timer.
+
+    Level 0 holds one slot per tick for the current minute, level 1 one slot
+    per minute for the current hour and level 2 one slot per hour for the
+    current day. Anything further away waits in an overflow bucket that is
+    re-examined every hour. All timers due by the time the wheel wakes up
+    are fired in one batch.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, resolution: float = 1.0
+    ) -> None:
+        """Initialize the timer wheel."""
+        self.loop = loop
+        self._resolution = resolution
+        self._levels: list[list[set[TimerWheelHandle]]] = [
+            [set() for _ in range(slots)] for slots in _LEVEL_SLOTS
+        ]
+        self._level_counts = [0] * len(_LEVEL_SLOTS)
+        self._overflow: set[TimerWheelHandle] = set()
+        self._current_tick = 0
+        # The tick the wheel is advancing to, timers scheduled while catching
+        # up which are already due go to its slot
+        self._due_tick = 0
+        self._pending = 0
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self._wake_at = math.inf
+        self._fired = 0
+        self._wakeups = 0
+        self._late_total = 0.0
+        self._late_max = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of pending timers."""
+        return self._pending
+
+    @property
+    def stats(self) -> TimerWheelStats:
+        """Return statistics about the timer wheel."""
+        return TimerWheelStats(
+            pending=self._pending,
+            fired=self._fired,
+            wakeups=self._wakeups,
+            max_late=self._late_max,
+            mean_late=self._late_total / self._fired if self._fired else 0.0,
+        )
+
+    def handles(self) -> list[TimerWheelHandle]:
+        """Return all pending handles."""
+        return list(self._iter_handles())
+
+    def _iter_handles(self) -> Iterator[TimerWheelHandle]:
+        """Iterate over all pending handles."""
+        for level in self._levels:
+            for slot in level:
+                yield from slot
+        yield from self._overflow
+
+    def async_call_at(
+        self, when: float, callback: Callable[..., Any], *args: Any
+    ) -> TimerWheelHandle:
+        """Schedule callback to be called at loop time when.
+
+        Must be run in the event loop.
+        """
+        handle = TimerWheelHandle(self, when, callback, args)
+        if not self._pending:
+            # Nothing is scheduled so the wheel may be far behind
+            self._current_tick = self._tick(self.loop.time())
+        self._pending += 1
+        self._insert(handle)
+        if (wake_at := self._wake_time_for(handle)) < self._wake_at:
+            self._arm(wake_at)
+        return handle
+
+    def async_advance(self, now: float) -> None:
+        """Fire all timers due at loop time now and advance the wheel."""
+        now_tick = self._due_tick = self._tick(now)
+        level0 = self._levels[0]
+        while self._current_tick < now_tick:
+            current = self._current_tick
+            if slot := level0[current % _MINUTE_TICKS]:
+                self._fire(slot, now)
+            if self._level_counts[0]:
+                next_tick = current + 1
+            elif self._level_counts[1]:
+                # Nothing due this minute, skip ahead to the next cascade
+                next_tick = (current // _MINUTE_TICKS + 1) * _MINUTE_TICKS
+            else:
+                next_tick = (current // _HOUR_TICKS + 1) * _HOUR_TICKS
+            next_tick = min(next_tick, now_tick)
+            self._current_tick = next_tick
+            if next_tick % _MINUTE_TICKS == 0:
+                self._cascade(next_tick)
+        if slot := level0[self._current_tick % _MINUTE_TICKS]:
+            self._fire(
+                [handle for handle in slot if handle.when() <= now],
+                now,
+            )
+        self._schedule_wake()
+
+    def _tick(self, when: float) -> int:
+        """Return the tick a loop time falls in."""
+        return int(when // self._resolution)
+
+    def _insert(self, handle: TimerWheelHandle) -> None:
+        """Put a handle into the slot matching its due tick."""
+        current = self._current_tick
+        tick = max(self._tick(handle.when()), current, self._due_tick)
+        if tick - current < _MINUTE_TICKS:
+            level, index = 0, tick % _MINUTE_TICKS
+        elif (minute := tick // _MINUTE_TICKS) - current // _MINUTE_TICKS < 60:
+            level, index = 1, minute % 60
+        elif (hour := tick // _HOUR_TICKS) - current // _HOUR_TICKS < 24:
+            level, index = 2, hour % 24
+        else:
+            handle._slot = self._overflow  # noqa: SLF001
+            handle._level = _OVERFLOW  # noqa: SLF001
+            self._overflow.add(handle)
+            return
+        slot = self._levels[level][index]
+        handle._slot = slot  # noqa: SLF001
+        handle._level = level  # noqa: SLF001
+        slot.add(handle)
+        self._level_counts[level] += 1
+
+    def _remove(self, handle: TimerWheelHandle) -> None:
+        """Take a handle off the wheel."""
+        slot = handle._slot  # noqa: SLF001
+        if slot is None:
+            return
+        handle._slot = None  # noqa: SLF001
+        slot.discard(handle)
+        self._pending -= 1
+        if (level := handle._level) != _OVERFLOW:  # noqa: SLF001
+            self._level_counts[level] -= 1
+        if not self._pending:
+            self._disarm()
+
+    def _take(self, level: int, index: int) -> list[TimerWheelHandle]:
+        """Empty a slot and return its handles."""
+        slot = self._levels[level][index]
+        handles = list(slot)
+        slot.clear()
+        self._level_counts[level] -= len(handles)
+        return handles
+
+    def _cascade(self, tick: int) -> None:
+        """Move handles of the unit starting at tick down the levels."""
+        if tick % _HOUR_TICKS == 0:
+            if self._overflow:
+                overflow = list(self._overflow)
+                self._overflow.clear()
+                for handle in overflow:
+                    self._insert(handle)
+            for handle in self._take(2, (tick // _HOUR_TICKS) % 24):
+                self._insert(handle)
+        for handle in self._take(1, (tick // _MINUTE_TICKS) % 60):
+            self._insert(handle)
+
+    def _fire(self, due: Iterable[TimerWheelHandle], now: float) -> None:
+        """Fire a batch of due handles."""
+        handles = sorted(due, key=TimerWheelHandle.when)
+        for handle in handles:
+            self._remove(handle)
+        for handle in handles:
+            if handle.cancelled():
+                # Cancelled by an earlier callback of the same batch
+                continue
+            late = now - handle.when()
+            self._fired += 1
+            self._late_total += late
+            self._late_max = max(late, self._late_max)
+            handle._run()  # noqa: SLF001
+
+    def _wake_time_for(self, handle: TimerWheelHandle) -> float:
+        """Return when the wheel has to wake up to handle a handle."""
+        if (level := handle._level) == _OVERFLOW:  # noqa: SLF001
+            return self._next_hour()
+        if level == 0:
+            return handle.when()
+        tick = self._tick(handle.when())
+        if level == 1:
+            return (tick // _MINUTE_TICKS) * _MINUTE_TICKS * self._resolution
+        return (tick // _HOUR_TICKS) * _HOUR_TICKS * self._resolution
+
+    def _next_hour(self) -> float:
+        """Return the loop time the next hour of the wheel starts."""
+        return (self._current_tick // _HOUR_TICKS + 1) * _HOUR_TICKS * self._resolution
+
+    def _next_wake_time(self) -> float:
+        """Return the next time the wheel needs to wake up."""
+        current = self._current_tick
+        if self._level_counts[0]:
+            level0 = self._levels[0]
+            for offset in range(_MINUTE_TICKS):
+                if slot := level0[(current + offset) % _MINUTE_TICKS]:
+                    return min(handle.when() for handle in slot)
+        if self._level_counts[1]:
+            level1 = self._levels[1]
+            minute = current // _MINUTE_TICKS
+            for offset in range(1, 60):
+                if level1[(minute + offset) % 60]:
+                    return (minute + offset) * _MINUTE_TICKS * self._resolution
+        return self._next_hour()
+
+    def _schedule_wake(self) -> None:
+        """Arm the loop timer for the next wake up."""
+        if not self._pending:
+            self._disarm()
+            return
+        if (wake_at := self._next_wake_time()) != self._wake_at:
+            self._arm(wake_at)
+
+    def _arm(self, wake_at: float) -> None:
+        """Arm the loop timer."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+        self._wake_at = wake_at
+        self._wake_handle = self.loop.call_at(wake_at, self._async_wake)
+
+    def _disarm(self) -> None:
+        """Disarm the loop timer."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+        self._wake_at = math.inf
+
+    def _async_wake(self) -> None:
+        """Handle the loop timer firing."""
+        self._wake_handle = None
+        self._wake_at = math.inf
+        self._wakeups += 1
+        self.async_advance(self.loop.time())
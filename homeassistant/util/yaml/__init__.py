@@ -9,6 +9,7 @@ from .loader import (
     load_yaml,
     load_yaml_dict,
     parse_yaml,
+    prune_yaml_cache,
     secret_yaml,
 )
 from .objects import Input
@@ -24,6 +25,7 @@ __all__ = [
     "load_yaml_dict",
     "secret_yaml",
     "parse_yaml",
+    "prune_yaml_cache",
     "UndefinedSubstitution",
     "extract_inputs",
     "substitute",
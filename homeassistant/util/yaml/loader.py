@@ -8,7 +8,8 @@ from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, overload
+import time
+from typing import Any, TextIO, cast, overload
 
 import yaml
 
@@ -36,6 +37,21 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files and directories changed this recently are not cached as a change
+# within the timestamp granularity of the file system would go unnoticed
+_CACHE_SETTLE_TIME_NS = 2_000_000_000
+
+# Parse results of files, keyed by file name. The cached results keep the
+# tags which depend on other files or the environment unresolved, see
+# _DeferredTag. The caches are ordered from least to most recently used.
+_TEMPLATE_CACHE: dict[str, tuple[tuple[int, int, int], JSON_TYPE]] = {}
+_TEMPLATE_CACHE_SIZE = 1024
+# Files found in directories, keyed by directory and pattern
+_FIND_FILES_CACHE: dict[
+    tuple[str, str], tuple[tuple[tuple[str, int], ...], tuple[str, ...]]
+] = {}
+_FIND_FILES_CACHE_SIZE = 256
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -218,6 +234,153 @@ class SafeLineLoader(PythonSafeLoader):
 type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
+class _DeferredLoader:
+    """Stand-in for the loader when resolving a deferred tag."""
+
+    __slots__ = ("get_name", "get_stream_name", "secrets")
+
+    def __init__(self, name: str, secrets: Secrets | None) -> None:
+        """Initialize the deferred loader."""
+        self.get_name = name
+        self.get_stream_name = name
+        self.secrets = secrets
+
+
+class _DeferredTag:
+    """A tag which is resolved each time the YAML it is in is loaded.
+
+    Includes, secrets and environment variables depend on other files or the
+    environment, so they are kept out of the parse results which are cached.
+    The attributes mirror the node the tag was read from so the constructors
+    of these tags can be called with it.
+    """
+
+    __slots__ = ("tag", "value", "start_mark", "name")
+
+    def __init__(self, loader: LoaderType, node: yaml.nodes.Node) -> None:
+        """Initialize the deferred tag."""
+        mark = node.start_mark
+        self.tag: str = node.tag
+        self.value: Any = node.value
+        # Drop the buffer of the mark which holds the content of the file
+        self.start_mark = yaml.Mark(
+            mark.name,
+            mark.index,
+            mark.line,
+            mark.column,
+            None,  # type: ignore[arg-type]
+            None,  # type: ignore[arg-type]
+        )
+        self.name = loader.get_name
+
+    def resolve(self, secrets: Secrets | None) -> Any:
+        """Resolve the tag."""
+        return _DEFERRED_CONSTRUCTORS[self.tag](
+            cast(LoaderType, _DeferredLoader(self.name, secrets)),
+            cast(yaml.nodes.Node, self),
+        )
+
+
+_DEFERRED_TAGS = {
+    "!env_var",
+    "!include",
+    "!include_dir_list",
+    "!include_dir_merge_list",
+    "!include_dir_merge_named",
+    "!include_dir_named",
+    "!secret",
+}
+_DEFERRED_CONSTRUCTORS: dict[str, Callable[[LoaderType, yaml.nodes.Node], Any]] = {}
+
+
+def _copy_reference[_NodeT: (NodeDictClass, NodeListClass)](
+    obj: _NodeT, source: NodeDictClass | NodeListClass
+) -> _NodeT:
+    """Copy file reference information from a node class object."""
+    try:  # suppress is much slower
+        obj.__config_file__ = source.__config_file__
+        obj.__line__ = source.__line__
+    except AttributeError:
+        pass
+    return obj
+
+
+def _resolve(obj: Any, secrets: Secrets | None) -> Any:
+    """Return a copy of a parse result with its deferred tags resolved.
+
+    Containers are copied as the result may be cached, strings and other
+    scalars are immutable and shared.
+    """
+    if isinstance(obj, dict):
+        resolved = {
+            (key.resolve(secrets) if isinstance(key, _DeferredTag) else key): _resolve(
+                value, secrets
+            )
+            for key, value in obj.items()
+        }
+        if isinstance(obj, NodeDictClass):
+            return _copy_reference(NodeDictClass(resolved), obj)
+        return resolved
+    if isinstance(obj, list):
+        if isinstance(obj, NodeListClass):
+            return _copy_reference(
+                NodeListClass([_resolve(value, secrets) for value in obj]), obj
+            )
+        return [_resolve(value, secrets) for value in obj]
+    if isinstance(obj, _DeferredTag):
+        return obj.resolve(secrets)
+    return obj
+
+
+def _cache_get[_KT, _VT](cache: dict[_KT, _VT], key: _KT) -> _VT | None:
+    """Return a cached value, marking it as the most recently used."""
+    if (value := cache.pop(key, None)) is not None:
+        cache[key] = value
+    return value
+
+
+def _cache_set[_KT, _VT](
+    cache: dict[_KT, _VT], key: _KT, value: _VT, max_size: int
+) -> None:
+    """Cache a value, dropping the least recently used ones above the size."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > max_size:
+        cache.pop(next(iter(cache)), None)
+
+
+def _load_template(conf_file: TextIO) -> JSON_TYPE:
+    """Parse a file, or return the cached result if it did not change."""
+    try:
+        stat_result = os.fstat(conf_file.fileno())
+    except (OSError, ValueError):
+        # Not a regular file
+        return _parse_template(conf_file)
+    name: str = conf_file.name
+    key = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+    if (cached := _cache_get(_TEMPLATE_CACHE, name)) is not None:
+        if cached[0] == key:
+            return cached[1]
+        _TEMPLATE_CACHE.pop(name, None)
+    template = _parse_template(conf_file)
+    if time.time_ns() - stat_result.st_mtime_ns > _CACHE_SETTLE_TIME_NS:
+        _cache_set(_TEMPLATE_CACHE, name, (key, template), _TEMPLATE_CACHE_SIZE)
+    return template
+
+
+def prune_yaml_cache() -> None:
+    """Drop the cached files and directories which changed or no longer exist.
+
+    This method needs to run in an executor.
+    """
+    for name in list(_TEMPLATE_CACHE):
+        if not os.path.isfile(name):
+            _TEMPLATE_CACHE.pop(name, None)
+    for cache_key, (dir_mtimes, _) in list(_FIND_FILES_CACHE.items()):
+        if not _dirs_unchanged(dir_mtimes):
+            _FIND_FILES_CACHE.pop(cache_key, None)
+
+
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
@@ -228,7 +391,7 @@ def load_yaml(
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _resolve(_load_template(conf_file), secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -258,17 +421,22 @@ def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
+    return _resolve(_parse_template(content), secrets)
+
+
+def _parse_template(content: str | TextIO | StringIO) -> JSON_TYPE:
+    """Parse YAML with the fastest available loader, deferring some tags."""
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(FastSafeLoader, content)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content)
 
 
 def _parse_yaml_python(
@@ -394,14 +562,52 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
+def _dirs_unchanged(dir_mtimes: tuple[tuple[str, int], ...]) -> bool:
+    """Return if none of the directories changed."""
+    try:
+        return all(
+            os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in dir_mtimes
+        )
+    except OSError:
+        return False
+
+
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    cache_key = (directory, pattern)
+    if (cached := _cache_get(_FIND_FILES_CACHE, cache_key)) is not None:
+        if _dirs_unchanged(cached[0]):
+            return iter(cached[1])
+        _FIND_FILES_CACHE.pop(cache_key, None)
+
+    found: list[str] = []
+    dir_mtimes: list[tuple[str, int]] | None = []
+    settled_before = time.time_ns() - _CACHE_SETTLE_TIME_NS
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
-        for basename in sorted(files):
-            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
-                filename = os.path.join(root, basename)
-                yield filename
+        if dir_mtimes is not None:
+            # A directory changes when files are added, removed or renamed
+            try:
+                mtime_ns = os.stat(root).st_mtime_ns
+            except OSError:
+                dir_mtimes = None
+            else:
+                dir_mtimes.append((root, mtime_ns))
+                if mtime_ns > settled_before:
+                    dir_mtimes = None
+        found.extend(
+            os.path.join(root, basename)
+            for basename in sorted(files)
+            if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern)
+        )
+    if dir_mtimes:
+        _cache_set(
+            _FIND_FILES_CACHE,
+            cache_key,
+            (tuple(dir_mtimes), tuple(found)),
+            _FIND_FILES_CACHE_SIZE,
+        )
+    return iter(found)
 
 
 @_raise_if_no_value
@@ -548,6 +754,9 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def add_constructor(tag: Any, constructor: Any) -> None:
     """Add to constructor to all loaders."""
+    if tag in _DEFERRED_TAGS:
+        _DEFERRED_CONSTRUCTORS[tag] = constructor
+        constructor = _DeferredTag
     for yaml_loader in (FastSafeLoader, PythonSafeLoader):
         yaml_loader.add_constructor(tag, constructor)
 
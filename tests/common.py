@@ -106,6 +106,7 @@ from homeassistant.util.json import (
     json_loads_object,
 )
 from homeassistant.util.signal_type import SignalType
+from homeassistant.util.timer_wheel import TimerWheelHandle
 import homeassistant.util.ulid as ulid_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 import homeassistant.util.yaml.loader as yaml_loader
@@ -492,8 +493,11 @@ def _async_fire_time_changed(
     hass: HomeAssistant, utc_datetime: datetime | None, fire_all: bool
 ) -> None:
     timestamp = dt_util.utc_to_timestamp(utc_datetime)
-    for task in list(get_scheduled_timer_handles(hass.loop)):
-        if not isinstance(task, asyncio.TimerHandle):
+    for task in [
+        *get_scheduled_timer_handles(hass.loop),
+        *hass.timer_wheel.handles(),
+    ]:
+        if not isinstance(task, (asyncio.TimerHandle, TimerWheelHandle)):
             continue
         if task.cancelled():
             continue
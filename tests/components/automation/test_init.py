@@ -40,7 +40,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
@@ -637,6 +637,45 @@ async def test_reload_config_service(
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_after_entity_rename(
+    hass: HomeAssistant,
+    calls: list[ServiceCall],
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test reloading follows an entity renamed since the previous load."""
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="kitchen"
+    )
+    config = {
+        automation.DOMAIN: {
+            "alias": "hello",
+            "trigger": {"platform": "state", "entity_id": entry.id, "to": "on"},
+            "action": {"action": "test.automation"},
+        }
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    entity_registry.async_update_entity(
+        "light.kitchen", new_entity_id="light.dining_room"
+    )
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    hass.states.async_set("light.dining_room", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 async def test_reload_config_when_invalid_config(
     hass: HomeAssistant, calls: list[ServiceCall]
 ) -> None:
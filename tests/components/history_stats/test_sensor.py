@@ -1377,6 +1377,82 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor4").state == "83.3"
 
 
+async def test_rolling_window_follows_state_changes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors of the same entity fetch its history from the database once."""
+    start_time = dt_util.utcnow() - timedelta(minutes=60)
+    t0 = start_time - timedelta(minutes=60)
+    t1 = start_time - timedelta(minutes=30)
+
+    # t0                  t1                  Start               Next update
+    # |-------30min-------|-------30min-------|-------30min-------|
+    # |--------off--------|---------------------on----------------|
+
+    def _fake_states(*args, **kwargs):
+        return {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "off", last_changed=t0),
+                ha.State("binary_sensor.test_id", "on", last_changed=t1),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            side_effect=_fake_states,
+        ) as state_changes_during_period,
+        freeze_time(start_time),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor2",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+        assert hass.states.get("sensor.sensor2").state == "1"
+
+        next_update = start_time + timedelta(minutes=30)
+        with freeze_time(next_update):
+            async_fire_time_changed(hass, next_update)
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+        assert hass.states.get("sensor.sensor2").state == "1"
+
+        with freeze_time(next_update):
+            hass.states.async_set("binary_sensor.test_id", "off")
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+        assert hass.states.get("sensor.sensor2").state == "1"
+
+    assert state_changes_during_period.call_count == 1
+
+
 async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test the history statistics sensor measure with a non-UTC timezone."""
     await hass.config.async_set_time_zone("Europe/Berlin")
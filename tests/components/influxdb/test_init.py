@@ -5,6 +5,9 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+from pathlib import Path
+import re
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
@@ -42,6 +45,70 @@ class FilterTest:
     should_pass: bool
 
 
+def _split(text: str, separator: str) -> list[str]:
+    """Split line protocol on a separator which is not escaped or quoted."""
+    parts = [""]
+    quoted = escaped = False
+    for char in text:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif char == separator and not quoted:
+            parts.append("")
+            continue
+        parts[-1] += char
+    return parts
+
+
+def _unescape(text: str) -> str:
+    """Remove the escaping of the line protocol."""
+    return re.sub(r"\\(.)", lambda match: "\n" if match[1] == "n" else match[1], text)
+
+
+def _parse_line(line: str) -> dict[str, Any]:
+    """Parse a line of the line protocol into the point it encodes."""
+    series, field_set, timestamp = _split(line, " ")
+    measurement, *tags = _split(series, ",")
+    fields: dict[str, Any] = {}
+    for field in _split(field_set, ","):
+        key, value = _split(field, "=")
+        if value.startswith('"'):
+            fields[_unescape(key)] = _unescape(value[1:-1])
+        else:
+            fields[_unescape(key)] = float(value)
+    return {
+        "measurement": _unescape(measurement),
+        "tags": {
+            _unescape(key): _unescape(value)
+            for key, value in (_split(tag, "=") for tag in tags)
+        },
+        "time": int(timestamp),
+        "fields": fields,
+    }
+
+
+class LinesOf:
+    """Compare lines of the line protocol with the points they should encode."""
+
+    def __init__(self, body: list[dict[str, Any]]) -> None:
+        """Initialize with the expected points."""
+        self.body = body
+
+    def __eq__(self, other: object) -> bool:
+        """Return if the lines encode the expected points."""
+        return (
+            isinstance(other, list)
+            and [_parse_line(line) for line in other] == self.body
+        )
+
+    def __repr__(self) -> str:
+        """Return the expected points."""
+        return f"LinesOf({self.body!r})"
+
+
 @pytest.fixture(autouse=True)
 def mock_batch_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     """Mock the event bus listener and the batch timeout for tests."""
@@ -51,6 +118,14 @@ def mock_batch_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_spool_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Keep the spool of each test in a temporary directory."""
+    spool_file = tmp_path / "influxdb_spool"
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_FILE", str(spool_file))
+    return spool_file
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(
     request: pytest.FixtureRequest,
@@ -70,7 +145,7 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LinesOf(body)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,7 +154,9 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        LinesOf(body), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1360,7 +1437,12 @@ async def test_event_listener_ignore_attributes_overlapping_entities(
     indirect=["mock_client", "get_mock_call"],
 )
 async def test_event_listener_scheduled_write(
-    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    mock_spool_file: Path,
 ) -> None:
     """Test the event listener retries after a write failure."""
     config = {"max_retries": 1}
@@ -1369,22 +1451,38 @@ async def test_event_listener_scheduled_write(
     write_api = get_write_api(mock_client)
     write_api.side_effect = OSError("foo")
 
-    # Write fails
+    # Write fails, the event is spooled
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", 1)
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
         assert mock_sleep.called
     assert write_api.call_count == 2
+    assert mock_spool_file.exists()
+    assert hass.data[influxdb.DOMAIN].stats.events_spooled == 1
 
-    # Write works again
+    # Write works again, the spooled event is written after the new one
     write_api.side_effect = None
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", "2")
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert not mock_spool_file.exists()
+    body = [
+        {
+            "measurement": "entity.entity_id",
+            "tags": {"domain": "entity", "entity_id": "entity_id"},
+            "time": ANY,
+            "fields": {"value": 1},
+        }
+    ]
+    assert write_api.call_args == get_mock_call(body)
+    stats = hass.data[influxdb.DOMAIN].stats
+    assert stats.events_written == 2
+    assert stats.batches_written == 2
+    assert stats.events_lost == 0
 
 
 @pytest.mark.parametrize(
@@ -1706,3 +1804,47 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api"),
+    [
+        (influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1),
+        (influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2),
+    ],
+    indirect=["mock_client"],
+)
+async def test_line_protocol(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api
+) -> None:
+    """Test points are escaped and timestamped in the line protocol."""
+    config = {"precision": "ms", "tags_attributes": ["tag_attr", "path"]}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+
+    hass.states.async_set(
+        "fake.entity_id",
+        1,
+        {
+            "unit_of_measurement": "foo bars,",
+            "quote": 'say "hi"',
+            "tag_attr": "a=b c",
+            "path": "C:\\",
+        },
+    )
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    lines = write_api.call_args.kwargs.get("record") or write_api.call_args.args[0]
+    assert len(lines) == 1
+    series_and_fields, timestamp = lines[0].rsplit(" ", 1)
+    assert series_and_fields == (
+        r"foo\ bars\,,domain=fake,entity_id=entity_id,path=C:\\,tag_attr=a\=b\ c"
+        r' value=1.0,quote_str="say \"hi\""'
+    )
+    state = hass.states.get("fake.entity_id")
+    assert int(timestamp) == (
+        state.last_updated - datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+    ) // datetime.timedelta(milliseconds=1)
@@ -220,6 +220,72 @@ async def test_publish(
     publish_mock.reset_mock()
 
 
+async def test_publish_bulk(
+    hass: HomeAssistant, setup_with_birth_msg_client_mock: MqttMockPahoClient
+) -> None:
+    """Test publishing messages in bulk through a bounded queue."""
+    publish_mock: MagicMock = setup_with_birth_msg_client_mock.publish
+    publish_mock.reset_mock()
+    client = hass.data[mqtt.DATA_MQTT].client
+    messages = [
+        mqtt.PublishMessage(f"test-topic/{i}", f"payload-{i}", 0, False)
+        for i in range(5)
+    ]
+    with (
+        patch("homeassistant.components.mqtt.client.MAX_PUBLISH_QUEUE_SIZE", 2),
+        patch("homeassistant.components.mqtt.client.MAX_PUBLISHES_PER_FLUSH", 1),
+    ):
+        # Waits for the queue to have room, but not for the broker
+        await mqtt.async_publish_bulk(hass, messages)
+        assert client.message_stats.publish_queued <= 2
+        await hass.async_block_till_done()
+
+    assert [publish_call.args for publish_call in publish_mock.call_args_list] == [
+        (f"test-topic/{i}", f"payload-{i}", 0, False) for i in range(5)
+    ]
+    stats = client.message_stats
+    assert stats.publish_queued == 0
+    assert stats.publish_failed == 0
+    # No futures are left waiting for the acknowledgements
+    assert not client._pending_operations
+    assert not client._fire_and_forget_mids
+
+
+async def test_publish_bulk_failed(
+    hass: HomeAssistant, setup_with_birth_msg_client_mock: MqttMockPahoClient
+) -> None:
+    """Test messages published in bulk failing to be transmitted are reported."""
+    mqtt_client_mock = setup_with_birth_msg_client_mock
+    publish_mock: MagicMock = mqtt_client_mock.publish
+    publish = publish_mock.side_effect
+    client = hass.data[mqtt.DATA_MQTT].client
+
+    def _publish(topic: str, payload: str, qos: int, retain: bool) -> Mock:
+        if topic.startswith("fail/"):
+            return Mock(rc=paho_mqtt.MQTT_ERR_NO_CONN, mid=0)
+        if topic.startswith("no-ack/"):
+            return Mock(rc=paho_mqtt.MQTT_ERR_SUCCESS, mid=1000)
+        return publish(topic, payload, qos, retain)
+
+    publish_mock.side_effect = _publish
+    messages = [
+        mqtt.PublishMessage(topic, "payload", 1, True)
+        for topic in ("ok/1", "fail/1", "no-ack/1", "fail/2")
+    ]
+    failed: list[mqtt.PublishMessage] = []
+    await mqtt.async_publish_bulk(hass, messages, failed_callback=failed.extend)
+    await hass.async_block_till_done()
+
+    assert failed == [messages[1], messages[3]]
+    assert client.message_stats.publish_failed == 2
+    assert client._fire_and_forget_mids == {1000}
+
+    # Messages not acknowledged before a disconnect never will be
+    mqtt_client_mock.on_disconnect(None, None, 0)
+    await hass.async_block_till_done()
+    assert not client._fire_and_forget_mids
+
+
 async def test_convert_outgoing_payload(hass: HomeAssistant) -> None:
     """Test the converting of outgoing MQTT payloads without template."""
     command_template = mqtt.MqttCommandTemplate(None)
@@ -279,6 +345,46 @@ async def test_subscribe_topic(
         unsub()
 
 
+async def test_subscribe_topic_coalesce_window(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test only the latest message during a coalesce window is delivered."""
+    mqtt_mock = await mqtt_mock_entry()
+    unsub = await mqtt.async_subscribe(
+        hass, "test-topic/#", record_calls, coalesce_window=1.0
+    )
+
+    for payload in ("1", "2", "3"):
+        async_fire_mqtt_message(hass, "test-topic/a", payload)
+    async_fire_mqtt_message(hass, "test-topic/b", "4")
+    await hass.async_block_till_done()
+    assert [(msg.topic, msg.payload) for msg in recorded_calls] == [
+        ("test-topic/a", "1"),
+        ("test-topic/b", "4"),
+    ]
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert [(msg.topic, msg.payload) for msg in recorded_calls[2:]] == [
+        ("test-topic/a", "3"),
+    ]
+
+    async_fire_mqtt_message(hass, "test-topic/a", "5")
+    unsub()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+
+    # The mocked client wraps the real client
+    stats = mqtt_mock.return_value.message_stats
+    assert stats.received == 5
+    assert stats.delivered == 3
+    assert stats.coalesced == 1
+
+
 @pytest.mark.usefixtures("mqtt_mock_entry")
 async def test_subscribe_topic_not_initialize(
     hass: HomeAssistant, record_calls: MessageCallbackType
@@ -570,6 +570,43 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+async def test_unchanged_discovery_payload_ignored(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an unchanged discovery payload is ignored before it is parsed."""
+    await mqtt_mock_entry()
+    payload = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object"
+    ) as json_loads_object:
+        async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+        await hass.async_block_till_done()
+    assert not json_loads_object.called
+    assert "Ignoring unchanged discovery payload: binary_sensor bla" in caplog.text
+
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer").name == "Milk"
+
+    # After the removal the same payload is discovered again
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+
 async def test_removal(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
@@ -13,7 +13,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -372,3 +372,35 @@ async def test_waiting_for_client_with_disabled_entry(
 
     # returns False because entry is disabled
     assert not await mqtt.async_wait_for_mqtt_client(hass)
+
+
+def test_topic_trie() -> None:
+    """Test matching topics against topic filters with a trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in (
+        "sport/tennis/player1",
+        "sport/tennis/+",
+        "sport/#",
+        "+/+/player1",
+        "#",
+        "$SYS/#",
+        "+/monitor/Clients",
+    ):
+        trie.add(topic_filter, topic_filter)
+
+    assert sorted(trie.matches("sport/tennis/player1")) == sorted(
+        ["sport/tennis/player1", "sport/tennis/+", "sport/#", "+/+/player1", "#"]
+    )
+    # A multi level wildcard also matches the parent level
+    assert sorted(trie.matches("sport")) == ["#", "sport/#"]
+    assert sorted(trie.matches("sport/tennis")) == ["#", "sport/#"]
+    # Wildcards on the first level don't match topics starting with $
+    assert trie.matches("$SYS/monitor/Clients") == ["$SYS/#"]
+
+    trie.remove("sport/#", "sport/#")
+    trie.remove("#", "#")
+    assert sorted(trie.matches("sport")) == []
+    with pytest.raises(KeyError):
+        trie.remove("sport/#", "sport/#")
+    with pytest.raises(KeyError):
+        trie.remove("unknown/topic", "unknown/topic")
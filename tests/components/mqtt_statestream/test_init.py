@@ -1,18 +1,29 @@
 """The tests for the MQTT statestream component."""
 
-from unittest.mock import ANY, call
+from unittest.mock import ANY
 
 import pytest
 
+from homeassistant.components.mqtt.const import MQTT_CONNECTION_STATE
 import homeassistant.components.mqtt_statestream as statestream
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.setup import async_setup_component
 
 from tests.common import MockEntity, MockEntityPlatform, mock_state_change_event
 from tests.typing import MqttMockHAClient
 
 
+def _published(mqtt_mock: MqttMockHAClient) -> list[tuple[str, str, int, bool]]:
+    """Return the messages published in bulk."""
+    return [
+        (message.topic, message.payload, message.qos, message.retain)
+        for bulk_call in mqtt_mock.async_publish_bulk.call_args_list
+        for message in bulk_call.args[0]
+    ]
+
+
 async def add_statestream(
     hass: HomeAssistant,
     base_topic=None,
@@ -69,7 +80,7 @@ async def test_setup_and_stop_waits_for_ha(
     await hass.async_block_till_done()
 
     # Make sure 'on' was not published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_not_called()
+    mqtt_mock.async_publish_bulk.assert_not_called()
 
     # HA is starting up
     await hass.async_start()
@@ -80,8 +91,8 @@ async def test_setup_and_stop_waits_for_ha(
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "off", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "off", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
     mqtt_mock.reset_mock()
 
     # HA is shutting down
@@ -94,7 +105,7 @@ async def test_setup_and_stop_waits_for_ha(
     await hass.async_block_till_done()
 
     # Make sure 'on' was not published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_not_called()
+    mqtt_mock.async_publish_bulk.assert_not_called()
 
 
 # We use xfail with this test because there is an unhandled exception
@@ -135,7 +146,7 @@ async def test_state_changed_event_sends_message(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State(e_id, "on"))
@@ -143,9 +154,9 @@ async def test_state_changed_event_sends_message(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
-    mqtt_mock.async_publish.reset_mock()
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Create a test entity and add it to hass
     platform = MockEntityPlatform(hass)
@@ -153,10 +164,13 @@ async def test_state_changed_event_sends_message(
     await platform.async_add_entities([entity])
     await hass.async_block_till_done()
 
-    mqtt_mock.async_publish.assert_called_with(
-        "pub/test_domain/test_platform_1234/state", "unknown", 1, True
+    assert _published(mqtt_mock)[-1] == (
+        "pub/test_domain/test_platform_1234/state",
+        "unknown",
+        1,
+        True,
     )
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     state = hass.states.get("test_domain.test_platform_1234")
     assert state is not None
@@ -165,7 +179,7 @@ async def test_state_changed_event_sends_message(
     hass.states.async_remove("test_domain.test_platform_1234")
     await hass.async_block_till_done()
     await hass.async_block_till_done()
-    mqtt_mock.async_publish.assert_not_called()
+    mqtt_mock.async_publish_bulk.assert_not_called()
 
 
 async def test_state_changed_event_sends_message_and_timestamp(
@@ -183,7 +197,7 @@ async def test_state_changed_event_sends_message_and_timestamp(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State(e_id, "on"))
@@ -192,13 +206,15 @@ async def test_state_changed_event_sends_message_and_timestamp(
 
     # Make sure 'on' was published to pub/fake/entity/state
     calls = [
-        call.async_publish("pub/another/entity/state", "on", 1, True),
-        call.async_publish("pub/another/entity/last_changed", ANY, 1, True),
-        call.async_publish("pub/another/entity/last_updated", ANY, 1, True),
+        ("pub/another/entity/state", "on", 1, True),
+        ("pub/another/entity/last_changed", ANY, 1, True),
+        ("pub/another/entity/last_updated", ANY, 1, True),
     ]
 
-    mqtt_mock.async_publish.assert_has_calls(calls, any_order=True)
-    assert mqtt_mock.async_publish.called
+    published = _published(mqtt_mock)
+    for expected in calls:
+        assert expected in published
+    assert mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_attr_sends_message(
@@ -214,7 +230,7 @@ async def test_state_changed_attr_sends_message(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     test_attributes = {"testing": "YES", "list": ["a", "b", "c"], "bool": False}
 
@@ -225,14 +241,108 @@ async def test_state_changed_attr_sends_message(
 
     # Make sure 'on' was published to pub/fake/entity/state
     calls = [
-        call.async_publish("pub/fake/entity/state", "off", 1, True),
-        call.async_publish("pub/fake/entity/testing", '"YES"', 1, True),
-        call.async_publish("pub/fake/entity/list", '["a", "b", "c"]', 1, True),
-        call.async_publish("pub/fake/entity/bool", "false", 1, True),
+        ("pub/fake/entity/state", "off", 1, True),
+        ("pub/fake/entity/testing", '"YES"', 1, True),
+        ("pub/fake/entity/list", '["a", "b", "c"]', 1, True),
+        ("pub/fake/entity/bool", "false", 1, True),
     ]
 
-    mqtt_mock.async_publish.assert_has_calls(calls, any_order=True)
-    assert mqtt_mock.async_publish.called
+    published = _published(mqtt_mock)
+    for expected in calls:
+        assert expected in published
+    assert mqtt_mock.async_publish_bulk.called
+
+
+async def test_state_changed_publishes_changes_only(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Test only the state and attributes which changed are published again."""
+    e_id = "fake.entity"
+    assert await add_statestream(hass, base_topic="pub", publish_attributes=True)
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    mock_state_change_event(
+        hass, State(e_id, "off", attributes={"testing": "YES", "bool": False})
+    )
+    await hass.async_block_till_done()
+    assert len(_published(mqtt_mock)) == 3
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    mock_state_change_event(
+        hass, State(e_id, "off", attributes={"testing": "NO", "bool": False})
+    )
+    await hass.async_block_till_done()
+    assert _published(mqtt_mock) == [("pub/fake/entity/testing", '"NO"', 1, True)]
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    # Once removed, everything is published again
+    hass.states.async_set(e_id, "off", {"testing": "NO", "bool": False})
+    hass.states.async_remove(e_id)
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish_bulk.reset_mock()
+    mock_state_change_event(
+        hass, State(e_id, "off", attributes={"testing": "NO", "bool": False})
+    )
+    await hass.async_block_till_done()
+    assert len(_published(mqtt_mock)) == 3
+
+
+async def test_connection_change_publishes_everything_again(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Test everything is published again after the MQTT connection changed."""
+    e_id = "fake.entity"
+    assert await add_statestream(hass, base_topic="pub", publish_attributes=True)
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    mock_state_change_event(
+        hass, State(e_id, "off", attributes={"testing": "YES", "bool": False})
+    )
+    await hass.async_block_till_done()
+    assert len(_published(mqtt_mock)) == 3
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    # The broker may have restarted and lost the retained messages
+    async_dispatcher_send(hass, MQTT_CONNECTION_STATE, False)
+    async_dispatcher_send(hass, MQTT_CONNECTION_STATE, True)
+    mock_state_change_event(
+        hass, State(e_id, "off", attributes={"testing": "NO", "bool": False})
+    )
+    await hass.async_block_till_done()
+    assert sorted(_published(mqtt_mock)) == [
+        ("pub/fake/entity/bool", "false", 1, True),
+        ("pub/fake/entity/state", "off", 1, True),
+        ("pub/fake/entity/testing", '"NO"', 1, True),
+    ]
+
+
+async def test_state_changed_publishes_failed_again(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Test messages failing to be transmitted are published with the next change."""
+    e_id = "fake.entity"
+    assert await add_statestream(hass, base_topic="pub", publish_attributes=True)
+    await hass.async_block_till_done()
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    mock_state_change_event(hass, State(e_id, "off", attributes={"testing": "YES"}))
+    await hass.async_block_till_done()
+    messages = mqtt_mock.async_publish_bulk.call_args.args[0]
+    assert len(messages) == 2
+    failed_callback = mqtt_mock.async_publish_bulk.call_args.kwargs["failed_callback"]
+    failed_callback(
+        [message for message in messages if message.topic.endswith("state")]
+    )
+    mqtt_mock.async_publish_bulk.reset_mock()
+
+    mock_state_change_event(hass, State(e_id, "off", attributes={"testing": "NO"}))
+    await hass.async_block_till_done()
+    assert _published(mqtt_mock) == [
+        ("pub/fake/entity/state", "off", 1, True),
+        ("pub/fake/entity/testing", '"NO"', 1, True),
+    ]
 
 
 async def test_state_changed_event_include_domain(
@@ -253,7 +363,7 @@ async def test_state_changed_event_include_domain(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -261,16 +371,16 @@ async def test_state_changed_event_include_domain(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake2.entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_include_entity(
@@ -291,7 +401,7 @@ async def test_state_changed_event_include_entity(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -299,16 +409,16 @@ async def test_state_changed_event_include_entity(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake.entity2", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_exclude_domain(
@@ -329,7 +439,7 @@ async def test_state_changed_event_exclude_domain(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -337,16 +447,16 @@ async def test_state_changed_event_exclude_domain(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake2.entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_exclude_entity(
@@ -367,7 +477,7 @@ async def test_state_changed_event_exclude_entity(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -375,16 +485,16 @@ async def test_state_changed_event_exclude_entity(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake.entity2", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_exclude_domain_include_entity(
@@ -405,7 +515,7 @@ async def test_state_changed_event_exclude_domain_include_entity(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -413,16 +523,16 @@ async def test_state_changed_event_exclude_domain_include_entity(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake.entity2", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_include_domain_exclude_entity(
@@ -443,7 +553,7 @@ async def test_state_changed_event_include_domain_exclude_entity(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -451,16 +561,16 @@ async def test_state_changed_event_include_domain_exclude_entity(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake.entity2", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_include_globs(
@@ -481,7 +591,7 @@ async def test_state_changed_event_include_globs(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity with included glob
     mock_state_change_event(hass, State("fake2.included_entity", "on"))
@@ -489,18 +599,21 @@ async def test_state_changed_event_include_globs(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake2/included_entity/state
-    mqtt_mock.async_publish.assert_called_with(
-        "pub/fake2/included_entity/state", "on", 1, True
+    assert _published(mqtt_mock)[-1] == (
+        "pub/fake2/included_entity/state",
+        "on",
+        1,
+        True,
     )
-    assert mqtt_mock.async_publish.called
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake2.entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_exclude_globs(
@@ -521,7 +634,7 @@ async def test_state_changed_event_exclude_globs(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -529,16 +642,16 @@ async def test_state_changed_event_exclude_globs(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included by glob
     mock_state_change_event(hass, State("fake.excluded_entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_exclude_domain_globs_include_entity(
@@ -559,7 +672,7 @@ async def test_state_changed_event_exclude_domain_globs_include_entity(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -567,36 +680,39 @@ async def test_state_changed_event_exclude_domain_globs_include_entity(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that doesn't match any filters
     mock_state_change_event(hass, State("fake2.included_entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with(
-        "pub/fake2/included_entity/state", "on", 1, True
+    assert _published(mqtt_mock)[-1] == (
+        "pub/fake2/included_entity/state",
+        "on",
+        1,
+        True,
     )
-    assert mqtt_mock.async_publish.called
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included by domain
     mock_state_change_event(hass, State("fake.entity2", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included by glob
     mock_state_change_event(hass, State("fake.excluded_entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
 
 async def test_state_changed_event_include_domain_globs_exclude_entity(
@@ -617,7 +733,7 @@ async def test_state_changed_event_include_domain_globs_exclude_entity(
 
     # Reset the mock because it will have already gotten calls for the
     # mqtt_statestream state change on initialization, etc.
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
 
     # Set a state of an entity included by domain
     mock_state_change_event(hass, State("fake.entity", "on"))
@@ -625,33 +741,36 @@ async def test_state_changed_event_include_domain_globs_exclude_entity(
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with("pub/fake/entity/state", "on", 1, True)
-    assert mqtt_mock.async_publish.called
+    assert _published(mqtt_mock)[-1] == ("pub/fake/entity/state", "on", 1, True)
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity included by glob
     mock_state_change_event(hass, State("fake.included_entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
     # Make sure 'on' was published to pub/fake/entity/state
-    mqtt_mock.async_publish.assert_called_with(
-        "pub/fake/included_entity/state", "on", 1, True
+    assert _published(mqtt_mock)[-1] == (
+        "pub/fake/included_entity/state",
+        "on",
+        1,
+        True,
     )
-    assert mqtt_mock.async_publish.called
+    assert mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that shouldn't be included
     mock_state_change_event(hass, State("fake.entity2", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
 
-    mqtt_mock.async_publish.reset_mock()
+    mqtt_mock.async_publish_bulk.reset_mock()
     # Set a state of an entity that doesn't match any filters
     mock_state_change_event(hass, State("fake2.entity", "on"))
     await hass.async_block_till_done()
     await hass.async_block_till_done()
 
-    assert not mqtt_mock.async_publish.called
+    assert not mqtt_mock.async_publish_bulk.called
@@ -942,6 +942,47 @@ async def test_input_boolean(
     ).withValue(0.0).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_exposition_cache(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    input_boolean_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test changed metrics are rendered again within the scrape time budget."""
+    metric = EntityMetric(
+        metric_name="input_boolean_state",
+        domain="input_boolean",
+        friendly_name="Test",
+        entity="input_boolean.test",
+    )
+    body = await generate_latest_metrics(client)
+    metric.withValue(1).assert_in_metrics(body)
+    assert "prometheus_scrape_stale_metrics 0.0" in body
+
+    hass.states.async_set("input_boolean.test", STATE_OFF, {"friendly_name": "Test"})
+    await hass.async_block_till_done()
+    with mock.patch(f"{PROMETHEUS_PATH}.SCRAPE_TIME_BUDGET", -1):
+        body = await generate_latest_metrics(client)
+    # No time to render the changed metrics again
+    metric.withValue(1).assert_in_metrics(body)
+    assert "prometheus_scrape_stale_metrics 0.0" not in body
+
+    body = await generate_latest_metrics(client)
+    metric.withValue(0).assert_in_metrics(body)
+    assert "prometheus_scrape_stale_metrics 0.0" in body
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=1.0.0"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    body = (await resp.text()).split("\n")
+    assert body[-2:] == ["# EOF", ""]
+    assert body.count("# EOF") == 1
+    metric.withValue(0).assert_in_metrics(body)
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_light(
     client: ClientSessionGenerator, light_entities: dict[str, er.RegistryEntry]
@@ -0,0 +1,101 @@
+"""Test the sample buffer of the statistics sensor."""
+
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.buffer import SampleBuffer
+from homeassistant.util import dt as dt_util
+
+
+@pytest.mark.parametrize("max_size", [None, 1, 2, 5, 20])
+def test_statistics_follow_samples(max_size: int | None) -> None:
+    """Test the statistics equal the ones calculated over all samples."""
+    rng = random.Random(max_size)
+    buffer = SampleBuffer(max_size)
+    age = dt_util.utcnow()
+
+    for _ in range(200):
+        if buffer.states and rng.random() < 0.25:
+            buffer.popleft()
+        else:
+            age += timedelta(seconds=rng.randint(1, 100))
+            # Large samples with little variance used to lose precision
+            value = rng.choice([round(rng.uniform(-50, 100), 2), 1e6 + rng.random()])
+            buffer.append(value, age)
+
+        values = list(buffer.states)
+        ages: list[datetime] = list(buffer.ages)
+        assert max_size is None or len(buffer) <= max_size
+        if not values:
+            continue
+
+        assert buffer.sum == pytest.approx(math.fsum(values))
+        assert buffer.min == min(values)
+        assert buffer.max == max(values)
+        assert buffer.min_age == ages[values.index(min(values))]
+        assert buffer.max_age == ages[values.index(max(values))]
+        assert buffer.median() == statistics.median(values)
+        if len(values) < 2:
+            continue
+
+        assert buffer.variance() == pytest.approx(
+            statistics.variance(values), rel=1e-12
+        )
+        quantiles = statistics.quantiles(values, n=100, method="exclusive")
+        assert buffer.quantile(95, 100) == pytest.approx(quantiles[94])
+        assert buffer.sum_differences == pytest.approx(
+            math.fsum(abs(j - i) for i, j in zip(values, values[1:], strict=False))
+        )
+        assert buffer.area_step == pytest.approx(
+            math.fsum(
+                value * (ages[i + 1] - ages[i]).total_seconds()
+                for i, value in enumerate(values[:-1])
+            )
+        )
+
+
+def test_binary_samples() -> None:
+    """Test counting binary samples while the buffer is full."""
+    buffer = SampleBuffer(3)
+    age = dt_util.utcnow()
+    for state in (True, True, False, True, False):
+        age += timedelta(seconds=10)
+        buffer.append(state, age)
+
+    assert list(buffer.states) == [False, True, False]
+    assert buffer.count_on == 1
+    assert buffer.area_step == 10
+
+    buffer.popleft()
+    buffer.popleft()
+    buffer.popleft()
+    assert len(buffer) == 0
+    assert buffer.count_on == 0
+    assert buffer.sum == 0
+
+
+@pytest.mark.parametrize("value", [math.inf, -math.inf, math.nan])
+def test_non_finite_samples(value: float) -> None:
+    """Test non-finite samples are rejected without changing the buffer."""
+    buffer = SampleBuffer(2)
+    age = dt_util.utcnow()
+    buffer.append(1.0, age)
+    buffer.append(3.0, age + timedelta(seconds=10))
+
+    with pytest.raises(ValueError):
+        buffer.append(value, age + timedelta(seconds=20))
+
+    assert list(buffer.states) == [1.0, 3.0]
+    assert buffer.sum == 4.0
+    assert buffer.variance() == 2.0
+    assert buffer.max == 3.0
+
+    buffer.append(5.0, age + timedelta(seconds=30))
+    buffer.popleft()
+    assert list(buffer.states) == [5.0]
+    assert buffer.sum == 5.0
+    assert buffer.min == buffer.max == 5.0
@@ -9,7 +9,11 @@ from unittest.mock import patch
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE_MEMORY,
+    DEFAULT_STORED_TRACES,
+    DEFAULT_TRACE_MEMORY_BUDGET,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -602,6 +606,138 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_memory_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the least recently used traces are evicted when over the budget."""
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+    # Compact the traces as soon as they finish
+    hass.data[DATA_TRACE_MEMORY].active_window = 0
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/memory"})
+    response = await client.receive_json()
+    assert response["success"]
+    stats = response["result"]
+    assert stats["traces"] == 2
+    assert stats["active_traces"] == 0
+    assert stats["compacted_traces"] == 2
+    assert 0 < stats["size"] < stats["budget"] == DEFAULT_TRACE_MEMORY_BUDGET
+    assert stats["evicted"] == 0
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    sun_run_id = _find_run_id(response["result"], domain, "sun")
+    moon_run_id = _find_run_id(response["result"], domain, "moon")
+
+    # Viewing the "sun" trace makes the "moon" trace the least recently used
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": sun_run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["trace"]
+
+    hass.data[DATA_TRACE_MEMORY].budget = stats["size"] + stats["size"] // 4
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    assert len(moon_traces) == 1
+    assert moon_traces[0]["run_id"] != moon_run_id
+    assert _find_run_id(response["result"], domain, "sun") == sun_run_id
+
+    await client.send_json({"id": next_id(), "type": "trace/memory"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["traces"] == 2
+    assert response["result"]["evicted"] == 1
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_compacted_leaving_active_window(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test traces are compacted once they leave the active window."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+    memory = hass.data[DATA_TRACE_MEMORY]
+    memory.active_window = 1
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    stats = memory.async_stats()
+    assert stats["active_traces"] == 1
+    assert stats["compacted_traces"] == 0
+    assert stats["size"] == 0
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    stats = memory.async_stats()
+    assert stats["traces"] == 2
+    assert stats["active_traces"] == 1
+    assert stats["compacted_traces"] == 1
+    assert stats["size"] > 0
+
+    # Both the active and the compacted trace can be viewed
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == 2
+    for msg_id, trace in enumerate(traces, 2):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": trace["run_id"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["trace"]
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -2544,12 +2544,18 @@ async def test_integration_setup_info(
     hass_admin_user: MockUser,
 ) -> None:
     """Test subscribe/unsubscribe bootstrap_integrations."""
-    with patch(
-        "homeassistant.components.websocket_api.commands.async_get_setup_timings",
-        return_value={
-            "august": 12.5,
-            "isy994": 12.8,
-        },
+    with (
+        patch(
+            "homeassistant.components.websocket_api.commands.async_get_setup_timings",
+            return_value={
+                "august": 12.5,
+                "isy994": 12.8,
+            },
+        ),
+        patch(
+            "homeassistant.components.websocket_api.commands.async_get_import_timings",
+            return_value={"august": 1.5},
+        ),
     ):
         await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
         msg = await websocket_client.receive_json()
@@ -2558,8 +2564,8 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": 0.0},
     ]
 
 
@@ -18,7 +18,7 @@ from homeassistant.const import (
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import Context, HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConditionError, HomeAssistantError
 from homeassistant.helpers import (
     condition,
@@ -1250,6 +1250,80 @@ async def test_state_multiple_entities(hass: HomeAssistant) -> None:
     assert not test(hass)
 
 
+async def test_state_condition_cache(hass: HomeAssistant) -> None:
+    """Test identical state conditions share their result within a context."""
+    config = {
+        "condition": "state",
+        "entity_id": "sensor.temperature",
+        "state": "100",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test1 = await condition.async_from_config(hass, config)
+    test2 = await condition.async_from_config(hass, dict(config))
+
+    context = Context()
+    hass.states.async_set("sensor.temperature", 100)
+    with condition.async_condition_cache(hass, context):
+        assert test1(hass)
+        assert test2(hass)
+    assert_condition_trace(
+        {
+            "": [
+                {"result": {"result": True}},
+                {"result": {"result": True, "cached": True, "cache_hits": 1}},
+            ],
+            "entity_id/0": [
+                {"result": {"result": True, "state": "100", "wanted_state": "100"}},
+            ],
+        }
+    )
+
+    # A state change invalidates the shared result
+    hass.states.async_set("sensor.temperature", 101)
+    with condition.async_condition_cache(hass, context):
+        assert not test2(hass)
+        assert not test1(hass)
+
+    # Results are not shared with other contexts or outside a context
+    hass.states.async_set("sensor.temperature", 100)
+    with (
+        patch("homeassistant.helpers.condition.state", return_value=True) as mock_state,
+        condition.async_condition_cache(hass, Context()),
+    ):
+        assert test1(hass)
+        assert test2(hass)
+    assert mock_state.call_count == 1
+    with patch(
+        "homeassistant.helpers.condition.state", return_value=True
+    ) as mock_state:
+        assert test1(hass)
+        assert test2(hass)
+    assert mock_state.call_count == 2
+
+
+async def test_state_condition_with_for_not_cached(hass: HomeAssistant) -> None:
+    """Test state conditions with a duration are not shared."""
+    config = {
+        "condition": "state",
+        "entity_id": "sensor.temperature",
+        "state": "100",
+        "for": {"seconds": 5},
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100)
+    with (
+        patch("homeassistant.helpers.condition.state", return_value=True) as mock_state,
+        condition.async_condition_cache(hass, Context()),
+    ):
+        assert test(hass)
+        assert test(hass)
+    assert mock_state.call_count == 2
+
+
 async def test_state_multiple_entities_match_any(hass: HomeAssistant) -> None:
     """Test with multiple entities in condition with match any."""
     config = {
@@ -0,0 +1,81 @@
+"""Test the config item cache helper."""
+
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.config_item_cache import async_get_config_item_cache
+from homeassistant.util.yaml.objects import NodeDictClass
+
+
+def _item(config: dict, config_file: str) -> NodeDictClass:
+    """Return a config item loaded from a file."""
+    item = NodeDictClass(config)
+    item.__config_file__ = config_file
+    item.__line__ = 1
+    return item
+
+
+async def test_reuse_unchanged_items(hass: HomeAssistant) -> None:
+    """Test only added and changed items are validated again."""
+    cache = async_get_config_item_cache(hass, "test", lambda validated: True)
+    assert async_get_config_item_cache(hass, "test", lambda validated: True) is cache
+
+    validate = AsyncMock(side_effect=lambda: object())
+    first = await cache.async_validate(_item({"a": 1}, "a.yaml"), validate)
+    await cache.async_validate(_item({"b": 1}, "b.yaml"), validate)
+    cache.async_finish()
+    assert validate.call_count == 2
+
+    assert await cache.async_validate(_item({"a": 1}, "a.yaml"), validate) is first
+    await cache.async_validate(_item({"b": 2}, "b.yaml"), validate)
+    # The same content in an other file or with an other key is validated
+    await cache.async_validate(_item({"a": 1}, "c.yaml"), validate)
+    await cache.async_validate(_item({"a": 1}, "a.yaml"), validate, "key")
+    cache.async_finish()
+    assert validate.call_count == 5
+    stats = cache.stats
+    assert stats.items == 4
+    assert stats.hits == 1
+    assert stats.misses == 5
+
+
+async def test_items_not_reusable(hass: HomeAssistant) -> None:
+    """Test items which failed or are not reusable are validated every time."""
+    cache = async_get_config_item_cache(
+        hass, "test", lambda validated: validated == "ok"
+    )
+    validate_failed = AsyncMock(return_value=None)
+    validate_not_reusable = AsyncMock(return_value="not ok")
+
+    for _ in range(2):
+        assert await cache.async_validate({"a": 1}, validate_failed) is None
+        assert await cache.async_validate({"b": 1}, validate_not_reusable) == "not ok"
+        cache.async_finish()
+
+    assert validate_failed.call_count == 2
+    assert validate_not_reusable.call_count == 2
+    assert cache.stats.items == 0
+
+
+async def test_clear_on_entity_rename(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test items are validated again after an entity was renamed."""
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    cache = async_get_config_item_cache(hass, "test", lambda validated: True)
+    validate = AsyncMock(side_effect=lambda: object())
+
+    await cache.async_validate({"entity_id": entry.id}, validate)
+    cache.async_finish()
+    entity_registry.async_update_entity(entry.entity_id, name="Kitchen")
+    await hass.async_block_till_done()
+    await cache.async_validate({"entity_id": entry.id}, validate)
+    cache.async_finish()
+    assert validate.call_count == 1
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.kitchen")
+    await hass.async_block_till_done()
+    assert cache.stats.items == 0
+    await cache.async_validate({"entity_id": entry.id}, validate)
+    assert validate.call_count == 2
@@ -4,6 +4,7 @@ from collections import OrderedDict
 from datetime import date, datetime, timedelta
 import enum
 from functools import partial
+import gc
 import logging
 import os
 import re
@@ -1949,3 +1950,52 @@ async def test_is_entity_service_schema(
         vol.All(vol.Schema(cv.make_entity_service_schema({"some": str}))),
     ):
         assert cv.is_entity_service_schema(schema) is True
+
+
+async def test_memoized_schema(hass: HomeAssistant) -> None:
+    """Test memoized schemas reuse earlier results."""
+
+    def validate(value: dict[str, Any]) -> dict[str, Any]:
+        if "value" not in value:
+            raise vol.Invalid("value missing")
+        return {"value": [value["value"]]}
+
+    validator = Mock(side_effect=validate)
+    schema = cv.MemoizedSchema("test", validator, max_size=2)
+
+    result = schema({"value": 1})
+    assert result == {"value": [1]}
+    result["value"].append(2)
+    assert schema({"value": 1}) == {"value": [1]}
+    assert validator.call_count == 1
+
+    # Equal but not of the same type
+    assert schema({"value": True}) == {"value": [True]}
+    assert validator.call_count == 2
+
+    # The least recently used result is dropped
+    schema({"value": 2})
+    schema({"value": 1})
+    assert validator.call_count == 4
+
+    # Failures and unhashable data are not memoized
+    for _ in range(2):
+        with pytest.raises(vol.Invalid):
+            schema({})
+        schema({"value": object()})
+    assert validator.call_count == 8
+
+    assert cv.get_memoized_schema_stats()["test"] == cv.MemoizedSchemaStats(
+        size=2, hits=1, misses=6, validate_seconds=ANY
+    )
+
+    # Validation outside the event loop is not memoized
+    assert await hass.async_add_executor_job(schema, {"value": 3}) == {"value": [3]}
+    assert await hass.async_add_executor_job(schema, {"value": 3}) == {"value": [3]}
+    assert validator.call_count == 10
+    assert schema.stats.size == 2
+
+    # Schemas which are no longer used are not listed
+    del schema
+    gc.collect()
+    assert "test" not in cv.get_memoized_schema_stats()
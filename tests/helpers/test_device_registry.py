@@ -1508,10 +1508,12 @@ async def test_specifying_via_device_create(
     )
 
     assert light.via_device_id == via.id
+    assert device_registry.devices.get_devices_for_via_device_id(via.id) == [light]
 
     device_registry.async_remove_device(via.id)
     light = device_registry.async_get_device(identifiers={("hue", "456")})
     assert light.via_device_id is None
+    assert not device_registry.devices.get_devices_for_via_device_id(via.id)
 
 
 async def test_specifying_via_device_update(
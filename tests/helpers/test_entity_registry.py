@@ -2116,6 +2116,21 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_label(entity_registry, "")
 
 
+async def test_entries_for_platform(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries by platform."""
+    hue_1 = entity_registry.async_get_or_create("light", "hue", "123")
+    entity_registry.async_get_or_create("light", "mqtt", "123")
+    hue_2 = entity_registry.async_get_or_create("sensor", "hue", "456")
+    assert entity_registry.entities.get_entries_for_platform("hue") == [hue_1, hue_2]
+
+    hue_1 = entity_registry.async_update_entity_platform(hue_1.entity_id, "deconz")
+    assert entity_registry.entities.get_entries_for_platform("hue") == [hue_2]
+    assert entity_registry.entities.get_entries_for_platform("deconz") == [hue_1]
+
+    entity_registry.async_remove(hue_2.entity_id)
+    assert not entity_registry.entities.get_entries_for_platform("hue")
+
+
 async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     """Make sure we can clear categories."""
     entry = entity_registry.async_get_or_create(
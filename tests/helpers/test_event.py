@@ -3593,7 +3593,7 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
     This test is to ensure that when a name is passed to async_track_time_interval,
-    that the name can be found in the TimerHandle when stringified.
+    that the name can be found in the TimerWheelHandle when stringified.
     """
     specific_runs = []
     unique_string = "xZ13"
@@ -3604,11 +3604,14 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         timedelta(seconds=10),
         name=unique_string,
     )
-    scheduled = getattr(hass.loop, "_scheduled")
-    assert any(handle for handle in scheduled if unique_string in str(handle))
+    assert any(
+        handle for handle in hass.timer_wheel.handles() if unique_string in str(handle)
+    )
     unsub()
 
-    assert all(handle for handle in scheduled if unique_string not in str(handle))
+    assert not any(
+        handle for handle in hass.timer_wheel.handles() if unique_string in str(handle)
+    )
     await hass.async_block_till_done()
 
 
@@ -0,0 +1,187 @@
+"""Test execution pool helper."""
+
+import asyncio
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.execution_pool import (
+    ExecutionPool,
+    ExecutionPoolFullError,
+    ExecutionPoolTimeoutError,
+    async_get_execution_pool,
+    async_get_execution_pool_stats,
+)
+
+
+async def test_limits_concurrency() -> None:
+    """Test no more than the maximum number of runs hold a slot."""
+    pool = ExecutionPool("test", 2)
+    release = asyncio.Event()
+    running = 0
+    max_running = 0
+
+    async def run() -> None:
+        nonlocal running, max_running
+        async with pool.async_slot("owner"):
+            running += 1
+            max_running = max(running, max_running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(run()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert pool.stats.running == 2
+    assert pool.stats.queued == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert max_running == 2
+    stats = pool.stats
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.max_queued == 3
+    assert stats.completed == 5
+
+
+async def test_round_robin_between_owners() -> None:
+    """Test waiters of different owners are woken in turns."""
+    pool = ExecutionPool("test", 1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def run(owner: str) -> None:
+        async with pool.async_slot(owner):
+            order.append(owner)
+            await release.wait()
+
+    blocker = asyncio.create_task(run("blocker"))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(run("burst")) for _ in range(3)]
+    tasks.append(asyncio.create_task(run("other")))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+    assert order == ["blocker", "burst", "other", "burst", "burst"]
+
+
+async def test_timeout_and_full_queue() -> None:
+    """Test waiting for a slot times out and a full queue rejects runs."""
+    pool = ExecutionPool("test", 1, timeout=0.01, max_queued=1)
+    release = asyncio.Event()
+
+    async def run() -> None:
+        async with pool.async_slot("owner"):
+            await release.wait()
+
+    holder = asyncio.create_task(run())
+    waiter = asyncio.create_task(run())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ExecutionPoolFullError):
+        await run()
+
+    with pytest.raises(ExecutionPoolTimeoutError):
+        await waiter
+
+    release.set()
+    await holder
+    stats = pool.stats
+    assert stats.timeouts == 1
+    assert stats.rejected == 1
+    assert stats.queued == 0
+    assert stats.running == 0
+
+
+async def test_cancel_while_waiting() -> None:
+    """Test a cancelled waiter leaves the queue."""
+    pool = ExecutionPool("test", 1)
+    release = asyncio.Event()
+
+    async def run() -> None:
+        async with pool.async_slot("owner"):
+            await release.wait()
+
+    holder = asyncio.create_task(run())
+    waiter = asyncio.create_task(run())
+    await asyncio.sleep(0)
+    assert pool.stats.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert pool.stats.queued == 0
+
+    release.set()
+    await holder
+    assert pool.stats.running == 0
+
+
+async def test_reentry_shares_slot() -> None:
+    """Test runs started while holding a slot share it instead of waiting."""
+    pool = ExecutionPool("test", 1, max_queued=0)
+    other = ExecutionPool("other", 1)
+    release = asyncio.Event()
+
+    async def nested() -> None:
+        async with pool.async_slot("nested"):
+            assert pool.stats.running == 1
+        async with other.async_slot("nested"):
+            assert other.stats.running == 1
+
+    async def run() -> None:
+        async with pool.async_slot("owner"):
+            # A task started in the slot, like a script calling another script
+            await asyncio.wait_for(asyncio.create_task(nested()), 1)
+            await release.wait()
+
+    holder = asyncio.create_task(run())
+    await asyncio.sleep(0.01)
+    assert pool.stats.running == 1
+    assert other.stats.completed == 1
+
+    # Runs not started from the slot still have to wait for one
+    with pytest.raises(ExecutionPoolFullError):
+        async with pool.async_slot("owner"):
+            pass
+
+    release.set()
+    await holder
+    assert pool.stats.running == 0
+    assert pool.stats.completed == 1
+
+
+async def test_get_execution_pool(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test pools are shared by name and conflicting limits are rejected."""
+    pool = async_get_execution_pool(hass, "radio", "script.one", 4)
+    assert async_get_execution_pool(hass, "radio", "script.two", 4) is pool
+    assert async_get_execution_pool_stats(hass) == {"radio": pool.stats}
+
+    assert async_get_execution_pool(hass, "radio", "script.two", 2, 5.0) is pool
+    assert pool.max_concurrent == 4
+    assert pool.timeout is None
+    assert "Execution pool radio is defined with other limits" in caplog.text
+
+    # An owner defining the pool alone can change its limits
+    other = async_get_execution_pool(hass, "tv", "script.one", 4)
+    async_get_execution_pool(hass, "tv", "script.one", 2, 5.0)
+    assert other.max_concurrent == 2
+    assert other.timeout == 5.0
+
+
+async def test_undefine_execution_pool(hass: HomeAssistant) -> None:
+    """Test owners which no longer use a pool don't pin its limits."""
+    pool = async_get_execution_pool(hass, "radio", "script.one", 4)
+    async_get_execution_pool(hass, "radio", "script.two", 4)
+
+    # Every owner changes the limits together, like on a reload
+    pool.async_undefine("script.one")
+    pool.async_undefine("script.two")
+    pool.async_undefine("script.unknown")
+    assert pool.max_concurrent == 4
+    async_get_execution_pool(hass, "radio", "script.one", 2)
+    async_get_execution_pool(hass, "radio", "script.two", 2)
+    assert pool.max_concurrent == 2
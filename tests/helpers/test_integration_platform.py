@@ -1,5 +1,6 @@
 """Test integration platform helpers."""
 
+import asyncio
 from collections.abc import Callable
 from types import ModuleType
 from typing import Any
@@ -12,7 +13,9 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
+    DATA_INTEGRATION_PLATFORMS,
     async_process_integration_platforms,
+    async_process_integration_platforms_on_demand,
 )
 from homeassistant.setup import ATTR_COMPONENT
 
@@ -59,6 +62,91 @@ async def test_process_integration_platforms_with_wait(hass: HomeAssistant) -> N
     assert len(processed) == 2
 
 
+async def test_process_integration_platforms_on_demand(
+    hass: HomeAssistant,
+) -> None:
+    """Test processing a platform on demand only processes it once."""
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    processed = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+    await asyncio.gather(
+        async_process_integration_platforms_on_demand(
+            hass, "platform_to_check", _process_platform
+        ),
+        async_process_integration_platforms_on_demand(
+            hass, "platform_to_check", _process_platform
+        ),
+    )
+    assert processed == [("loaded", loaded_platform)]
+    assert "platform_to_check" in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+    await async_process_integration_platforms_on_demand(
+        hass, "platform_to_check", _process_platform
+    )
+    assert processed == [("loaded", loaded_platform)]
+
+
+async def test_process_integration_platforms_on_demand_cancelled(
+    hass: HomeAssistant,
+) -> None:
+    """Test a platform is processed again when the first caller is cancelled."""
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    processed = []
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        started.set()
+        await finish.wait()
+        processed.append((domain, platform))
+
+    first = hass.async_create_task(
+        async_process_integration_platforms_on_demand(
+            hass, "platform_to_check", _process_platform
+        )
+    )
+    await started.wait()
+    second = hass.async_create_task(
+        async_process_integration_platforms_on_demand(
+            hass, "platform_to_check", _process_platform
+        )
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    finish.set()
+    await second
+    assert processed == [("loaded", loaded_platform)]
+    assert [
+        platform.platform_name
+        for platform in hass.data[DATA_INTEGRATION_PLATFORMS]
+        if platform.platform_name == "platform_to_check"
+    ] == ["platform_to_check"]
+
+    await async_process_integration_platforms_on_demand(
+        hass, "platform_to_check", _process_platform
+    )
+    assert processed == [("loaded", loaded_platform)]
+
+
 async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     """Test processing integrations."""
     loaded_platform = Mock()
@@ -280,6 +280,148 @@ async def test_calling_service_basic(
     )
 
 
+async def test_calling_static_service_prepared_once(hass: HomeAssistant) -> None:
+    """Test a service call without templates is only prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "action": "test.script",
+            "target": {"entity_id": "light.kitchen"},
+            "data": {"hello": "world"},
+        }
+    )
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel"
+    )
+
+    with patch(
+        "homeassistant.helpers.service.async_prepare_call_from_config",
+        wraps=script.service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert mock_prepare.call_count == 1
+    assert len(calls) == 2
+    for call in calls:
+        assert call.data == {"hello": "world", "entity_id": ["light.kitchen"]}
+
+
+async def test_calling_service_entity_registry_id_after_rename(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test a service call targeting a registry id follows entity id changes."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="kitchen"
+    )
+    sequence = cv.SCRIPT_SCHEMA(
+        {"action": "test.script", "target": {"entity_id": entry.id}}
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+    entity_registry.async_update_entity(
+        "light.kitchen", new_entity_id="light.dining_room"
+    )
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert [call.data["entity_id"] for call in calls] == [
+        ["light.kitchen"],
+        ["light.dining_room"],
+    ]
+
+
+async def test_execution_pool(hass: HomeAssistant) -> None:
+    """Test service calls of scripts sharing an execution pool are bounded."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls: list[ServiceCall] = []
+
+    async def slow_service(call: ServiceCall) -> None:
+        calls.append(call)
+        started.set()
+        await release.wait()
+
+    hass.services.async_register("test", "slow", slow_service)
+    sequence = cv.SCRIPT_SCHEMA({"action": "test.slow"})
+    pool_config = script.EXECUTION_POOL_SCHEMA({"name": "radio", "max": 1})
+    scripts = [
+        script.Script(
+            hass, sequence, f"Test {i}", "test_domain", execution_pool=pool_config
+        )
+        for i in range(2)
+    ]
+    pool = scripts[0].execution_pool
+    assert pool is not None
+    assert scripts[1].execution_pool is pool
+
+    for script_obj in scripts:
+        hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.wait_for(started.wait(), 1)
+    await asyncio.sleep(0)
+
+    assert len(calls) == 1
+    assert pool.stats.running == 1
+    assert pool.stats.queued == 1
+
+    release.set()
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert pool.stats.completed == 2
+
+
+async def test_release_execution_pool(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test scripts redefined with other pool limits replace the released ones."""
+    sequence = cv.SCRIPT_SCHEMA({"action": "test.script"})
+    old_config = script.EXECUTION_POOL_SCHEMA({"name": "radio", "max": 1})
+    old_scripts = [
+        script.Script(
+            hass, sequence, f"Test {i}", "test_domain", execution_pool=old_config
+        )
+        for i in range(2)
+    ]
+    for script_obj in old_scripts:
+        script_obj.async_release()
+
+    new_config = script.EXECUTION_POOL_SCHEMA({"name": "radio", "max": 3})
+    new_scripts = [
+        script.Script(
+            hass, sequence, f"Test {i}", "test_domain", execution_pool=new_config
+        )
+        for i in range(2)
+    ]
+    pool = new_scripts[0].execution_pool
+    assert pool is old_scripts[0].execution_pool
+    assert pool.max_concurrent == 3
+    assert "Execution pool radio is defined with other limits" not in caplog.text
+
+
+async def test_run_with_trace_disabled(hass: HomeAssistant) -> None:
+    """Test no trace elements are built while tracing is disabled."""
+    calls = async_mock_service(hass, "test", "script")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"condition": "template", "value_template": "{{ true }}"},
+            {"action": "test.script", "data": {"hello": "{{ 'world' }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with trace.trace_disabled():
+        await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"hello": "world"}
+    assert not trace.trace_get(clear=False)
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -741,6 +741,28 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_cached(hass: HomeAssistant) -> None:
+    """Test resolved targets are cached until a registry is updated."""
+    call = ServiceCall("light", "turn_on", {"area_id": "test-area"})
+
+    for _ in range(2):
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_area",
+            "light.assigned_to_area",
+        }
+    stats = service.async_get_target_resolution_stats(hass)
+    assert (stats.size, stats.hits, stats.misses) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+    er.async_get(hass).async_update_entity(
+        "light.assigned_to_area", area_id="diff-area"
+    )
+    assert await service.async_extract_entity_ids(hass, call) == {"light.in_area"}
+    stats = service.async_get_target_resolution_stats(hass)
+    assert (stats.size, stats.hits, stats.misses) == (1, 1, 2)
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
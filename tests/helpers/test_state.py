@@ -172,3 +172,11 @@ async def test_as_number_invalid_cases(hass: HomeAssistant) -> None:
     for _state in ("", "foo", "foo.bar", None, False, True, object, object()):
         with pytest.raises(ValueError):
             state.state_as_number(State("domain.test", _state, {}))
+
+
+async def test_state_value_as_numbers(hass: HomeAssistant) -> None:
+    """Test coercing state values to a float and a number."""
+    assert state.state_value_as_numbers("1.5") == (1.5, 1.5)
+    assert state.state_value_as_numbers(STATE_ON) == (None, 1)
+    assert state.state_value_as_numbers(LockState.UNLOCKED) == (None, 0)
+    assert state.state_value_as_numbers("foo") == (None, None)
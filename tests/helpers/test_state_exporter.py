@@ -0,0 +1,103 @@
+"""Test the state exporter helper."""
+
+import asyncio
+
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_ON
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entityfilter import FILTER_SCHEMA
+from homeassistant.helpers.state_exporter import (
+    DATA_STATE_EXPORTERS,
+    StateRecord,
+    async_get_state_exporter_stats,
+    async_register_state_exporter,
+)
+
+
+async def test_export_filtered_batches(hass: HomeAssistant) -> None:
+    """Test state changes passing the filter are handed over in batches."""
+    batches: list[list[StateRecord]] = []
+
+    @callback
+    def sink(records: list[StateRecord]) -> None:
+        batches.append(records)
+
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unregister = async_register_state_exporter(
+        hass, "test", sink, lambda entity_id: entity_id.startswith("light.")
+    )
+
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("switch.kitchen", STATE_ON)
+    hass.states.async_set("light.hall", "1.5")
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    first, second = batches[0]
+    assert first.entity_id == "light.kitchen"
+    assert first.old_state is None
+    assert first.new_state.state == STATE_ON
+    assert (first.value, first.number) == (None, 1)
+    assert (second.value, second.number) == (1.5, 1.5)
+
+    hass.states.async_remove("light.hall")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert batches[1][0].new_state is None
+
+    assert async_get_state_exporter_stats(hass)["test"].exported == 3
+    unregister()
+    assert async_get_state_exporter_stats(hass) == {}
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_export_batch_size(hass: HomeAssistant) -> None:
+    """Test a full batch is handed over right away."""
+    sizes: list[int] = []
+
+    @callback
+    def sink(records: list[StateRecord]) -> None:
+        sizes.append(len(records))
+
+    async_register_state_exporter(hass, "test", sink, batch_size=2)
+
+    for i in range(5):
+        hass.states.async_set(f"sensor.test_{i}", i)
+    assert sizes == [2, 2]
+    await hass.async_block_till_done()
+    assert sizes == [2, 2, 1]
+
+
+async def test_export_while_sink_busy(hass: HomeAssistant) -> None:
+    """Test state changes are queued while the sink is busy."""
+    release = asyncio.Event()
+    batches: list[list[str]] = []
+
+    async def sink(records: list[StateRecord]) -> None:
+        batches.append([record.entity_id for record in records])
+        await release.wait()
+
+    async_register_state_exporter(hass, "test", sink, max_queued=2)
+
+    hass.states.async_set("sensor.first", 1)
+    await asyncio.sleep(0)
+    for i in range(3):
+        hass.states.async_set(f"sensor.test_{i}", i)
+    assert batches == [["sensor.first"]]
+    stats = async_get_state_exporter_stats(hass)["test"]
+    assert stats.queued == 2
+    assert stats.dropped == 1
+
+    release.set()
+    await hass.async_block_till_done()
+    assert batches == [["sensor.first"], ["sensor.test_1", "sensor.test_2"]]
+
+
+async def test_export_entity_filter(hass: HomeAssistant) -> None:
+    """Test an entity filter is replaced by its filter function."""
+    entity_filter = FILTER_SCHEMA({"include_domains": ["light"]})
+    async_register_state_exporter(hass, "light", lambda records: None, entity_filter)
+    async_register_state_exporter(hass, "all", lambda records: None, FILTER_SCHEMA({}))
+
+    light, all_states = hass.data[DATA_STATE_EXPORTERS].exporters
+    assert light.entity_filter is entity_filter.get_filter()
+    assert all_states.entity_filter is None
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 import json
 import os
 from typing import Any, NamedTuple
@@ -1180,3 +1181,129 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_store_manager_snapshot(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the store manager restores unchanged stores from the snapshot."""
+    loop = asyncio.get_running_loop()
+    labels = {"data": {"labels": [{"label_id": "one"}]}, "version": 1}
+    areas = {"data": {"areas": [{"id": "kitchen"}]}, "version": 1}
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        tmp_storage.join("core.label_registry").write_binary(json_bytes(labels))
+        tmp_storage.join("core.area_registry").write_binary(json_bytes(areas))
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+    snapshot = config_dir.join(".storage", storage.SNAPSHOT_FILE)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        # Nothing is preloaded without a snapshot
+        assert store_manager.async_fetch("core.label_registry") is None
+        await hass.async_stop(force=True)
+
+    assert await loop.run_in_executor(None, snapshot.check)
+
+    areas["data"]["areas"].append({"id": "garden"})
+    await loop.run_in_executor(
+        None,
+        config_dir.join(".storage", "core.area_registry").write_binary,
+        json_bytes(areas),
+    )
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        assert store_manager.async_fetch("core.label_registry") == (True, labels)
+        # The area registry changed since the snapshot was written
+        assert store_manager.async_fetch("core.area_registry") is None
+        assert "core.area_registry: Snapshot is outdated" in caplog.text
+
+        store = storage.Store(hass, 1, "core.area_registry")
+        assert await store.async_load() == areas["data"]
+        await hass.async_stop(force=True)
+
+    # The snapshot is updated with the changed store
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        assert store_manager.async_fetch("core.area_registry") == (True, areas)
+        await hass.async_stop(force=True)
+
+
+async def test_store_journal(tmpdir: py.path.local) -> None:
+    """Test stores append changed entries to a journal which is replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_config")
+    path = config_dir.join(".storage", MOCK_KEY)
+    journal = config_dir.join(".storage", f"{MOCK_KEY}{storage.JOURNAL_SUFFIX}")
+
+    def _read_journal() -> list[dict[str, Any]]:
+        return [json.loads(line) for line in journal.read_binary().splitlines()]
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_sections={"items": "id"}
+        )
+        await store.async_save(
+            {"items": [{"id": "a", "value": 1}, {"id": "b", "value": 1}], "other": 1}
+        )
+        written = await loop.run_in_executor(None, path.read_binary)
+        journal_id = json.loads(written)["journal_id"]
+        assert await loop.run_in_executor(None, _read_journal) == [
+            {"journal_id": journal_id}
+        ]
+
+        with patch.object(storage, "JOURNAL_MAX_SIZE_RATIO", 10):
+            # Changes outside the journaled sections write the file again
+            await store.async_save(
+                {
+                    "items": [{"id": "a", "value": 1}, {"id": "b", "value": 1}],
+                    "other": 2,
+                }
+            )
+        assert await loop.run_in_executor(None, path.read_binary) != written
+        written = await loop.run_in_executor(None, path.read_binary)
+        journal_id = json.loads(written)["journal_id"]
+
+        await store.async_save(
+            {"items": [{"id": "a", "value": 2}, {"id": "c", "value": 1}], "other": 2}
+        )
+        assert await loop.run_in_executor(None, path.read_binary) == written
+        records = await loop.run_in_executor(None, _read_journal)
+        assert records[0] == {"journal_id": journal_id}
+        assert sorted(records[1:], key=json.dumps) == [
+            {"section": "items", "delete": "b"},
+            {"section": "items", "set": {"id": "a", "value": 2}},
+            {"section": "items", "set": {"id": "c", "value": 1}},
+        ]
+
+        # A record cut short by an unclean shutdown is ignored
+        await loop.run_in_executor(
+            None, partial(journal.write, b'{"section":"it', mode="ab")
+        )
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_sections={"items": "id"}
+        )
+        assert await store.async_load() == {
+            "items": [{"id": "a", "value": 2}, {"id": "c", "value": 1}],
+            "other": 2,
+        }
+
+        # The first save after loading writes the file again
+        await store.async_save({"items": [], "other": 2})
+        written = await loop.run_in_executor(None, path.read_binary)
+        assert json.loads(written)["data"] == {"items": [], "other": 2}
+        assert await loop.run_in_executor(None, _read_journal) == [
+            {"journal_id": json.loads(written)["journal_id"]}
+        ]
+
+        await store.async_remove()
+        assert not await loop.run_in_executor(None, journal.check)
+        await hass.async_stop(force=True)
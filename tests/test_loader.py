@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from datetime import timedelta
 import os
 import pathlib
 import sys
@@ -11,15 +12,22 @@ from unittest.mock import MagicMock, Mock, patch
 from awesomeversion import AwesomeVersion
 import pytest
 
-from homeassistant import loader
+from homeassistant import components, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -249,6 +257,19 @@ async def test_async_get_component(hass: HomeAssistant) -> None:
     assert integration.get_platform("light") == hue_light
 
 
+async def test_import_timings(hass: HomeAssistant) -> None:
+    """Test the time spent importing an integration is recorded."""
+    assert "hue" not in loader.async_get_import_timings(hass)
+
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_component()
+    first = loader.async_get_import_timings(hass)["hue"]
+    assert first > 0
+
+    await integration.async_get_platform("light")
+    assert loader.async_get_import_timings(hass)["hue"] > first
+
+
 async def test_get_integration_exceptions(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "hue")
@@ -2025,3 +2046,62 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests are cached between restarts."""
+    await loader.async_load_manifest_cache(hass)
+    cache = hass.data[loader.DATA_MANIFEST_CACHE]
+
+    integration = await hass.async_add_executor_job(
+        loader.Integration.resolve_from_root, hass, components, "hue"
+    )
+    assert integration is not None
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    assert str(integration.file_path / "manifest.json") in data["manifests"]
+
+    # Restart with the stored cache, which has a removed integration
+    removed_path = str(integration.file_path.parent / "removed" / "manifest.json")
+    data["manifests"][removed_path] = data["manifests"][
+        str(integration.file_path / "manifest.json")
+    ]
+    hass.data[loader.DATA_MANIFEST_CACHE] = cache = loader.ManifestCache(hass)
+    await loader.async_load_manifest_cache(hass)
+    cached_integration = await hass.async_add_executor_job(
+        loader.Integration.resolve_from_root, hass, components, "hue"
+    )
+    assert cached_integration is not None
+    assert cache.hits == 1
+    assert cache.misses == 0
+    assert cached_integration.manifest == integration.manifest
+    assert cached_integration.platforms_exists(["light"]) == ["light"]
+
+    # Only the manifests looked up since the restart are stored again
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert list(data["manifests"]) == [str(integration.file_path / "manifest.json")]
+
+    # The cache is dropped when the version changes
+    data["ha_version"] = "0.0.0"
+    hass.data[loader.DATA_MANIFEST_CACHE] = cache = loader.ManifestCache(hass)
+    await loader.async_load_manifest_cache(hass)
+    await hass.async_add_executor_job(
+        loader.Integration.resolve_from_root, hass, components, "hue"
+    )
+    assert cache.hits == 0
+    assert cache.misses == 1
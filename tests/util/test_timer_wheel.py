@@ -0,0 +1,125 @@
+"""Test Home Assistant timer wheel."""
+
+import asyncio
+from unittest.mock import Mock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.timer_wheel import TimerWheel
+
+
+async def test_fires_in_order_when_due() -> None:
+    """Test timers fire in order once the wheel has advanced past them."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    calls = []
+
+    for delay in (3600 * 30, 0.5, 90, 3700, 5):
+        wheel.async_call_at(now + delay, calls.append, delay)
+    assert wheel.pending == 5
+
+    wheel.async_advance(now + 1)
+    assert calls == [0.5]
+
+    wheel.async_advance(now + 100)
+    assert calls == [0.5, 5, 90]
+
+    wheel.async_advance(now + 3600 * 31)
+    assert calls == [0.5, 5, 90, 3700, 3600 * 30]
+    assert wheel.pending == 0
+
+    stats = wheel.stats
+    assert stats.fired == 5
+    assert stats.max_late > 0
+
+
+async def test_cancel() -> None:
+    """Test cancelled timers do not fire."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    action = Mock()
+
+    handle = wheel.async_call_at(now + 10, action)
+    other = wheel.async_call_at(now + 7200, action)
+    assert wheel.handles() == [handle, other] or wheel.handles() == [other, handle]
+
+    handle.cancel()
+    other.cancel()
+    assert handle.cancelled()
+    assert wheel.pending == 0
+    assert wheel.handles() == []
+
+    wheel.async_advance(now + 10000)
+    assert not action.called
+
+
+async def test_cancel_within_batch() -> None:
+    """Test a timer cancelled by another timer of the same batch does not fire."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    action = Mock()
+
+    second = wheel.async_call_at(now + 2, action)
+    wheel.async_call_at(now + 1, second.cancel)
+
+    wheel.async_advance(now + 5)
+    assert not action.called
+    assert wheel.stats.fired == 1
+
+
+async def test_wakes_up_loop(hass: HomeAssistant) -> None:
+    """Test the wheel arms the event loop for the earliest timer."""
+    wheel = TimerWheel(hass.loop)
+    fired = asyncio.Event()
+
+    wheel.async_call_at(hass.loop.time() + 3600, Mock())
+    wheel.async_call_at(hass.loop.time() + 0.01, fired.set)
+
+    async with asyncio.timeout(1):
+        await fired.wait()
+
+    assert wheel.pending == 1
+    assert wheel.stats.wakeups >= 1
+    wheel.handles()[0].cancel()
+
+
+async def test_callback_exception_is_reported() -> None:
+    """Test an exception raised by a timer is passed to the loop handler."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    handler = Mock()
+    loop.set_exception_handler(handler)
+    action = Mock()
+
+    wheel.async_call_at(now, Mock(side_effect=ValueError))
+    wheel.async_call_at(now, action)
+    try:
+        wheel.async_advance(now)
+    finally:
+        loop.set_exception_handler(None)
+
+    assert isinstance(handler.call_args[0][1]["exception"], ValueError)
+    assert action.called
+
+
+async def test_schedule_due_timer_while_catching_up() -> None:
+    """Test a timer already due scheduled while catching up fires right away."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    now = loop.time()
+    calls = []
+
+    def reschedule() -> None:
+        calls.append("first")
+        wheel.async_call_at(now, calls.append, "past")
+
+    wheel.async_call_at(now + 0.1, reschedule)
+    # The loop was blocked, the wheel catches up several ticks at once
+    wheel.async_advance(now + 3.5)
+
+    assert calls == ["first", "past"]
+    assert wheel.pending == 0
+    assert wheel.handles() == []
@@ -627,3 +627,63 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are not parsed again and tags are still resolved."""
+    config_file = tmp_path / "configuration.yaml"
+    config_file.write_text("http: !secret http\npackages: !include_dir_named pkgs\n")
+    (tmp_path / "secrets.yaml").write_text("http: first\n")
+    (tmp_path / "pkgs").mkdir()
+    (tmp_path / "pkgs" / "one.yaml").write_text("light: []\n")
+    settled = 0
+    for path in (tmp_path / "pkgs", *tmp_path.rglob("*.yaml")):
+        os.utime(path, (settled, settled))
+
+    with patch.object(
+        yaml_loader, "_parse_template", wraps=yaml_loader._parse_template
+    ) as mock_parse:
+        config = yaml.load_yaml(config_file, yaml.Secrets(tmp_path))
+        assert config == {"http": "first", "packages": {"one": {"light": []}}}
+        assert mock_parse.call_count == 3
+
+        config["packages"]["one"]["light"].append("mutated")
+        config = yaml.load_yaml(config_file, yaml.Secrets(tmp_path))
+        assert config == {"http": "first", "packages": {"one": {"light": []}}}
+        assert config["packages"]["one"].__line__ == 1
+        assert mock_parse.call_count == 3
+
+        # Changed and added files are picked up
+        (tmp_path / "secrets.yaml").write_text("http: second\n")
+        (tmp_path / "pkgs" / "two.yaml").write_text("switch: []\n")
+        config = yaml.load_yaml(config_file, yaml.Secrets(tmp_path))
+        assert config == {
+            "http": "second",
+            "packages": {"one": {"light": []}, "two": {"switch": []}},
+        }
+        assert mock_parse.call_count == 5
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_cache_bounded_and_pruned(tmp_path: pathlib.Path) -> None:
+    """Test the cache drops least recently used and removed files."""
+    names = ("one.yaml", "two.yaml", "three.yaml")
+    for name in names:
+        (tmp_path / name).write_text("light: []\n")
+        os.utime(tmp_path / name, (0, 0))
+
+    with (
+        patch.dict(yaml_loader._TEMPLATE_CACHE, clear=True),
+        patch.object(yaml_loader, "_TEMPLATE_CACHE_SIZE", 2),
+    ):
+        for name in ("one.yaml", "two.yaml", "one.yaml", "three.yaml"):
+            yaml.load_yaml(tmp_path / name)
+        assert list(yaml_loader._TEMPLATE_CACHE) == [
+            str(tmp_path / "one.yaml"),
+            str(tmp_path / "three.yaml"),
+        ]
+
+        (tmp_path / "one.yaml").rename(tmp_path / "renamed.yaml")
+        yaml.prune_yaml_cache()
+        assert list(yaml_loader._TEMPLATE_CACHE) == [str(tmp_path / "three.yaml")]